@@ -0,0 +1,97 @@
+# Сериализация больших списков в ответах API: обычный путь FastAPI
+# (повторная проверка по response_model, jsonable_encoder, json.dumps)
+# против SchemaResponse, а также проверка списка поштучно против
+# model_validate_list.
+#
+# Запуск: PYTHONPATH=src python benchmarks/bench_api_serialization.py
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from pisaka.platform.api import BaseSchema, SchemaResponse
+
+ITEMS = 10_000
+REQUESTS = 20
+
+
+class _ItemSchema(BaseSchema):
+    id: UUID
+    name: str
+    is_real_person: bool
+    default_for_users: list[UUID]
+    count_of_articles: int
+
+
+class _ListSchema(BaseSchema):
+    items: list[_ItemSchema]
+
+
+@dataclass
+class _Row:
+    id: UUID
+    name: str
+    is_real_person: bool
+    default_for_users: list[UUID]
+    count_of_articles: int
+
+
+def _measure(title: str, fn: Callable[[], object], repeats: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    elapsed = (time.perf_counter() - started_at) / repeats
+    print(f"{title:<45} {elapsed * 1e3:10.2f} ms")  # noqa: T201
+    return elapsed
+
+
+def main() -> None:
+    rows = [
+        _Row(
+            id=uuid4(),
+            name=f"Author {number}",
+            is_real_person=True,
+            default_for_users=[uuid4()],
+            count_of_articles=number,
+        )
+        for number in range(ITEMS)
+    ]
+
+    print(f"validate {ITEMS} rows")  # noqa: T201
+    before = _measure(
+        "  model_validate per row",
+        lambda: [_ItemSchema.model_validate(row) for row in rows],
+        REQUESTS,
+    )
+    after = _measure(
+        "  model_validate_list",
+        lambda: _ItemSchema.model_validate_list(rows),
+        REQUESTS,
+    )
+    print(f"  speedup: {before / after:.1f}x")  # noqa: T201
+
+    schema = _ListSchema(items=_ItemSchema.model_validate_list(rows))
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get("/default")
+    async def default() -> _ListSchema:
+        return schema
+
+    @app.get("/fast", response_model=_ListSchema)
+    async def fast() -> Response:
+        return SchemaResponse(schema)
+
+    print(f"GET list of {ITEMS} items")  # noqa: T201
+    with TestClient(app) as client:
+        assert client.get("/default").json() == client.get("/fast").json()  # noqa: S101
+        before = _measure("  FastAPI default", lambda: client.get("/default"), REQUESTS)
+        after = _measure("  SchemaResponse", lambda: client.get("/fast"), REQUESTS)
+    print(f"  speedup: {before / after:.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
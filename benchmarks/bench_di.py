@@ -0,0 +1,139 @@
+# Накладные расходы DI на один запрос для каждого эндпоинта внутреннего API:
+# разрешение всех зависимостей обработчика в новом контексте aioinject,
+# как это делают AioInjectMiddleware и inject. Сравниваются привилегии
+# в Scoped (новый объект на каждый запрос) и в Singleton. Отдельно
+# измеряется первый запрос без validate_and_warm_up_container, когда
+# aioinject разбирает аннотации провайдеров на лету.
+#
+# Запуск (нужна инициализированная БД):
+# SETTINGS_FILES_FOR_DYNACONF='["config/pisaka.yaml","config/db.yaml","config/secrets.yaml"]' \
+#     PYTHONPATH=src python benchmarks/bench_di.py
+import asyncio
+import time
+
+import aioinject
+from aioinject.providers import Dependency, DependencyLifetime
+from fastapi import FastAPI
+
+from pisaka.config.internal_api import internal_api_app
+from pisaka.platform.di import (
+    collect_endpoint_dependencies,
+    collect_providers,
+    validate_and_warm_up_container,
+)
+
+REQUESTS = 2_000
+
+
+def _create_app() -> tuple[FastAPI, aioinject.Container]:
+    app = internal_api_app()
+    assert isinstance(app, FastAPI)  # noqa: S101
+    # Контейнер приложения доступен только через его middleware
+    [middleware] = app.user_middleware
+    container = middleware.kwargs["container"]
+    assert isinstance(container, aioinject.Container)  # noqa: S101
+    return app, container
+
+
+async def _resolve(
+    container: aioinject.Container,
+    dependencies: tuple[Dependency[object], ...],
+) -> None:
+    async with container.context() as ctx:
+        for dependency in dependencies:
+            await ctx.resolve(dependency.type_)
+
+
+async def _measure(
+    container: aioinject.Container,
+    dependencies: tuple[Dependency[object], ...],
+) -> float:
+    started_at = time.perf_counter()
+    for _ in range(REQUESTS):
+        await _resolve(container, dependencies)
+    return (time.perf_counter() - started_at) / REQUESTS
+
+
+def _providers(
+    container: aioinject.Container,
+    dependencies: tuple[Dependency[object], ...],
+) -> tuple[aioinject.Provider[object], ...]:
+    return collect_providers(
+        container,
+        [dependency.type_ for dependency in dependencies],
+    )
+
+
+def _as_scoped(
+    container: aioinject.Container,
+    endpoints: dict[str, tuple[Dependency[object], ...]],
+) -> list[aioinject.Scoped[object]]:
+    # Привилегии в том виде, в каком они были зарегистрированы раньше
+    permissions = {
+        provider.type_: provider
+        for dependencies in endpoints.values()
+        for provider in _providers(container, dependencies)
+        if provider.lifetime is DependencyLifetime.singleton
+        and provider.type_.__name__.endswith("Permission")
+    }
+    return [
+        aioinject.Scoped(provider.impl, type_)
+        for type_, provider in permissions.items()
+    ]
+
+
+async def _measure_first_request(
+    endpoint: str,
+    dependencies: tuple[Dependency[object], ...],
+) -> None:
+    # Провайдеры создаются заново вместе с контейнером, поэтому в новом
+    # контейнере aioinject еще не разбирал их аннотации
+    _, container = _create_app()
+    async with container:
+        started_at = time.perf_counter()
+        await _resolve(container, dependencies)
+        cold = time.perf_counter() - started_at
+
+    app, container = _create_app()
+    async with container:
+        await validate_and_warm_up_container(container, app.routes)
+        started_at = time.perf_counter()
+        await _resolve(container, dependencies)
+        warm = time.perf_counter() - started_at
+    print(  # noqa: T201
+        f"first {endpoint}: {cold * 1e3:.2f} ms without warm-up, "
+        f"{warm * 1e3:.2f} ms after validate_and_warm_up_container",
+    )
+
+
+async def main() -> None:
+    app, container = _create_app()
+    async with container:
+        await validate_and_warm_up_container(container, app.routes)
+        endpoints = collect_endpoint_dependencies(app.routes)
+        provider_counts = {
+            endpoint: len(_providers(container, dependencies))
+            for endpoint, dependencies in endpoints.items()
+        }
+        print(  # noqa: T201
+            f"{'endpoint':<45} {'per req':>7} {'scoped':>10} {'singleton':>10}",
+        )
+        for endpoint, dependencies in endpoints.items():
+            with container.override(*_as_scoped(container, endpoints)):
+                before = await _measure(container, dependencies)
+            after = await _measure(container, dependencies)
+            per_request = sum(
+                provider.lifetime is not DependencyLifetime.singleton
+                for provider in _providers(container, dependencies)
+            )
+            print(  # noqa: T201
+                f"{endpoint:<45} {per_request:>7} "
+                f"{before * 1e6:>8.1f}us {after * 1e6:>8.1f}us",
+            )
+
+    endpoint = max(provider_counts, key=provider_counts.__getitem__)
+    await _measure_first_request(endpoint, endpoints[endpoint])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+# Сравнение стоимости аутентификации одного запроса internal API:
+# - полная проверка JWT с разбором PEM ключа на каждом запросе
+# - полная проверка JWT с заранее разобранным ключом из SigningKeyRing
+# - кэш проверенных токенов
+#
+# Запуск: PYTHONPATH=src python benchmarks/bench_jwt_authentication.py
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from pisaka.platform.security.authentication.common import JWTAuthenticationOptions
+from pisaka.platform.security.authentication.internal_api import (
+    AuthenticationResult,
+    _verify_jwt,
+)
+from pisaka.platform.security.authentication.key_ring import SigningKeyRing
+from pisaka.platform.security.authentication.token_cache import VerifiedTokenCache
+
+ITERATIONS = 5_000
+
+
+def _make_options_and_token() -> tuple[JWTAuthenticationOptions, str]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_key = (
+        private_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    options = JWTAuthenticationOptions(
+        public_key=public_key,
+        audience="pisaka-backend",
+        issuer="https://my-sso-instance/realm/our-dudes",
+    )
+    now = datetime.now(tz=UTC)
+    token = jwt.encode(
+        payload={
+            "iss": options.issuer,
+            "sub": str(uuid4()),
+            "exp": (now + timedelta(minutes=30)).timestamp(),
+            "aud": [options.audience],
+            "azp": "pisaka-admin-front",
+            "username": "j.doe",
+            "email": "j.doe@mail.com",
+            "given_name": "John",
+            "family_name": "Doe",
+            "client_roles": {"pisaka-backend": ["journalist", "editor", "chief"]},
+        },
+        key=private_key,
+        algorithm=options.algorithm,
+    )
+    return options, token
+
+
+def _measure(fn: Callable[[], object]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - started_at) / ITERATIONS
+
+
+def main() -> None:
+    options, token = _make_options_and_token()
+    assert options.public_key is not None  # noqa: S101
+    # PyJWT принимает ключ и строкой, но тогда разбирает его на каждом вызове
+    pem_key_ring = SigningKeyRing(keys={}, default_key=options.public_key)
+    key_ring = SigningKeyRing.from_pem(
+        public_key=options.public_key,
+        algorithm=options.algorithm,
+    )
+    cache = VerifiedTokenCache(max_size=options.token_cache_size)
+
+    def with_pem_key() -> object:
+        return _verify_jwt(token=token, jwt_auth_opt=options, key_ring=pem_key_ring)
+
+    def without_cache() -> object:
+        return _verify_jwt(token=token, jwt_auth_opt=options, key_ring=key_ring)
+
+    def with_cache() -> object:
+        cache.use_key_ring_generation(key_ring.generation)
+        key = VerifiedTokenCache.make_key(token)
+        verified = cache.get(key)
+        if not isinstance(verified, AuthenticationResult):
+            verified, expires_at = _verify_jwt(
+                token=token,
+                jwt_auth_opt=options,
+                key_ring=key_ring,
+            )
+            cache.put(key, verified, expires_at=expires_at)
+        return verified
+
+    pem = _measure(with_pem_key)
+    before = _measure(without_cache)
+    after = _measure(with_cache)
+    print(f"raw PEM key:   {pem * 1e6:10.1f} us/request")  # noqa: T201
+    print(f"without cache: {before * 1e6:10.1f} us/request")  # noqa: T201
+    print(f"with cache:    {after * 1e6:10.1f} us/request")  # noqa: T201
+    print(f"speedup:       {before / after:10.1f}x")  # noqa: T201
+    print(f"cache stats:   {cache.stats()}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
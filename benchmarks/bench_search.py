@@ -0,0 +1,140 @@
+# Полнотекстовый поиск по статьям на FTS5: перестроение индекса и запросы
+# по частому слову, редкому слову, префиксу и фразе из нескольких слов.
+#
+# Статьи генерируются из словаря с распределением Ципфа, как в живом тексте:
+# немногие слова встречаются почти везде, а большинство - редко.
+# Количество статей можно передать первым аргументом, по умолчанию 1M.
+#
+# Запуск: PYTHONPATH=src python benchmarks/bench_search.py [articles]
+import asyncio
+import itertools
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from pisaka.app.articles.db import ArticleModel
+from pisaka.app.articles.search import SearchIndex
+from pisaka.platform.db import DBModel
+
+ARTICLES = 1_000_000
+INSERT_BATCH_SIZE = 10_000
+VOCABULARY_SIZE = 50_000
+HEADLINE_WORDS = 8
+CONTENT_WORDS = 120
+QUERY_REPEATS = 20
+LIMIT = 20
+
+_LETTERS = "абвгдежзийклмнопрстуфхцчшщыэюя"
+
+
+def _make_vocabulary(rnd: random.Random) -> list[str]:
+    words: set[str] = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rnd.choices(_LETTERS, k=rnd.randint(3, 10))))
+    return sorted(words, key=lambda _: rnd.random())
+
+
+def _generate_articles(count: int) -> Iterator[list[dict[str, object]]]:
+    rnd = random.Random(0)  # noqa: S311
+    vocabulary = _make_vocabulary(rnd)
+    cum_weights = list(
+        itertools.accumulate(1 / rank for rank in range(1, VOCABULARY_SIZE + 1)),
+    )
+    batch: list[dict[str, object]] = []
+    published_at = datetime.now(UTC)
+    for number in range(count):
+        words = rnd.choices(
+            vocabulary,
+            cum_weights=cum_weights,
+            k=HEADLINE_WORDS + CONTENT_WORDS,
+        )
+        batch.append(
+            {
+                "id": uuid4(),
+                "article_draft_id": uuid4(),
+                "author_id": uuid4(),
+                "headline": " ".join(words[:HEADLINE_WORDS]),
+                "content": " ".join(words[HEADLINE_WORDS:]),
+                "slug": f"article-{number}",
+                "disproof": None,
+                "published_at": published_at,
+            },
+        )
+        if len(batch) == INSERT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _measure(title: str, fn: Callable[[], Awaitable[object]]) -> None:
+    started_at = time.perf_counter()
+    await fn()
+    elapsed = time.perf_counter() - started_at
+    print(f"{title:<45} {elapsed * 1e3:10.1f} ms")  # noqa: T201
+
+
+async def _measure_query(search_index: SearchIndex, title: str, query: str) -> None:
+    hits = await search_index.search_articles(query, LIMIT)
+    started_at = time.perf_counter()
+    for _ in range(QUERY_REPEATS):
+        await search_index.search_articles(query, LIMIT)
+    elapsed = (time.perf_counter() - started_at) / QUERY_REPEATS
+    print(  # noqa: T201
+        f"  {title:<43} {elapsed * 1e3:10.2f} ms  ({len(hits)} hits, q={query!r})",
+    )
+
+
+async def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(tmp_dir) / 'bench.sqlite'}",
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(DBModel.metadata.create_all)
+
+        async def fill() -> None:
+            for batch in _generate_articles(count):
+                async with engine.begin() as connection:
+                    await connection.execute(insert(ArticleModel), batch)
+
+        print(f"{count} articles")  # noqa: T201
+        await _measure("  generate and insert", fill)
+
+        async with AsyncSession(engine) as session:
+            search_index = SearchIndex(session=session)
+
+            async def rebuild() -> None:
+                async with session.begin():
+                    await search_index.rebuild()
+
+            await _measure("  rebuild search index", rebuild)
+
+            vocabulary = _make_vocabulary(random.Random(0))  # noqa: S311
+            # Последнее слово запроса ищется по префиксу, поэтому редкое
+            # слово берется длинным, чтобы префикс не совпал с другими
+            common = vocabulary[0]
+            rare = max(vocabulary[-100:], key=len)
+            print("queries, average of", QUERY_REPEATS)  # noqa: T201
+            await _measure_query(search_index, "common word", common)
+            await _measure_query(search_index, "rare word", rare)
+            await _measure_query(search_index, "prefix", vocabulary[1][:3])
+            await _measure_query(
+                search_index,
+                "several words",
+                " ".join(vocabulary[2:5]),
+            )
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else ARTICLES))
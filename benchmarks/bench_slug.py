@@ -0,0 +1,62 @@
+# Сравнение посимвольной генерации слага с таблицей для str.translate
+# на длинных (10 КБ) и на большом количестве коротких заголовков.
+#
+# Запуск: PYTHONPATH=src python benchmarks/bench_slug.py
+import random
+import time
+from collections.abc import Callable
+
+from pisaka.app.articles.slug import (
+    _slugify_letter_by_letter,
+    is_valid_slug,
+    slugify,
+    slugify_many,
+)
+
+_ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyz0123456789"
+    "абвгдежзийклмнопрстуфхцчшщъыьэюяАБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+    "      ,.!?-"
+)
+
+
+def _make_texts(count: int, length: int) -> list[str]:
+    rnd = random.Random(0)  # noqa: S311
+    return ["".join(rnd.choices(_ALPHABET, k=length)) for _ in range(count)]
+
+
+def _measure(title: str, fn: Callable[[], object]) -> float:
+    started_at = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started_at
+    print(f"{title:<45} {elapsed * 1e3:10.1f} ms")  # noqa: T201
+    return elapsed
+
+
+def main() -> None:
+    long_texts = _make_texts(count=100, length=10_000)
+    print("100 headlines x 10 KB")  # noqa: T201
+    before = _measure(
+        "  letter by letter",
+        lambda: [_slugify_letter_by_letter(text) for text in long_texts],
+    )
+    after = _measure("  slugify", lambda: [slugify(text) for text in long_texts])
+    print(f"  speedup: {before / after:.1f}x")  # noqa: T201
+
+    short_texts = _make_texts(count=1_000_000, length=40)
+    print("1M headlines x 40 chars")  # noqa: T201
+    before = _measure(
+        "  letter by letter",
+        lambda: [_slugify_letter_by_letter(text) for text in short_texts],
+    )
+    _measure("  slugify", lambda: [slugify(text) for text in short_texts])
+    after = _measure("  slugify_many", lambda: slugify_many(short_texts))
+    print(f"  speedup: {before / after:.1f}x")  # noqa: T201
+
+    slugs = slugify_many(short_texts)
+    print("1M slugs validation")  # noqa: T201
+    _measure("  is_valid_slug", lambda: [is_valid_slug(slug) for slug in slugs])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Конкурентные чтения и записи в SQLite через aiosqlite
+# с профилем прагм из pisaka.platform.sqlite и без него.
+#
+# Писатели вставляют авторов короткими транзакциями, читатели в это время
+# выбирают авторов по id. Каждый вариант работает с отдельным временным файлом БД.
+#
+# Запуск: PYTHONPATH=src python benchmarks/bench_sqlite_profile.py
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from pisaka.app.authors import AuthorModel
+from pisaka.platform.db import DBModel
+from pisaka.platform.sqlite import SQLiteProfile, apply_sqlite_profile
+
+DURATION_SEC = 3.0
+WRITERS = 4
+READERS = 8
+PRELOADED_AUTHORS = 1_000
+
+
+async def _write(engine: AsyncEngine, deadline: float) -> int:
+    done = 0
+    while time.perf_counter() < deadline:
+        async with engine.begin() as connection:
+            await connection.execute(
+                insert(AuthorModel).values(
+                    id=uuid4(),
+                    name="Writer",
+                    is_real_person=True,
+                    version=1,
+                ),
+            )
+        done += 1
+    return done
+
+
+async def _read(engine: AsyncEngine, ids: list[UUID], deadline: float) -> int:
+    rnd = random.Random(0)  # noqa: S311
+    done = 0
+    while time.perf_counter() < deadline:
+        async with engine.connect() as connection:
+            await connection.execute(
+                select(AuthorModel.name).where(AuthorModel.id == rnd.choice(ids)),
+            )
+        done += 1
+    return done
+
+
+async def _run(profile: SQLiteProfile | None) -> tuple[float, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(tmp_dir) / 'bench.sqlite'}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=WRITERS + READERS,
+            connect_args={"timeout": 30},
+        )
+        if profile is not None:
+            apply_sqlite_profile(engine.sync_engine, profile)
+
+        ids = [uuid4() for _ in range(PRELOADED_AUTHORS)]
+        async with engine.begin() as connection:
+            await connection.run_sync(DBModel.metadata.create_all)
+            await connection.execute(
+                insert(AuthorModel),
+                [
+                    {"id": id_, "name": "Reader", "is_real_person": True, "version": 1}
+                    for id_ in ids
+                ],
+            )
+
+        deadline = time.perf_counter() + DURATION_SEC
+        results = await asyncio.gather(
+            *(_write(engine, deadline) for _ in range(WRITERS)),
+            *(_read(engine, ids, deadline) for _ in range(READERS)),
+        )
+        await engine.dispose()
+
+    writes = sum(results[:WRITERS])
+    reads = sum(results[WRITERS:])
+    return writes / DURATION_SEC, reads / DURATION_SEC
+
+
+def main() -> None:
+    print(  # noqa: T201
+        f"{WRITERS} writers, {READERS} readers, {DURATION_SEC:.0f} s per variant",
+    )
+    for name, profile in [
+        ("default pragmas", None),
+        ("SQLiteProfile()", SQLiteProfile()),
+    ]:
+        writes_per_sec, reads_per_sec = asyncio.run(_run(profile))
+        print(  # noqa: T201
+            f"{name:<16} writes: {writes_per_sec:>8.0f}/s  reads: {reads_per_sec:>8.0f}/s",
+        )
+
+
+if __name__ == "__main__":
+    main()
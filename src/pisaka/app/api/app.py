@@ -8,6 +8,10 @@ from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from starlette import status
 
+from pisaka.platform.api import SchemaResponse
+from pisaka.platform.db import DBPoolWarmer
+from pisaka.platform.di import validate_and_warm_up_container
+from pisaka.platform.pagination import InvalidCursorError
 from pisaka.platform.security.authorization import AuthorizationError
 
 PublicAPIApp = NewType("PublicAPIApp", FastAPI)
@@ -15,17 +19,23 @@ PublicAPIApp = NewType("PublicAPIApp", FastAPI)
 
 def create_app(container: aioinject.Container) -> PublicAPIApp:
     from pisaka.app import authors
+    from pisaka.app.articles import api as articles_api
 
     @asynccontextmanager
     async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         async with container:
+            await validate_and_warm_up_container(container, app.routes)
+            async with container.context() as ctx:
+                db_pool_warmer = await ctx.resolve(DBPoolWarmer)
+                await db_pool_warmer.warm_up()
             yield
 
-    app = FastAPI(lifespan=lifespan)
+    app = FastAPI(lifespan=lifespan, default_response_class=SchemaResponse)
 
     app.add_middleware(AioInjectMiddleware, container=container)
 
     app.include_router(authors.api.router)
+    app.include_router(articles_api.router)
 
     async def handle_authorization_error(_: Request, exception: Exception) -> Response:
         assert isinstance(exception, AuthorizationError)  # noqa: S101
@@ -36,4 +46,13 @@ def create_app(container: aioinject.Container) -> PublicAPIApp:
 
     app.add_exception_handler(AuthorizationError, handle_authorization_error)
 
+    async def handle_invalid_cursor_error(_: Request, exception: Exception) -> Response:
+        assert isinstance(exception, InvalidCursorError)  # noqa: S101
+        return JSONResponse(
+            content={"reason": "Invalid cursor"},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    app.add_exception_handler(InvalidCursorError, handle_invalid_cursor_error)
+
     return PublicAPIApp(app)
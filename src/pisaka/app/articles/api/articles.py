@@ -1,6 +1,164 @@
-from fastapi import APIRouter
+from datetime import datetime
+from typing import Annotated, Final
+from uuid import UUID
+
+from aioinject import Inject
+from fastapi import APIRouter, HTTPException, Path, Query, Response
+from starlette import status
+
+from pisaka.app.articles.ids import ArticleId
+from pisaka.app.articles.queries import (
+    select_article_by_slug,
+    select_articles_feed_page,
+)
+from pisaka.app.articles.search import ReadOnlySearchIndex
+from pisaka.app.articles.services import ArticlePageCache
+from pisaka.app.authors import AuthorId
+from pisaka.platform.api import BaseSchema
+from pisaka.platform.cache import MISSING
+from pisaka.platform.db import ReadOnlyAsyncSession
+from pisaka.platform.di import inject
+from pisaka.platform.http_caching import set_public_cache
+from pisaka.platform.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 router = APIRouter(
     prefix="/articles",
     tags=["Статьи"],
 )
+
+
+class ArticleSchema(BaseSchema):
+    id: ArticleId
+    author_id: AuthorId
+    headline: str
+    content: str
+    slug: str
+    disproof: str | None
+
+
+class ArticlesFeedSchema(BaseSchema):
+    class Item(BaseSchema):
+        class Author(BaseSchema):
+            id: AuthorId
+            name: str
+
+        headline: str
+        slug: str
+        # None, если автор статьи удален
+        author: Author | None
+
+    articles: list[Item]
+    next_cursor: str | None
+
+
+# Лента одинакова для всех читателей, поэтому ее кэширует CDN. Срок короткий:
+# новые статьи должны появляться в ленте быстро
+FEED_MAX_AGE_SEC: Final[int] = 30
+
+
+class ArticleSearchResultsSchema(BaseSchema):
+    class Hit(BaseSchema):
+        id: ArticleId
+        headline: str
+        snippet: str
+
+    articles: list[Hit]
+
+
+MAX_SEARCH_LIMIT: Final[int] = 50
+
+
+@router.get(path="/", response_model=ArticlesFeedSchema)
+@inject
+async def get_articles_feed(
+    response: Response,
+    session: Annotated[ReadOnlyAsyncSession, Inject],
+    limit: Annotated[int, Query(ge=1, le=100, description="Размер страницы")] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor из предыдущей страницы"),
+    ] = None,
+) -> ArticlesFeedSchema:
+    after = None
+    if cursor is not None:
+        last_published_at, last_id = decode_cursor(cursor, size=2)
+        try:
+            after = (datetime.fromisoformat(last_published_at), UUID(last_id))
+        except ValueError as err:
+            raise InvalidCursorError from err
+    result = await session.execute(
+        select_articles_feed_page(limit=limit + 1, after=after),
+    )
+    rows = result.tuples().all()
+    page = rows[:limit]
+
+    # Last-Modified - время самой свежей статьи на странице. На If-Modified-Since
+    # не отвечаем 304: повторная публикация и переименование автора меняют
+    # ленту, не меняя published_at. Свежесть обеспечивает короткий max-age
+    set_public_cache(
+        response,
+        max_age_sec=FEED_MAX_AGE_SEC,
+        last_modified=page[0][2] if page else None,
+    )
+
+    next_cursor = (
+        encode_cursor(page[-1][2].isoformat(), str(page[-1][3]))
+        if len(rows) > limit
+        else None
+    )
+    return ArticlesFeedSchema(
+        articles=[
+            ArticlesFeedSchema.Item(
+                headline=headline,
+                slug=slug,
+                author=(
+                    ArticlesFeedSchema.Item.Author(id=author_id, name=author_name)
+                    if author_id is not None
+                    else None
+                ),
+            )
+            for headline, slug, _, _, author_id, author_name in page
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+# Объявлен раньше /{slug}, иначе "search" приняли бы за slug статьи
+@router.get(path="/search")
+@inject
+async def search_articles(
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Запрос")],
+    search_index: Annotated[ReadOnlySearchIndex, Inject],
+    limit: Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)] = 20,
+) -> ArticleSearchResultsSchema:
+    hits = await search_index.search_articles(q, limit)
+    return ArticleSearchResultsSchema(
+        articles=ArticleSearchResultsSchema.Hit.model_validate_list(hits),
+    )
+
+
+@router.get(
+    path="/{slug}",
+    response_model=ArticleSchema,
+    responses={404: {"description": "Статья не найдена"}},
+)
+@inject
+async def get_article(
+    slug: Annotated[str, Path(max_length=30, description="Slug статьи")],
+    article_page_cache: Annotated[ArticlePageCache, Inject],
+    session: Annotated[ReadOnlyAsyncSession, Inject],
+) -> Response:
+    # Страницы статей читают чаще всего остального, поэтому ответ берется
+    # из кэша уже сериализованным. В БД идем только при промахе
+    cached = article_page_cache.get(slug)
+    if cached is not MISSING:
+        return Response(content=cached, media_type="application/json")
+
+    result = await session.execute(select_article_by_slug(slug))
+    article = result.scalar_one_or_none()
+    if article is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    payload = ArticleSchema.model_validate(article).model_dump_json().encode()
+    article_page_cache.put(slug, payload)
+    return Response(content=payload, media_type="application/json")
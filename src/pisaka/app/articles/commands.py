@@ -1,15 +1,30 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from uuid import uuid4
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pisaka.app.articles.entities import Article, ArticleDraft
 from pisaka.app.articles.ids import ArticleDraftId, ArticleId
+from pisaka.app.articles.queries import (
+    select_count_of_article_drafts_in_work_by_author,
+    select_count_of_articles_by_author,
+)
 from pisaka.app.articles.repositories import ArticleDraftRepository, ArticleRepository
+from pisaka.app.articles.search import SearchIndex
 from pisaka.app.articles.security import (
     ROLES_ALLOWED_TO_EDIT_ARTICLE_DRAFTS,
     PublishArticlePermission,
 )
-from pisaka.app.authors import DefaultAuthorService
+from pisaka.app.articles.services import ArticlePageCache
+from pisaka.app.authors import (
+    AuthorId,
+    AuthorModel,
+    AuthorStatsService,
+    DefaultAuthorService,
+)
+from pisaka.platform.errors import InvalidStateError
 from pisaka.platform.security.authorization import AuthorizationError
 from pisaka.platform.security.claims import ClaimsIdentity
 from pisaka.platform.security.permissions import (
@@ -18,6 +33,7 @@ from pisaka.platform.security.permissions import (
 )
 from pisaka.platform.security.roles import PisakaRole
 from pisaka.platform.security.utils import get_user_id, has_any_role, has_role
+from pisaka.platform.write_queue import WriteQueue
 
 
 class CreateArticleDraftCommand:
@@ -25,26 +41,38 @@ class CreateArticleDraftCommand:
         self,
         article_draft_repository: ArticleDraftRepository,
         session: AsyncSession,
+        write_queue: WriteQueue,
         default_author_service: DefaultAuthorService,
+        author_stats_service: AuthorStatsService,
+        search_index: SearchIndex,
     ) -> None:
         self._repo = article_draft_repository
         self._session = session
+        self._write_queue = write_queue
         self._default_author_service = default_author_service
+        self._author_stats_service = author_stats_service
+        self._search_index = search_index
 
     async def execute(self, principal: ClaimsIdentity) -> ArticleDraft:
-        await self._authorize(principal=principal)
+        self._authorize(principal=principal)
         user_id = get_user_id(principal)
-        author_id = await self._default_author_service.get(user_id=user_id)
-        async with self._session.begin():
+        async with self._write_queue.begin(self._session):
+            author_id = await self._default_author_service.get(user_id=user_id)
             draft = ArticleDraft.create_from_scratch(
                 id_=ArticleDraftId(uuid4()),
                 author_id=author_id,
                 created_by_user_id=user_id,
             )
-            await self._repo.save(draft)
+            async with self._search_index.updating_draft(draft.id):
+                await self._repo.save(draft)
+            if author_id is not None:
+                await self._author_stats_service.add(
+                    author_id=author_id,
+                    article_drafts_in_work=1,
+                )
             return draft
 
-    async def _authorize(self, principal: ClaimsIdentity) -> None:
+    def _authorize(self, principal: ClaimsIdentity) -> None:
         if has_any_role(principal, ROLES_ALLOWED_TO_EDIT_ARTICLE_DRAFTS):
             return
         raise AuthorizationError
@@ -55,13 +83,17 @@ class UpdateArticleDraftHeadlineCommand:
         self,
         article_draft_repository: ArticleDraftRepository,
         session: AsyncSession,
+        write_queue: WriteQueue,
         almighty_local_cli_permission: AlmightyLocalCliPermission,
         almighty_tests_permission: AlmightyTestsPermission,
+        search_index: SearchIndex,
     ) -> None:
         self._repo = article_draft_repository
         self._session = session
+        self._write_queue = write_queue
         self._almighty_local_cli_permission = almighty_local_cli_permission
         self._almighty_tests_permission = almighty_tests_permission
+        self._search_index = search_index
 
     async def execute(
         self,
@@ -70,22 +102,26 @@ class UpdateArticleDraftHeadlineCommand:
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
     ) -> ArticleDraft:
-        async with self._session.begin():
+        async with self._write_queue.begin(self._session):
+            # Права проверяются без блокировки, чтобы посторонние запросы
+            # не вставали в очередь за редакторами черновика
+            draft = await self._repo.get_for_read(article_draft_id=article_draft_id)
+            self._authorize(principal=principal, agent=agent, draft=draft)
             draft = await self._repo.get(article_draft_id=article_draft_id)
-            await self._authorize(principal=principal, agent=agent, draft=draft)
-            draft.headline = new_headline
-            await self._repo.save(draft)
+            async with self._search_index.updating_draft(draft.id):
+                draft.headline = new_headline
+                await self._repo.save(draft)
             return draft
 
-    async def _authorize(
+    def _authorize(
         self,
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
         draft: ArticleDraft,
     ) -> None:
-        if await self._almighty_local_cli_permission.evaluate(
+        if self._almighty_local_cli_permission.evaluate_sync(
             agent=agent,
-        ) or await self._almighty_tests_permission.evaluate(agent=agent):
+        ) or self._almighty_tests_permission.evaluate_sync(agent=agent):
             return
         if has_role(principal=principal, role=PisakaRole.CHIEF):
             return
@@ -102,17 +138,25 @@ class PublishArticleCommand:
         self,
         article_draft_repository: ArticleDraftRepository,
         article_repository: ArticleRepository,
+        author_stats_service: AuthorStatsService,
+        article_page_cache: ArticlePageCache,
         session: AsyncSession,
+        write_queue: WriteQueue,
         almighty_local_cli_permission: AlmightyLocalCliPermission,
         almighty_tests_permission: AlmightyTestsPermission,
         publish_article_permission: PublishArticlePermission,
+        search_index: SearchIndex,
     ) -> None:
         self._draft_repo = article_draft_repository
         self._article_repo = article_repository
+        self._author_stats_service = author_stats_service
+        self._article_page_cache = article_page_cache
         self._session = session
+        self._write_queue = write_queue
         self._almighty_local_cli_permission = almighty_local_cli_permission
         self._almighty_tests_permission = almighty_tests_permission
         self._publish_article_permission = publish_article_permission
+        self._search_index = search_index
 
     async def execute(
         self,
@@ -120,45 +164,340 @@ class PublishArticleCommand:
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
     ) -> Article:
-        async with self._session.begin():
+        async with self._write_queue.begin(self._session):
+            draft = await self._draft_repo.get_for_read(
+                article_draft_id=article_draft_id,
+            )
+            self._authorize(principal=principal, agent=agent, draft=draft)
             draft = await self._draft_repo.get(article_draft_id=article_draft_id)
 
-            await self._authorize(principal=principal, agent=agent, draft=draft)
-
             valid_draft_or_problems = draft.validate()
             if isinstance(valid_draft_or_problems, ArticleDraft.DraftIsInvalid):
-                raise Exception(  # noqa: TRY002, TRY004
+                raise InvalidStateError(
                     f"Invalid draft: {valid_draft_or_problems.problems}",
                 )
             valid_draft = valid_draft_or_problems
 
-            article = Article.create(
-                id_=ArticleId(uuid4()),
-                author_id=valid_draft.author_id,
-                headline=valid_draft.headline,
-                content=valid_draft.content,
+            # Статья черновика ищется по связи с ним. slug мог поменяться после
+            # публикации, и тогда им может владеть уже другая статья
+            existing_article = await self._article_repo.find_by_draft_for_update(
+                article_draft_id=draft.id,
+            )
+            slug_owner_id = await self._article_repo.find_id_by_slug(
                 slug=valid_draft.slug,
             )
-            await self._article_repo.save(article)
+            if slug_owner_id is not None and (
+                existing_article is None or slug_owner_id != existing_article.id
+            ):
+                raise InvalidStateError(
+                    f"Slug {valid_draft.slug!r} is already taken",
+                )
+            article_id = (
+                existing_article.id
+                if existing_article is not None
+                else ArticleId(uuid4())
+            )
+            async with self._search_index.updating_article(article_id):
+                if existing_article is None:
+                    article = Article.create(
+                        id_=article_id,
+                        article_draft_id=draft.id,
+                        author_id=valid_draft.author_id,
+                        headline=valid_draft.headline,
+                        content=valid_draft.content,
+                        slug=valid_draft.slug,
+                        published_at=datetime.now(UTC),
+                    )
+                    previous_author_id = None
+                    previous_slug = None
+                else:
+                    # Повторная публикация черновика обновляет уже вышедшую
+                    # статью, но не поднимает ее в ленте: published_at остается
+                    article = existing_article
+                    previous_author_id = article.author_id
+                    previous_slug = article.slug
+                    article.republish(
+                        author_id=valid_draft.author_id,
+                        headline=valid_draft.headline,
+                        content=valid_draft.content,
+                        slug=valid_draft.slug,
+                    )
+                await self._article_repo.save(article)
 
-            draft.mark_published()
-            await self._draft_repo.save(draft)
+            if not draft.is_published:
+                draft.mark_published()
+                await self._draft_repo.save(draft)
+                await self._author_stats_service.add(
+                    author_id=article.author_id,
+                    articles=1,
+                    article_drafts_in_work=-1,
+                )
+            elif previous_author_id != article.author_id:
+                # Статья сменила автора или у опубликованного черновика
+                # еще не было статьи
+                if previous_author_id is not None:
+                    await self._author_stats_service.add(
+                        author_id=previous_author_id,
+                        articles=-1,
+                    )
+                await self._author_stats_service.add(
+                    author_id=article.author_id,
+                    articles=1,
+                )
 
-            return article
+        # Сбрасываем кэш только после коммита, иначе параллельный запрос
+        # может успеть закэшировать старую версию статьи
+        self._article_page_cache.invalidate(article.slug)
+        if previous_slug is not None and previous_slug != article.slug:
+            self._article_page_cache.invalidate(previous_slug)
+        return article
 
-    async def _authorize(
+    def _authorize(
         self,
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
         draft: ArticleDraft,
     ) -> None:
-        if await self._almighty_local_cli_permission.evaluate(
+        if self._almighty_local_cli_permission.evaluate_sync(
             agent=agent,
-        ) or await self._almighty_tests_permission.evaluate(agent=agent):
+        ) or self._almighty_tests_permission.evaluate_sync(agent=agent):
             return
-        if self._publish_article_permission.evaluate(
+        if self._publish_article_permission.evaluate_sync(
             principal=principal,
             article_draft=draft,
         ):
             return
         raise AuthorizationError
+
+
+class DisproveArticleCommand:
+    def __init__(
+        self,
+        article_repository: ArticleRepository,
+        article_page_cache: ArticlePageCache,
+        session: AsyncSession,
+        write_queue: WriteQueue,
+        almighty_local_cli_permission: AlmightyLocalCliPermission,
+        almighty_tests_permission: AlmightyTestsPermission,
+    ) -> None:
+        self._repo = article_repository
+        self._article_page_cache = article_page_cache
+        self._session = session
+        self._write_queue = write_queue
+        self._almighty_local_cli_permission = almighty_local_cli_permission
+        self._almighty_tests_permission = almighty_tests_permission
+
+    async def execute(
+        self,
+        article_id: ArticleId,
+        disproof: str,
+        principal: ClaimsIdentity,
+        agent: ClaimsIdentity,
+    ) -> Article:
+        self._authorize(principal=principal, agent=agent)
+        async with self._write_queue.begin(self._session):
+            article = await self._repo.get(article_id=article_id)
+            article.disprove(disproof)
+            await self._repo.save(article)
+        self._article_page_cache.invalidate(article.slug)
+        return article
+
+    def _authorize(self, principal: ClaimsIdentity, agent: ClaimsIdentity) -> None:
+        if self._almighty_local_cli_permission.evaluate_sync(
+            agent=agent,
+        ) or self._almighty_tests_permission.evaluate_sync(agent=agent):
+            return
+        if has_role(principal=principal, role=PisakaRole.CHIEF):
+            return
+        raise AuthorizationError
+
+
+class DeleteArticleDraftCommand:
+    def __init__(
+        self,
+        article_draft_repository: ArticleDraftRepository,
+        author_stats_service: AuthorStatsService,
+        session: AsyncSession,
+        write_queue: WriteQueue,
+        almighty_local_cli_permission: AlmightyLocalCliPermission,
+        almighty_tests_permission: AlmightyTestsPermission,
+        search_index: SearchIndex,
+    ) -> None:
+        self._repo = article_draft_repository
+        self._author_stats_service = author_stats_service
+        self._session = session
+        self._write_queue = write_queue
+        self._almighty_local_cli_permission = almighty_local_cli_permission
+        self._almighty_tests_permission = almighty_tests_permission
+        self._search_index = search_index
+
+    async def execute(
+        self,
+        article_draft_id: ArticleDraftId,
+        principal: ClaimsIdentity,
+        agent: ClaimsIdentity,
+    ) -> None:
+        async with self._write_queue.begin(self._session):
+            draft = await self._repo.get_for_read(article_draft_id=article_draft_id)
+            self._authorize(principal=principal, agent=agent, draft=draft)
+            draft = await self._repo.get(article_draft_id=article_draft_id)
+            # Токены удаляются из индекса по тексту строки, поэтому раньше нее
+            await self._search_index.delete_draft(article_draft_id)
+            await self._repo.delete(article_draft_id=article_draft_id)
+            if draft.author_id is not None and not draft.is_published:
+                await self._author_stats_service.add(
+                    author_id=draft.author_id,
+                    article_drafts_in_work=-1,
+                )
+
+    def _authorize(
+        self,
+        principal: ClaimsIdentity,
+        agent: ClaimsIdentity,
+        draft: ArticleDraft,
+    ) -> None:
+        if self._almighty_local_cli_permission.evaluate_sync(
+            agent=agent,
+        ) or self._almighty_tests_permission.evaluate_sync(agent=agent):
+            return
+        if has_role(principal=principal, role=PisakaRole.CHIEF):
+            return
+        if not has_any_role(principal, ROLES_ALLOWED_TO_EDIT_ARTICLE_DRAFTS):
+            raise AuthorizationError
+        user_id = get_user_id(principal=principal)
+        if draft.is_editor(user_id):
+            return
+        raise AuthorizationError
+
+
+@dataclass(frozen=True, kw_only=True)
+class AuthorStatsMismatch:
+    author_id: AuthorId
+    expected_count_of_articles: int
+    expected_count_of_article_drafts_in_work: int
+    actual_count_of_articles: int | None
+    actual_count_of_article_drafts_in_work: int | None
+
+
+class RebuildAuthorStatsCommand:
+    # Пересчитывает денормализованную статистику авторов с нуля по таблицам
+    # статей и черновиков. Живет в модуле статей, так как модуль авторов
+    # ничего не знает о статьях
+    def __init__(
+        self,
+        author_stats_service: AuthorStatsService,
+        session: AsyncSession,
+        write_queue: WriteQueue,
+        almighty_local_cli_permission: AlmightyLocalCliPermission,
+        almighty_tests_permission: AlmightyTestsPermission,
+    ) -> None:
+        self._author_stats_service = author_stats_service
+        self._session = session
+        self._write_queue = write_queue
+        self._almighty_local_cli_permission = almighty_local_cli_permission
+        self._almighty_tests_permission = almighty_tests_permission
+
+    async def execute(
+        self,
+        *,
+        dry_run: bool,
+        agent: ClaimsIdentity,
+    ) -> list[AuthorStatsMismatch]:
+        self._authorize(agent=agent)
+        async with self._write_queue.begin(self._session):
+            result_1 = await self._session.execute(select(AuthorModel.id))
+            expected: dict[AuthorId, tuple[int, int]] = {
+                author_id: (0, 0) for author_id in result_1.scalars().all()
+            }
+
+            result_2 = await self._session.execute(
+                select_count_of_articles_by_author(),
+            )
+            for author_id, cnt in result_2.tuples().all():
+                if author_id in expected:
+                    expected[author_id] = (cnt, expected[author_id][1])
+
+            result_3 = await self._session.execute(
+                select_count_of_article_drafts_in_work_by_author(),
+            )
+            for draft_author_id, cnt in result_3.tuples().all():
+                if draft_author_id is not None and draft_author_id in expected:
+                    expected[draft_author_id] = (expected[draft_author_id][0], cnt)
+
+            actual = {
+                stats.author_id: (
+                    stats.count_of_articles,
+                    stats.count_of_article_drafts_in_work,
+                )
+                for stats in await self._author_stats_service.get_all()
+            }
+
+            mismatches = []
+            for author_id, (cnt_articles, cnt_drafts) in expected.items():
+                actual_cnt_articles, actual_cnt_drafts = actual.get(
+                    author_id,
+                    (None, None),
+                )
+                if (cnt_articles, cnt_drafts) == (
+                    actual_cnt_articles,
+                    actual_cnt_drafts,
+                ):
+                    continue
+                mismatches.append(
+                    AuthorStatsMismatch(
+                        author_id=author_id,
+                        expected_count_of_articles=cnt_articles,
+                        expected_count_of_article_drafts_in_work=cnt_drafts,
+                        actual_count_of_articles=actual_cnt_articles,
+                        actual_count_of_article_drafts_in_work=actual_cnt_drafts,
+                    ),
+                )
+                if not dry_run:
+                    await self._author_stats_service.set(
+                        author_id=author_id,
+                        count_of_articles=cnt_articles,
+                        count_of_article_drafts_in_work=cnt_drafts,
+                    )
+
+            if not dry_run:
+                for author_id in actual.keys() - expected.keys():
+                    await self._author_stats_service.delete(author_id=author_id)
+
+            return mismatches
+
+    def _authorize(self, agent: ClaimsIdentity) -> None:
+        if self._almighty_local_cli_permission.evaluate_sync(
+            agent=agent,
+        ) or self._almighty_tests_permission.evaluate_sync(agent=agent):
+            return
+        raise AuthorizationError
+
+
+class RebuildSearchIndexCommand:
+    # Перестраивает полнотекстовые индексы статей и черновиков по их таблицам.
+    # Нужна после VACUUM и при включении поиска на уже заполненной БД
+    def __init__(
+        self,
+        search_index: SearchIndex,
+        session: AsyncSession,
+        write_queue: WriteQueue,
+        almighty_local_cli_permission: AlmightyLocalCliPermission,
+        almighty_tests_permission: AlmightyTestsPermission,
+    ) -> None:
+        self._search_index = search_index
+        self._session = session
+        self._write_queue = write_queue
+        self._almighty_local_cli_permission = almighty_local_cli_permission
+        self._almighty_tests_permission = almighty_tests_permission
+
+    async def execute(self, agent: ClaimsIdentity) -> None:
+        self._authorize(agent=agent)
+        async with self._write_queue.begin(self._session):
+            await self._search_index.rebuild()
+
+    def _authorize(self, agent: ClaimsIdentity) -> None:
+        if self._almighty_local_cli_permission.evaluate_sync(
+            agent=agent,
+        ) or self._almighty_tests_permission.evaluate_sync(agent=agent):
+            return
+        raise AuthorizationError
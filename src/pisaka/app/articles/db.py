@@ -1,9 +1,24 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Boolean, ForeignKey, PrimaryKeyConstraint, String, Text, Uuid
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    Uuid,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from pisaka.app.articles.ids import ArticleDraftId, ArticleId
+from pisaka.app.articles.search import (
+    ARTICLE_DRAFTS_FTS,
+    ARTICLES_FTS,
+    listen_fts_ddl,
+)
 from pisaka.app.authors import AuthorId
 from pisaka.platform.db import DBModel
 
@@ -12,11 +27,32 @@ class ArticleModel(DBModel):
     __tablename__ = "articles"
 
     id: Mapped[ArticleId] = mapped_column(Uuid(as_uuid=True), primary_key=True)
-    author_id: Mapped[AuthorId] = mapped_column(Uuid(as_uuid=True))
+    # Черновик, из которого опубликована статья. Повторная публикация находит
+    # статью по нему, а не по slug. Без внешнего ключа: опубликованный черновик
+    # можно удалить, а статья при этом остается
+    article_draft_id: Mapped[ArticleDraftId] = mapped_column(
+        Uuid(as_uuid=True),
+        unique=True,
+        index=True,
+    )
+    author_id: Mapped[AuthorId] = mapped_column(Uuid(as_uuid=True), index=True)
     headline: Mapped[str] = mapped_column(String(length=100))
     content: Mapped[str] = mapped_column(Text)
-    slug: Mapped[str] = mapped_column(String(length=30))
+    # По slug статью открывают читатели, поэтому он уникален и проиндексирован
+    slug: Mapped[str] = mapped_column(String(length=30), unique=True, index=True)
     disproof: Mapped[str | None] = mapped_column(Text)
+    # Время первой публикации в UTC. SQLite хранит его без часового пояса
+    published_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+# Лента листается по (published_at, id) от новых к старым, и с этим индексом
+# каждая страница это range scan. id нужен, чтобы порядок статей с одинаковым
+# временем публикации был однозначным
+Index(
+    "ix_articles_published_at_id",
+    ArticleModel.published_at,
+    ArticleModel.id,
+)
 
 
 class ArticleDraftModel(DBModel):
@@ -34,6 +70,21 @@ class ArticleDraftModel(DBModel):
     )
 
 
+# Черновики в работе считаются и ищутся по автору, а опубликованные черновики
+# копятся и нужны редко. Частичный индекс содержит только неопубликованные,
+# поэтому остается маленьким. Условие индекса должно совпадать с условием
+# в запросах, иначе SQLite его не выберет
+Index(
+    "ix_article_drafts_unpublished_author_id",
+    ArticleDraftModel.author_id,
+    sqlite_where=~ArticleDraftModel.is_published,
+    postgresql_where=~ArticleDraftModel.is_published,
+)
+
+listen_fts_ddl(ArticleModel, ARTICLES_FTS)
+listen_fts_ddl(ArticleDraftModel, ARTICLE_DRAFTS_FTS)
+
+
 class ArticleDraftEditorModel(DBModel):
     __tablename__ = "article_draft_editors"
     __table_args__ = (
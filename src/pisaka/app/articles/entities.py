@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from pisaka.app.articles.db import (
@@ -19,19 +20,23 @@ class Article:
     def create(
         cls,
         id_: ArticleId,
+        article_draft_id: ArticleDraftId,
         author_id: AuthorId,
         headline: str,
         content: str,
         slug: str,
+        published_at: datetime,
     ) -> "Article":
         return cls(
             model=ArticleModel(
                 id=id_,
+                article_draft_id=article_draft_id,
                 author_id=author_id,
                 headline=headline,
                 content=content,
                 slug=slug,
                 disproof=None,
+                published_at=published_at,
             ),
         )
 
@@ -39,6 +44,10 @@ class Article:
     def id(self) -> ArticleId:
         return self._model.id
 
+    @property
+    def article_draft_id(self) -> ArticleDraftId:
+        return self._model.article_draft_id
+
     @property
     def author_id(self) -> AuthorId:
         return self._model.author_id
@@ -59,9 +68,25 @@ class Article:
     def disproof(self) -> str | None:
         return self._model.disproof
 
+    @property
+    def published_at(self) -> datetime:
+        return self._model.published_at
+
     def disprove(self, disproof: str) -> None:
         self._model.disproof = disproof
 
+    def republish(
+        self,
+        author_id: AuthorId,
+        headline: str,
+        content: str,
+        slug: str,
+    ) -> None:
+        self._model.author_id = author_id
+        self._model.headline = headline
+        self._model.content = content
+        self._model.slug = slug
+
 
 class ArticleDraft:
     def __init__(self, model: ArticleDraftModel) -> None:
@@ -0,0 +1,79 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import select
+
+from pisaka.app.articles.db import ArticleDraftEditorModel
+from pisaka.app.articles.ids import ArticleDraftId, ArticleId
+from pisaka.app.articles.queries import (
+    select_article_by_slug,
+    select_article_drafts,
+    select_articles_feed_page,
+    select_count_of_article_drafts_in_work_by_author,
+    select_count_of_articles_by_author,
+)
+from pisaka.app.articles.repositories import (
+    select_article_by_draft_for_update,
+    select_article_draft_for_update,
+    select_article_for_update,
+    select_article_id_by_slug,
+)
+from pisaka.platform.query_plan import HotQuery
+
+# Частые запросы модуля статей для `pisaka dev explain`. Запросы строятся
+# теми же функциями, что и в репозиториях, командах и эндпоинтах, так что
+# проверяется ровно то, что уходит в БД. Значения параметров не важны
+
+_ARTICLE_ID = ArticleId(UUID(int=0))
+_ARTICLE_DRAFT_ID = ArticleDraftId(UUID(int=0))
+
+HOT_QUERIES = [
+    HotQuery(
+        name="Статья по id",
+        statement=select_article_for_update(_ARTICLE_ID),
+    ),
+    HotQuery(
+        name="Статья по slug для публичной страницы",
+        statement=select_article_by_slug("slug"),
+    ),
+    HotQuery(
+        name="Статья черновика для повторной публикации",
+        statement=select_article_by_draft_for_update(_ARTICLE_DRAFT_ID),
+    ),
+    HotQuery(
+        name="Занятость slug при публикации",
+        statement=select_article_id_by_slug("slug"),
+    ),
+    HotQuery(
+        name="Страница ленты статей",
+        statement=select_articles_feed_page(
+            limit=20,
+            after=(datetime.now(UTC), _ARTICLE_ID),
+        ),
+    ),
+    HotQuery(
+        name="Черновик по id",
+        statement=select_article_draft_for_update(_ARTICLE_DRAFT_ID),
+    ),
+    HotQuery(
+        # Этот запрос строит сам SQLAlchemy для selectinload(editors)
+        # в select_article_draft_for_update
+        name="Редакторы черновиков",
+        statement=select(ArticleDraftEditorModel).where(
+            ArticleDraftEditorModel.article_draft_id.in_([_ARTICLE_DRAFT_ID]),
+        ),
+    ),
+    HotQuery(
+        name="Количество статей по авторам",
+        statement=select_count_of_articles_by_author(),
+    ),
+    HotQuery(
+        name="Количество черновиков в работе по авторам",
+        statement=select_count_of_article_drafts_in_work_by_author(),
+    ),
+    HotQuery(
+        name="Список черновиков с авторами в админке",
+        statement=select_article_drafts(),
+        full_scan_allowed=frozenset({"article_drafts"}),
+    ),
+]
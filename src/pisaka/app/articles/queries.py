@@ -0,0 +1,129 @@
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Row, Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import count
+
+from pisaka.app.articles.db import (
+    ArticleDraftEditorModel,
+    ArticleDraftModel,
+    ArticleModel,
+)
+from pisaka.app.articles.ids import ArticleDraftId, ArticleId
+from pisaka.app.authors import AuthorId, AuthorModel
+from pisaka.platform.projections import json_uuid_array, parse_json_uuid_array
+
+# Запросы для списков статей только на чтение, см. pisaka.platform.projections.
+# Текст черновика в списках не нужен и не читается
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ArticleDraftListRow:
+    id: ArticleDraftId
+    is_published: bool
+    author_id: AuthorId | None
+    # None, если у черновика нет автора или автор удален
+    author_name: str | None
+    headline: str
+    editors: list[UUID]
+
+
+# Имя автора на деле может быть NULL из-за LEFT JOIN, но SQLAlchemy
+# выводит тип колонки без учета внешнего соединения
+_ArticleDraftListTuple = tuple[ArticleDraftId, bool, AuthorId | None, str, str, str]
+
+
+def select_article_drafts() -> Select[_ArticleDraftListTuple]:
+    return select(
+        ArticleDraftModel.id,
+        ArticleDraftModel.is_published,
+        ArticleDraftModel.author_id,
+        AuthorModel.name,
+        ArticleDraftModel.headline,
+        json_uuid_array(
+            ArticleDraftEditorModel.user_id,
+            ArticleDraftEditorModel.article_draft_id == ArticleDraftModel.id,
+        ),
+    ).join(AuthorModel, AuthorModel.id == ArticleDraftModel.author_id, isouter=True)
+
+
+async def list_article_drafts(session: AsyncSession) -> list[ArticleDraftListRow]:
+    result = await session.execute(select_article_drafts())
+    return _to_article_draft_list_rows(result.tuples())
+
+
+async def stream_article_drafts(
+    session: AsyncSession,
+    batch_size: int,
+) -> AsyncIterator[list[ArticleDraftListRow]]:
+    # Строки читаются из БД пачками по batch_size, так что память
+    # не зависит от количества черновиков
+    result = await session.stream(
+        select_article_drafts().execution_options(yield_per=batch_size),
+    )
+    # partitions() объявлен как корутина, хотя на деле это асинхронный генератор
+    async for partition in result.tuples().partitions():  # type: ignore[attr-defined]
+        yield _to_article_draft_list_rows(partition)
+
+
+def _to_article_draft_list_rows(
+    rows: Iterable[Row[_ArticleDraftListTuple] | _ArticleDraftListTuple],
+) -> list[ArticleDraftListRow]:
+    return [
+        ArticleDraftListRow(
+            id=id_,
+            is_published=is_published,
+            author_id=author_id,
+            author_name=author_name,
+            headline=headline,
+            editors=parse_json_uuid_array(editors),
+        )
+        for id_, is_published, author_id, author_name, headline, editors in rows
+    ]
+
+
+def select_article_by_slug(slug: str) -> Select[tuple[ArticleModel]]:
+    return select(ArticleModel).where(ArticleModel.slug == slug)
+
+
+def select_articles_feed_page(
+    *,
+    limit: int,
+    after: tuple[datetime, UUID] | None,
+) -> Select[tuple[str, str, datetime, ArticleId, AuthorId, str]]:
+    # Keyset пагинация от новых статей к старым по индексу
+    # ix_articles_published_at_id, без OFFSET. after - (published_at, id)
+    # последней статьи предыдущей страницы. Колонки автора NULL, если автор
+    # удален, это в типе не учтено по той же причине, что и для черновиков
+    query = (
+        select(
+            ArticleModel.headline,
+            ArticleModel.slug,
+            ArticleModel.published_at,
+            ArticleModel.id,
+            AuthorModel.id,
+            AuthorModel.name,
+        )
+        .join(AuthorModel, AuthorModel.id == ArticleModel.author_id, isouter=True)
+        .order_by(ArticleModel.published_at.desc(), ArticleModel.id.desc())
+    )
+    if after is not None:
+        query = query.where(tuple_(ArticleModel.published_at, ArticleModel.id) < after)
+    return query.limit(limit)
+
+
+def select_count_of_articles_by_author() -> Select[tuple[AuthorId, int]]:
+    return select(ArticleModel.author_id, count("*")).group_by(ArticleModel.author_id)
+
+
+def select_count_of_article_drafts_in_work_by_author() -> (
+    Select[tuple[AuthorId | None, int]]
+):
+    return (
+        select(ArticleDraftModel.author_id, count("*"))
+        .where(~ArticleDraftModel.is_published)
+        .group_by(ArticleDraftModel.author_id)
+    )
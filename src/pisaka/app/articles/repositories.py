@@ -1,5 +1,6 @@
-from sqlalchemy import delete, select
+from sqlalchemy import Select, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from pisaka.app.articles.db import ArticleDraftModel, ArticleModel
 from pisaka.app.articles.entities import Article, ArticleDraft
@@ -7,19 +8,81 @@ from pisaka.app.articles.ids import ArticleDraftId, ArticleId
 from pisaka.platform.errors import NotFoundError
 
 
+def select_article_for_update(article_id: ArticleId) -> Select[tuple[ArticleModel]]:
+    return (
+        select(ArticleModel)
+        .where(ArticleModel.id == article_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+def select_article_by_draft_for_update(
+    article_draft_id: ArticleDraftId,
+) -> Select[tuple[ArticleModel]]:
+    return (
+        select(ArticleModel)
+        .where(ArticleModel.article_draft_id == article_draft_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+def select_article_id_by_slug(slug: str) -> Select[tuple[ArticleId]]:
+    return select(ArticleModel.id).where(ArticleModel.slug == slug)
+
+
+def select_article_draft_for_update(
+    article_draft_id: ArticleDraftId,
+) -> Select[tuple[ArticleDraftModel]]:
+    # Для изменения сущности: берет блокировку строки до конца транзакции.
+    # populate_existing нужен, чтобы после блокировки увидеть актуальные
+    # данные, даже если сущность уже была прочитана в этой сессии без блокировки
+    return (
+        select(ArticleDraftModel)
+        .where(ArticleDraftModel.id == article_draft_id)
+        .options(selectinload(ArticleDraftModel.editors))
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
 class ArticleRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def get(self, article_id: ArticleId) -> Article:
-        result = await self._session.execute(
-            select(ArticleModel).where(ArticleModel.id == article_id).with_for_update(),
-        )
+        result = await self._session.execute(select_article_for_update(article_id))
         model: ArticleModel | None = result.scalar_one_or_none()
         if model is None:
             raise NotFoundError(entity_type=Article, key=article_id)
         return Article(model=model)
 
+    async def get_for_read(self, article_id: ArticleId) -> Article:
+        article = await self.find(article_id)
+        if article is None:
+            raise NotFoundError(entity_type=Article, key=article_id)
+        return article
+
+    async def find(self, article_id: ArticleId) -> Article | None:
+        model = await self._session.get(ArticleModel, article_id)
+        return Article(model=model) if model is not None else None
+
+    async def find_by_draft_for_update(
+        self,
+        article_draft_id: ArticleDraftId,
+    ) -> Article | None:
+        result = await self._session.execute(
+            select_article_by_draft_for_update(article_draft_id),
+        )
+        model: ArticleModel | None = result.scalar_one_or_none()
+        return Article(model=model) if model is not None else None
+
+    async def find_id_by_slug(self, slug: str) -> ArticleId | None:
+        result = await self._session.execute(select_article_id_by_slug(slug))
+        article_id: ArticleId | None = result.scalar_one_or_none()
+        return article_id
+
     async def save(self, article: Article) -> None:
         model = article._model  # noqa: SLF001
         self._session.add(model)
@@ -37,15 +100,28 @@ class ArticleDraftRepository:
 
     async def get(self, article_draft_id: ArticleDraftId) -> ArticleDraft:
         result = await self._session.execute(
-            select(ArticleDraftModel)
-            .where(ArticleDraftModel.id == article_draft_id)
-            .with_for_update(),
+            select_article_draft_for_update(article_draft_id),
         )
         model: ArticleDraftModel | None = result.scalar_one_or_none()
         if model is None:
             raise NotFoundError(entity_type=ArticleDraft, key=article_draft_id)
         return ArticleDraft(model=model)
 
+    async def get_for_read(self, article_draft_id: ArticleDraftId) -> ArticleDraft:
+        draft = await self.find(article_draft_id)
+        if draft is None:
+            raise NotFoundError(entity_type=ArticleDraft, key=article_draft_id)
+        return draft
+
+    async def find(self, article_draft_id: ArticleDraftId) -> ArticleDraft | None:
+        # Только для чтения: без блокировки строки
+        model = await self._session.get(
+            ArticleDraftModel,
+            article_draft_id,
+            options=[selectinload(ArticleDraftModel.editors)],
+        )
+        return ArticleDraft(model=model) if model is not None else None
+
     async def save(self, article_draft: ArticleDraft) -> None:
         model = article_draft._model  # noqa: SLF001
         self._session.add(model)
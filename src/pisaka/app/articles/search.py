@@ -0,0 +1,203 @@
+import html
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Final
+
+from sqlalchemy import DDL, Uuid, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.articles.ids import ArticleDraftId, ArticleId
+from pisaka.platform.db import DBModel, ReadOnlyAsyncSession
+
+# Полнотекстовый поиск по статьям и черновикам на SQLite FTS5.
+#
+# Индексы сделаны как external content таблицы: FTS5 хранит только
+# токены, а сам текст берет из articles и article_drafts по rowid. Поэтому
+# индекс не дублирует содержимое статей, но его нужно обновлять вместе
+# с ними. Это делают команды через SearchIndex.updating_*: перед изменением
+# из индекса удаляются токены старой версии строки, после изменения
+# добавляются токены новой.
+#
+# У таблиц с UUID ключом rowid может поменяться после VACUUM, после него
+# индекс нужно перестроить командой `pisaka articles rebuild-search-index`
+
+# Совпадения в заголовке весят больше, чем в тексте
+_HEADLINE_WEIGHT: Final[float] = 10.0
+_CONTENT_WEIGHT: Final[float] = 1.0
+_SNIPPET_TOKENS: Final[int] = 16
+# snippet() не экранирует текст статьи, поэтому найденные слова сначала
+# отмечаются управляющими символами, а в теги превращаются после экранирования
+_MATCH_START: Final[str] = "\x02"
+_MATCH_END: Final[str] = "\x03"
+
+_TERM_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True, kw_only=True)
+class _FTSIndex:
+    name: str
+    content_table: str
+
+    def create_ddl(self) -> str:
+        return (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.name} USING fts5("
+            "headline, content, "
+            f"content='{self.content_table}', content_rowid='rowid', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+
+
+ARTICLES_FTS: Final = _FTSIndex(name="articles_fts", content_table="articles")
+ARTICLE_DRAFTS_FTS: Final = _FTSIndex(
+    name="article_drafts_fts",
+    content_table="article_drafts",
+)
+
+
+def listen_fts_ddl(model: type[DBModel], index: _FTSIndex) -> None:
+    # Индекс создается и удаляется вместе с таблицей, из которой берет текст
+    event.listen(
+        model.__table__,
+        "after_create",
+        DDL(index.create_ddl()).execute_if(dialect="sqlite"),
+    )
+    event.listen(
+        model.__table__,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {index.name}").execute_if(dialect="sqlite"),
+    )
+
+
+def to_match_query(query: str) -> str | None:
+    # Пользовательский ввод не передается в MATCH как есть: кавычки, звездочки
+    # и слова вроде NOT и OR там имеют особый смысл. Каждое слово берется
+    # в кавычки, так что ищутся документы, где есть все слова. Последнее слово
+    # ищется по префиксу, чтобы поиск работал по мере набора
+    terms = _TERM_RE.findall(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms) + "*"
+
+
+def _to_html_snippet(snippet: str) -> str:
+    return html.escape(snippet).replace(_MATCH_START, "<b>").replace(_MATCH_END, "</b>")
+
+
+@dataclass(frozen=True, kw_only=True)
+class SearchHit:
+    id: ArticleId | ArticleDraftId
+    headline: str
+    # Фрагмент текста с найденными словами в <b></b>, остальное экранировано
+    snippet: str
+    # Чем меньше, тем лучше совпадение
+    rank: float
+
+
+class _SearchIndexReader:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def search_articles(self, query: str, limit: int) -> list[SearchHit]:
+        return await self._search(ARTICLES_FTS, query, limit)
+
+    async def search_drafts(self, query: str, limit: int) -> list[SearchHit]:
+        return await self._search(ARTICLE_DRAFTS_FTS, query, limit)
+
+    async def _search(
+        self,
+        index: _FTSIndex,
+        query: str,
+        limit: int,
+    ) -> list[SearchHit]:
+        match_query = to_match_query(query)
+        if match_query is None:
+            return []
+        statement = text(
+            f"SELECT c.id, c.headline, "  # noqa: S608
+            f"snippet({index.name}, 1, :start, :end, '…', {_SNIPPET_TOKENS}), "
+            f"bm25({index.name}, {_HEADLINE_WEIGHT}, {_CONTENT_WEIGHT}) AS rank "
+            f"FROM {index.name} "
+            f"JOIN {index.content_table} AS c ON c.rowid = {index.name}.rowid "
+            f"WHERE {index.name} MATCH :query "
+            "ORDER BY rank LIMIT :limit",
+        ).columns(id=Uuid(as_uuid=True))
+        result = await self._session.execute(
+            statement,
+            {
+                "query": match_query,
+                "limit": limit,
+                "start": _MATCH_START,
+                "end": _MATCH_END,
+            },
+        )
+        return [
+            SearchHit(
+                id=id_,
+                headline=headline,
+                snippet=_to_html_snippet(snippet),
+                rank=rank,
+            )
+            for id_, headline, snippet, rank in result.tuples()
+        ]
+
+
+class SearchIndex(_SearchIndexReader):
+    @asynccontextmanager
+    async def updating_article(self, article_id: ArticleId) -> AsyncIterator[None]:
+        # Изменения статьи нужно делать внутри этого блока, а сущность
+        # читать до него: иначе autoflush запишет новую версию раньше,
+        # чем из индекса будут удалены токены старой
+        await self._delete(ARTICLES_FTS, article_id)
+        yield
+        await self._insert(ARTICLES_FTS, article_id)
+
+    @asynccontextmanager
+    async def updating_draft(
+        self,
+        article_draft_id: ArticleDraftId,
+    ) -> AsyncIterator[None]:
+        await self._delete(ARTICLE_DRAFTS_FTS, article_draft_id)
+        yield
+        await self._insert(ARTICLE_DRAFTS_FTS, article_draft_id)
+
+    async def delete_draft(self, article_draft_id: ArticleDraftId) -> None:
+        await self._delete(ARTICLE_DRAFTS_FTS, article_draft_id)
+
+    async def rebuild(self) -> None:
+        for index in (ARTICLES_FTS, ARTICLE_DRAFTS_FTS):
+            await self._session.execute(text(index.create_ddl()))
+            await self._session.execute(
+                text(
+                    f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')",  # noqa: S608
+                ),
+            )
+
+    async def _delete(self, index: _FTSIndex, id_: ArticleId | ArticleDraftId) -> None:
+        # Для external content индекса удалять нужно ровно те значения,
+        # которые были проиндексированы, поэтому они берутся из самой строки
+        await self._session.execute(
+            text(
+                f"INSERT INTO {index.name}({index.name}, rowid, headline, content) "  # noqa: S608
+                f"SELECT 'delete', rowid, headline, content FROM {index.content_table} "
+                "WHERE id = :id",
+            ),
+            {"id": id_.hex},
+        )
+
+    async def _insert(self, index: _FTSIndex, id_: ArticleId | ArticleDraftId) -> None:
+        await self._session.execute(
+            text(
+                f"INSERT INTO {index.name}(rowid, headline, content) "  # noqa: S608
+                f"SELECT rowid, headline, content FROM {index.content_table} "
+                "WHERE id = :id",
+            ),
+            {"id": id_.hex},
+        )
+
+
+class ReadOnlySearchIndex(_SearchIndexReader):
+    # Только поиск через читающую сессию (реплику, если она настроена)
+    def __init__(self, session: ReadOnlyAsyncSession) -> None:
+        super().__init__(session=session)
@@ -3,15 +3,20 @@ from pisaka.platform.security.claims import ClaimsIdentity
 from pisaka.platform.security.roles import PisakaRole
 from pisaka.platform.security.utils import get_user_id, has_any_role, has_role
 
-ROLES_ALLOWED_TO_EDIT_ARTICLE_DRAFTS = [
-    PisakaRole.JOURNALIST,
-    PisakaRole.EDITOR,
-    PisakaRole.CHIEF,
-]
+ROLES_ALLOWED_TO_EDIT_ARTICLE_DRAFTS = frozenset(
+    [
+        PisakaRole.JOURNALIST,
+        PisakaRole.EDITOR,
+        PisakaRole.CHIEF,
+    ],
+)
 
 
 class ListArticleDraftsPermission:
     async def evaluate(self, principal: ClaimsIdentity) -> bool:
+        return self.evaluate_sync(principal=principal)
+
+    def evaluate_sync(self, principal: ClaimsIdentity) -> bool:
         return has_any_role(
             principal=principal,
             roles=ROLES_ALLOWED_TO_EDIT_ARTICLE_DRAFTS,
@@ -23,6 +28,13 @@ class PublishArticlePermission:
         self,
         principal: ClaimsIdentity,
         article_draft: ArticleDraft,
+    ) -> bool:
+        return self.evaluate_sync(principal=principal, article_draft=article_draft)
+
+    def evaluate_sync(
+        self,
+        principal: ClaimsIdentity,
+        article_draft: ArticleDraft,
     ) -> bool:
         if has_role(principal, PisakaRole.CHIEF):
             return True
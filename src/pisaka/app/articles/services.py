@@ -0,0 +1,8 @@
+from pisaka.platform.cache import TTLCache
+
+
+class ArticlePageCache(TTLCache[str, bytes]):
+    # slug -> готовый JSON статьи для публичного API. Хранится уже
+    # сериализованный ответ, чтобы попадание в кэш не стоило ни запроса в БД,
+    # ни сериализации. Команды сбрасывают запись после коммита изменений
+    pass
@@ -1,3 +1,6 @@
+import re
+from collections.abc import Iterable
+
 numbers = "0123456789"
 english_letters = "abcdefghijklmnopqrstuvwxyz"
 russian_letters = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
@@ -37,7 +40,7 @@ russian_replacements = [
 ]
 
 
-def slugify(text: str) -> str:
+def _slugify_letter_by_letter(text: str) -> str:
     # Простой способ генерации слага для примера.
     # В реальном приложении скорее всего будет отдельный модуль для этого
     slug_letters = []
@@ -51,15 +54,33 @@ def slugify(text: str) -> str:
     return "".join(slug_letters)
 
 
+class _SlugTranslationTable(dict[int, str | None]):
+    # Таблица для str.translate. Заранее заполнена для ASCII и кириллицы,
+    # остальные символы вычисляются при первой встрече и запоминаются.
+    # Символ сначала приводится к нижнему регистру, так что отдельный
+    # вызов lower() для всего текста не нужен
+    def __missing__(self, code_point: int) -> str | None:
+        replacement = _slugify_letter_by_letter(chr(code_point)) or None
+        self[code_point] = replacement
+        return replacement
+
+
+_TRANSLATION_TABLE = _SlugTranslationTable()
+for _code_point in [*range(0x80), *range(0x400, 0x500)]:
+    _TRANSLATION_TABLE[_code_point]
+
+_VALID_SLUG_RE = re.compile(r"[a-z0-9-]+")
+
+
+def slugify(text: str) -> str:
+    return text.translate(_TRANSLATION_TABLE)
+
+
+def slugify_many(texts: Iterable[str]) -> list[str]:
+    translate = str.translate
+    table = _TRANSLATION_TABLE
+    return [translate(text, table) for text in texts]
+
+
 def is_valid_slug(slug: str) -> bool:
-    if not slug:
-        return False
-    for letter in slug:
-        if letter == "-":
-            continue
-        if letter in numbers:
-            continue
-        if letter in english_letters:
-            continue
-        return False
-    return True
+    return _VALID_SLUG_RE.fullmatch(slug) is not None
@@ -2,26 +2,31 @@ from . import api
 from .commands import (
     CreateAuthorCommand,
     DeleteAuthorCommand,
+    ImportAuthorsCommand,
     ResetDefaultAuthorCommand,
     SetDefaultAuthorCommand,
     UpdateAuthorCommand,
 )
 from .entities import Author
 from .ids import AuthorId
-from .models import AuthorModel
-from .repositories import AuthorRepository
-from .services import DefaultAuthorService
+from .models import AuthorModel, AuthorStatsModel
+from .repositories import AuthorRepository, ReadOnlyAuthorRepository
+from .services import AuthorStatsService, DefaultAuthorService
 
 __all__ = [
     "api",
     "AuthorId",
     "AuthorModel",
+    "AuthorStatsModel",
     "Author",
     "AuthorRepository",
+    "ReadOnlyAuthorRepository",
     "CreateAuthorCommand",
     "UpdateAuthorCommand",
     "DeleteAuthorCommand",
+    "ImportAuthorsCommand",
     "DefaultAuthorService",
+    "AuthorStatsService",
     "SetDefaultAuthorCommand",
     "ResetDefaultAuthorCommand",
 ]
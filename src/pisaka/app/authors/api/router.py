@@ -1,14 +1,30 @@
-from typing import Annotated
+from typing import Annotated, Final
 
 from aioinject import Inject
-from aioinject.ext.fastapi import inject
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
 
 from pisaka.app.authors.ids import AuthorId
-from pisaka.app.authors.models import AuthorModel
+from pisaka.app.authors.models import AUTHORS_COLLECTION_NAME, AuthorModel
+from pisaka.app.authors.repositories import ReadOnlyAuthorRepository
+from pisaka.app.authors.snapshots import (
+    DEFAULT_AUTHORS_PAGE_SIZE,
+    AuthorSchema,
+    AuthorsListSchema,
+    AuthorsListSnapshotService,
+)
 from pisaka.platform.api import BaseSchema
+from pisaka.platform.db import ReadOnlyAsyncSession
+from pisaka.platform.di import inject
+from pisaka.platform.http_caching import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_etag,
+)
+from pisaka.platform.response_snapshots import IDENTITY, choose_encoding
+from pisaka.platform.versions import get_collection_version
 
 router = APIRouter(
     prefix="/authors",
@@ -16,35 +32,115 @@ router = APIRouter(
 )
 
 
-class AuthorSchema(BaseSchema):
-    id: AuthorId
-    name: str
+class AuthorsByIdsSchema(BaseSchema):
+    authors: list[AuthorSchema]
+    missing_ids: list[AuthorId]
 
 
-class AuthorsListSchema(BaseSchema):
-    authors: list[AuthorSchema]
+MAX_AUTHORS_BY_IDS: Final[int] = 100
 
 
-@router.get(path="/")
+# Клиенты постоянно опрашивают эти ресурсы, а данные меняются редко.
+# Поэтому сначала дешево проверяем версию и при совпадении с If-None-Match
+# отвечаем 304, не читая и не сериализуя сами данные
+
+
+@router.get(path="/", response_model=AuthorsListSchema)
 @inject
 async def get_authors_list(
-    session: Annotated[AsyncSession, Inject],
-) -> AuthorsListSchema:
-    result = await session.execute(select(AuthorModel))
-    return AuthorsListSchema(
+    request: Request,
+    session: Annotated[ReadOnlyAsyncSession, Inject],
+    authors_list_snapshot_service: Annotated[AuthorsListSnapshotService, Inject],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=1000, description="Размер страницы"),
+    ] = DEFAULT_AUTHORS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor из предыдущей страницы"),
+    ] = None,
+) -> Response:
+    # Страница отдается готовыми байтами из снимка, в нужной клиенту кодировке.
+    # Ответ не проходит через валидацию и сериализацию FastAPI
+    version = await get_collection_version(session, AUTHORS_COLLECTION_NAME)
+    encoding = choose_encoding(request)
+    # У сжатых вариантов свой ETag: это разные представления ответа
+    etag = make_etag(version) if encoding == IDENTITY else make_etag(version, encoding)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    snapshot = await authors_list_snapshot_service.get(
+        session,
+        version=version,
+        limit=limit,
+        cursor=cursor,
+    )
+    response = Response(
+        content=snapshot.bodies[encoding],
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
+    if encoding != IDENTITY:
+        response.headers["Content-Encoding"] = encoding
+    set_etag(response, etag)
+    return response
+
+
+@router.get(path="/by-ids", response_model=AuthorsByIdsSchema)
+@inject
+async def get_authors_by_ids(
+    request: Request,
+    response: Response,
+    ids: Annotated[
+        list[AuthorId],
+        Query(min_length=1, max_length=MAX_AUTHORS_BY_IDS, description="ID авторов"),
+    ],
+    session: Annotated[ReadOnlyAsyncSession, Inject],
+    author_repository: Annotated[ReadOnlyAuthorRepository, Inject],
+) -> AuthorsByIdsSchema | Response:
+    # Подписи к статьям собираются одним запросом вместо запроса на каждого
+    # автора. Авторы идут в порядке ids, ненайденные id перечислены отдельно
+    etag = make_etag(await get_collection_version(session, AUTHORS_COLLECTION_NAME))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_etag(response, etag)
+
+    authors = await author_repository.find_many(ids)
+    return AuthorsByIdsSchema(
         authors=[
-            AuthorSchema.model_validate(author) for author in result.scalars().all()
+            AuthorSchema(id=author.id, name=author.name)
+            for author in authors
+            if author is not None
+        ],
+        missing_ids=[
+            author_id
+            for author_id, author in zip(ids, authors, strict=True)
+            if author is None
         ],
     )
 
 
-@router.get(path="/{author_id}")
+@router.get(path="/{author_id}", response_model=AuthorSchema)
 @inject
 async def get_author(
+    request: Request,
+    response: Response,
     author_id: Annotated[AuthorId, Path(description="ID автора")],
-    session: Annotated[AsyncSession, Inject],
-) -> AuthorSchema:
+    session: Annotated[ReadOnlyAsyncSession, Inject],
+) -> AuthorSchema | Response:
+    # Версия и данные читаются одним запросом, чтобы ETag всегда
+    # соответствовал телу ответа
     result = await session.execute(
-        select(AuthorModel).where(AuthorModel.id == author_id),
+        select(AuthorModel.id, AuthorModel.name, AuthorModel.version).where(
+            AuthorModel.id == author_id,
+        ),
     )
-    return AuthorSchema.model_validate(result.scalar_one())
+    row = result.tuples().one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    id_, name, version = row
+    etag = make_etag(version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_etag(response, etag)
+    return AuthorSchema(id=id_, name=name)
@@ -1,38 +1,59 @@
+from collections.abc import Sequence
+from typing import cast
 from uuid import UUID, uuid4
 
+from sqlalchemy import Table, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pisaka.app.authors.entities import Author
 from pisaka.app.authors.ids import AuthorId
+from pisaka.app.authors.importing import AuthorImportRow
+from pisaka.app.authors.models import (
+    AUTHORS_COLLECTION_NAME,
+    AuthorModel,
+    AuthorStatsModel,
+)
 from pisaka.app.authors.repositories import AuthorRepository
 from pisaka.app.authors.security import EditAuthorsPermission
-from pisaka.app.authors.services import DefaultAuthorService
+from pisaka.app.authors.services import AuthorStatsService, DefaultAuthorService
+from pisaka.app.authors.snapshots import AuthorsListSnapshotService
 from pisaka.platform.security.authorization import AuthorizationError
 from pisaka.platform.security.claims import (
     AGENT_NAME_LOCAL_CLI,
     AGENT_NAME_TESTS,
     AgentNameClaim,
     ClaimsIdentity,
-    PisakaRoleClaim,
 )
 from pisaka.platform.security.permissions import (
     AlmightyLocalCliPermission,
     AlmightyTestsPermission,
 )
 from pisaka.platform.security.roles import PisakaRole
+from pisaka.platform.security.utils import has_role
+from pisaka.platform.versions import CollectionVersionService
+from pisaka.platform.write_queue import WriteQueue
 
 
 class CreateAuthorCommand:
     def __init__(
         self,
         author_repository: AuthorRepository,
+        author_stats_service: AuthorStatsService,
+        collection_version_service: CollectionVersionService,
+        authors_list_snapshot_service: AuthorsListSnapshotService,
         session: AsyncSession,
+        write_queue: WriteQueue,
         edit_authors_permission: EditAuthorsPermission,
         almighty_local_cli_permission: AlmightyLocalCliPermission,
         almighty_tests_permission: AlmightyTestsPermission,
     ) -> None:
         self._author_repository = author_repository
+        self._author_stats_service = author_stats_service
+        self._collection_version_service = collection_version_service
+        self._authors_list_snapshot_service = authors_list_snapshot_service
         self._session = session
+        self._write_queue = write_queue
         self._edit_authors_permission = edit_authors_permission
         self._almighty_local_cli_permission = almighty_local_cli_permission
         self._almighty_tests_permission = almighty_tests_permission
@@ -45,38 +66,130 @@ class CreateAuthorCommand:
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
     ) -> Author:
-        await self._authorize(principal=principal, agent=agent)
-        async with self._session.begin():
+        self._authorize(principal=principal, agent=agent)
+        async with self._write_queue.begin(self._session):
             author = Author.create(
                 id_=AuthorId(uuid4()),
                 name=name,
                 is_real_person=is_real_person,
             )
             await self._author_repository.save(author)
-            return author
+            await self._author_stats_service.create(author_id=author.id)
+            await self._collection_version_service.bump(AUTHORS_COLLECTION_NAME)
+        self._authors_list_snapshot_service.schedule_rebuild()
+        return author
 
-    async def _authorize(
+    def _authorize(
         self,
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
     ) -> None:
         if (
-            await self._almighty_local_cli_permission.evaluate(agent=agent)
-            or await self._almighty_tests_permission.evaluate(agent=agent)
-            or await self._edit_authors_permission.evaluate(principal=principal)
+            self._almighty_local_cli_permission.evaluate_sync(agent=agent)
+            or self._almighty_tests_permission.evaluate_sync(agent=agent)
+            or self._edit_authors_permission.evaluate_sync(principal=principal)
         ):
             return
         raise AuthorizationError
 
 
+class ImportAuthorsCommand:
+    # Массовый импорт: одна пачка строк вставляется одним executemany в одной
+    # транзакции, без создания сущностей и flush на каждого автора
+    def __init__(
+        self,
+        collection_version_service: CollectionVersionService,
+        authors_list_snapshot_service: AuthorsListSnapshotService,
+        session: AsyncSession,
+        write_queue: WriteQueue,
+        almighty_local_cli_permission: AlmightyLocalCliPermission,
+        almighty_tests_permission: AlmightyTestsPermission,
+    ) -> None:
+        self._collection_version_service = collection_version_service
+        self._authors_list_snapshot_service = authors_list_snapshot_service
+        self._session = session
+        self._write_queue = write_queue
+        self._almighty_local_cli_permission = almighty_local_cli_permission
+        self._almighty_tests_permission = almighty_tests_permission
+
+    async def execute(
+        self,
+        rows: Sequence[AuthorImportRow],
+        *,
+        agent: ClaimsIdentity,
+    ) -> list[tuple[int, str]]:
+        # Возвращает индексы отклоненных строк пачки вместе с причиной
+        self._authorize(agent=agent)
+        try:
+            await self._insert(rows)
+        except IntegrityError:
+            # Какая-то строка пачки конфликтует с уже существующим автором.
+            # Это редкий случай, поэтому просто повторяем пачку по одной строке
+            pass
+        else:
+            return []
+
+        rejected = []
+        for index, row in enumerate(rows):
+            try:
+                await self._insert([row])
+            except IntegrityError as err:
+                rejected.append((index, str(err.orig)))
+        return rejected
+
+    async def _insert(self, rows: Sequence[AuthorImportRow]) -> None:
+        ids = [row.id or AuthorId(uuid4()) for row in rows]
+        async with self._write_queue.begin(self._session):
+            # Вставка через таблицы, а не ORM модели: ORM bulk insert заметно
+            # медленнее на сотнях тысяч строк
+            await self._session.execute(
+                insert(cast(Table, AuthorModel.__table__)),
+                [
+                    {
+                        "id": id_,
+                        "name": row.name,
+                        "is_real_person": row.is_real_person,
+                        "version": 1,
+                    }
+                    for id_, row in zip(ids, rows, strict=True)
+                ],
+            )
+            await self._session.execute(
+                insert(cast(Table, AuthorStatsModel.__table__)),
+                [
+                    {
+                        "author_id": id_,
+                        "count_of_articles": 0,
+                        "count_of_article_drafts_in_work": 0,
+                    }
+                    for id_ in ids
+                ],
+            )
+            await self._collection_version_service.bump(AUTHORS_COLLECTION_NAME)
+        self._authors_list_snapshot_service.schedule_rebuild()
+
+    def _authorize(self, agent: ClaimsIdentity) -> None:
+        if self._almighty_local_cli_permission.evaluate_sync(
+            agent=agent,
+        ) or self._almighty_tests_permission.evaluate_sync(agent=agent):
+            return
+        raise AuthorizationError
+
+
 class UpdateAuthorCommand:
     def __init__(
         self,
         author_repository: AuthorRepository,
+        collection_version_service: CollectionVersionService,
+        authors_list_snapshot_service: AuthorsListSnapshotService,
         session: AsyncSession,
+        write_queue: WriteQueue,
     ) -> None:
         self._author_repository = author_repository
+        self._collection_version_service = collection_version_service
+        self._authors_list_snapshot_service = authors_list_snapshot_service
         self._session = session
+        self._write_queue = write_queue
 
     async def execute(
         self,
@@ -86,14 +199,16 @@ class UpdateAuthorCommand:
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
     ) -> Author:
-        await self._authorize(principal=principal, agent=agent)
-        async with self._session.begin():
+        self._authorize(principal=principal, agent=agent)
+        async with self._write_queue.begin(self._session):
             author = await self._author_repository.get(author_id)
             author.set_name(new_name)
             await self._author_repository.save(author)
-            return author
+            await self._collection_version_service.bump(AUTHORS_COLLECTION_NAME)
+        self._authors_list_snapshot_service.schedule_rebuild()
+        return author
 
-    async def _authorize(
+    def _authorize(
         self,
         principal: ClaimsIdentity,
         agent: ClaimsIdentity,
@@ -105,8 +220,7 @@ class UpdateAuthorCommand:
         ):
             return
 
-        role_claims = principal.find_all(PisakaRoleClaim)
-        if any(role_claim.role == PisakaRole.CHIEF for role_claim in role_claims):
+        if has_role(principal, PisakaRole.CHIEF):
             return
 
         raise AuthorizationError
@@ -116,14 +230,25 @@ class DeleteAuthorCommand:
     def __init__(
         self,
         author_repository: AuthorRepository,
+        author_stats_service: AuthorStatsService,
+        collection_version_service: CollectionVersionService,
+        authors_list_snapshot_service: AuthorsListSnapshotService,
         session: AsyncSession,
+        write_queue: WriteQueue,
     ) -> None:
         self._author_repository = author_repository
+        self._author_stats_service = author_stats_service
+        self._collection_version_service = collection_version_service
+        self._authors_list_snapshot_service = authors_list_snapshot_service
         self._session = session
+        self._write_queue = write_queue
 
     async def execute(self, author_id: AuthorId) -> None:
-        async with self._session.begin():
+        async with self._write_queue.begin(self._session):
             await self._author_repository.delete(author_id=author_id)
+            await self._author_stats_service.delete(author_id=author_id)
+            await self._collection_version_service.bump(AUTHORS_COLLECTION_NAME)
+        self._authors_list_snapshot_service.schedule_rebuild()
 
 
 class SetDefaultAuthorCommand:
@@ -131,13 +256,18 @@ class SetDefaultAuthorCommand:
         self,
         default_author_service: DefaultAuthorService,
         session: AsyncSession,
+        write_queue: WriteQueue,
     ) -> None:
         self._default_author_service = default_author_service
         self._session = session
+        self._write_queue = write_queue
 
     async def execute(self, user_id: UUID, author_id: AuthorId) -> None:
-        async with self._session.begin():
+        async with self._write_queue.begin(self._session):
             await self._default_author_service.set(user_id=user_id, author_id=author_id)
+        # Сбрасываем кэш только после коммита, иначе параллельный запрос
+        # может успеть закэшировать старое значение
+        self._default_author_service.invalidate_cache(user_id=user_id)
 
 
 class ResetDefaultAuthorCommand:
@@ -145,10 +275,13 @@ class ResetDefaultAuthorCommand:
         self,
         default_author_service: DefaultAuthorService,
         session: AsyncSession,
+        write_queue: WriteQueue,
     ) -> None:
         self._default_author_service = default_author_service
         self._session = session
+        self._write_queue = write_queue
 
     async def execute(self, user_id: UUID) -> None:
-        async with self._session.begin():
+        async with self._write_queue.begin(self._session):
             await self._default_author_service.reset(user_id=user_id)
+        self._default_author_service.invalidate_cache(user_id=user_id)
@@ -0,0 +1,62 @@
+from uuid import UUID
+
+from pisaka.app.authors.ids import AuthorId
+from pisaka.app.authors.models import AUTHORS_COLLECTION_NAME
+from pisaka.app.authors.queries import (
+    select_authors_list_page,
+    select_authors_with_stats,
+)
+from pisaka.app.authors.repositories import (
+    select_author_for_update,
+    select_authors_by_ids,
+)
+from pisaka.app.authors.services import (
+    delete_author_stats,
+    select_author_stats_for_update,
+    select_default_author_id,
+)
+from pisaka.platform.query_plan import HotQuery
+from pisaka.platform.versions import select_collection_version
+
+# Частые запросы модуля авторов для `pisaka dev explain`. Запросы строятся
+# теми же функциями, что и в репозиториях, сервисах и эндпоинтах, так что
+# проверяется ровно то, что уходит в БД. Значения параметров не важны
+
+_AUTHOR_ID = AuthorId(UUID(int=0))
+_USER_ID = UUID(int=0)
+
+HOT_QUERIES = [
+    HotQuery(
+        name="Автор по id",
+        statement=select_author_for_update(_AUTHOR_ID),
+    ),
+    HotQuery(
+        name="Авторы по списку id",
+        statement=select_authors_by_ids([_AUTHOR_ID]),
+    ),
+    HotQuery(
+        name="Страница публичного списка авторов",
+        statement=select_authors_list_page(limit=100, after=_AUTHOR_ID),
+    ),
+    HotQuery(
+        name="Версия коллекции для ETag",
+        statement=select_collection_version(AUTHORS_COLLECTION_NAME),
+    ),
+    HotQuery(
+        name="Автор по умолчанию для пользователя",
+        statement=select_default_author_id(_USER_ID),
+    ),
+    HotQuery(
+        name="Статистика автора",
+        statement=select_author_stats_for_update(_AUTHOR_ID),
+    ),
+    HotQuery(
+        name="Удаление статистики автора",
+        statement=delete_author_stats(_AUTHOR_ID),
+    ),
+    HotQuery(
+        name="Список авторов со статистикой в админке",
+        statement=select_authors_with_stats(),
+        full_scan_allowed=frozenset({"authors"}),
+    ),
+]
@@ -0,0 +1,91 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, StringConstraints, ValidationError
+
+from pisaka.app.authors.ids import AuthorId
+
+# Чтение авторов для массового импорта из CSV или NDJSON. Файл читается
+# построчно, так что память не зависит от его размера. Строки, которые
+# не прошли валидацию, не прерывают импорт, а возвращаются как RejectedRow
+
+ImportFormat = Literal["csv", "ndjson"]
+
+
+class AuthorImportRow(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    id: AuthorId | None = None
+    name: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=30),
+    ]
+    is_real_person: bool = True
+
+
+@dataclass(frozen=True, kw_only=True)
+class RejectedRow:
+    line: int
+    reason: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class ParsedRow:
+    line: int
+    row: AuthorImportRow
+
+
+def resolve_import_format(file_name: str, import_format: str | None) -> ImportFormat:
+    if import_format is None:
+        return "csv" if file_name.lower().endswith(".csv") else "ndjson"
+    if import_format == "csv":
+        return "csv"
+    if import_format == "ndjson":
+        return "ndjson"
+    raise ValueError(f"Unknown import format: {import_format}")
+
+
+def read_authors(
+    lines: Iterable[str],
+    import_format: ImportFormat,
+) -> Iterator[ParsedRow | RejectedRow]:
+    if import_format == "csv":
+        return _read_csv(lines)
+    return _read_ndjson(lines)
+
+
+def _read_csv(lines: Iterable[str]) -> Iterator[ParsedRow | RejectedRow]:
+    reader = csv.DictReader(lines)
+    for record in reader:
+        # Пустые ячейки считаем отсутствующими, чтобы работали значения
+        # по умолчанию, например для необязательного id
+        yield _validate(
+            line=reader.line_num,
+            record={key: value for key, value in record.items() if value != ""},
+        )
+
+
+def _read_ndjson(lines: Iterable[str]) -> Iterator[ParsedRow | RejectedRow]:
+    for line_num, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as err:
+            yield RejectedRow(line=line_num, reason=f"Invalid JSON: {err}")
+            continue
+        yield _validate(line=line_num, record=record)
+
+
+def _validate(line: int, record: Any) -> ParsedRow | RejectedRow:  # noqa: ANN401
+    try:
+        return ParsedRow(line=line, row=AuthorImportRow.model_validate(record))
+    except ValidationError as err:
+        reason = "; ".join(
+            f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}"
+            for error in err.errors()
+        )
+        return RejectedRow(line=line, reason=reason)
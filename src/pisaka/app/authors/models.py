@@ -1,11 +1,14 @@
+from typing import Final
 from uuid import UUID
 
-from sqlalchemy import Boolean, String, Uuid
+from sqlalchemy import Boolean, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from pisaka.app.authors.ids import AuthorId
 from pisaka.platform.db import DBModel
 
+AUTHORS_COLLECTION_NAME: Final[str] = "authors"
+
 
 class AuthorModel(DBModel):
     __tablename__ = "authors"
@@ -13,10 +16,26 @@ class AuthorModel(DBModel):
     id: Mapped[AuthorId] = mapped_column(Uuid(as_uuid=True), primary_key=True)
     name: Mapped[str] = mapped_column(String(length=30))
     is_real_person: Mapped[bool] = mapped_column(Boolean)
+    # Увеличивается SQLAlchemy при каждом UPDATE строки, используется как ETag
+    version: Mapped[int] = mapped_column(Integer)
+
+    __mapper_args__ = {"version_id_col": version}
 
 
 class DefaultAuthorModel(DBModel):
     __tablename__ = "default_author"
 
     user_id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True)
-    author_id: Mapped[AuthorId] = mapped_column(Uuid(as_uuid=True))
+    author_id: Mapped[AuthorId] = mapped_column(Uuid(as_uuid=True), index=True)
+
+
+class AuthorStatsModel(DBModel):
+    # Денормализованные счетчики, чтобы список авторов в админке не считал
+    # GROUP BY по всем статьям и черновикам. Обновляются командами в той же
+    # транзакции, что и сами изменения. Пересчитать с нуля можно командой
+    # `pisaka authors rebuild-stats`
+    __tablename__ = "author_stats"
+
+    author_id: Mapped[AuthorId] = mapped_column(Uuid(as_uuid=True), primary_key=True)
+    count_of_articles: Mapped[int] = mapped_column(Integer)
+    count_of_article_drafts_in_work: Mapped[int] = mapped_column(Integer)
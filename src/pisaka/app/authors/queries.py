@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.authors.ids import AuthorId
+from pisaka.app.authors.models import (
+    AuthorModel,
+    AuthorStatsModel,
+    DefaultAuthorModel,
+)
+from pisaka.platform.projections import json_uuid_array, parse_json_uuid_array
+
+# Запросы для списков авторов только на чтение, см. pisaka.platform.projections
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AuthorListRow:
+    id: AuthorId
+    name: str
+    is_real_person: bool
+    default_for_users: list[UUID]
+    count_of_articles: int
+    count_of_article_drafts_in_work: int
+
+
+def select_authors_with_stats() -> Select[tuple[AuthorId, str, bool, str, int, int]]:
+    return select(
+        AuthorModel.id,
+        AuthorModel.name,
+        AuthorModel.is_real_person,
+        json_uuid_array(
+            DefaultAuthorModel.user_id,
+            DefaultAuthorModel.author_id == AuthorModel.id,
+        ),
+        func.coalesce(AuthorStatsModel.count_of_articles, 0),
+        func.coalesce(AuthorStatsModel.count_of_article_drafts_in_work, 0),
+    ).join(
+        AuthorStatsModel,
+        AuthorStatsModel.author_id == AuthorModel.id,
+        isouter=True,
+    )
+
+
+async def list_authors_with_stats(session: AsyncSession) -> list[AuthorListRow]:
+    result = await session.execute(select_authors_with_stats())
+    return [
+        AuthorListRow(
+            id=id_,
+            name=name,
+            is_real_person=is_real_person,
+            default_for_users=parse_json_uuid_array(default_for_users),
+            count_of_articles=count_of_articles,
+            count_of_article_drafts_in_work=count_of_article_drafts_in_work,
+        )
+        for (
+            id_,
+            name,
+            is_real_person,
+            default_for_users,
+            count_of_articles,
+            count_of_article_drafts_in_work,
+        ) in result.tuples()
+    ]
+
+
+def select_authors_list_page(
+    *,
+    limit: int,
+    after: UUID | None,
+) -> Select[tuple[AuthorId, str]]:
+    # Keyset пагинация по id: каждая страница это range scan по первичному
+    # ключу, и ее стоимость не зависит от того, насколько далеко мы пролистали
+    query = select(AuthorModel.id, AuthorModel.name).order_by(AuthorModel.id)
+    if after is not None:
+        query = query.where(AuthorModel.id > after)
+    return query.limit(limit)
@@ -1,25 +1,97 @@
-from sqlalchemy import delete, select
+from collections.abc import Callable, Iterator, Sequence
+from typing import Final
+
+from sqlalchemy import Select, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pisaka.app.authors.entities import Author
 from pisaka.app.authors.ids import AuthorId
 from pisaka.app.authors.models import AuthorModel
+from pisaka.platform.db import ReadOnlyAsyncSession
 from pisaka.platform.errors import NotFoundError
 
+# Сколько id передается в один IN (...). Старые сборки SQLite не принимают
+# больше 999 параметров в одном запросе
+_IN_CHUNK_SIZE: Final[int] = 500
+
+
+def select_author_for_update(author_id: AuthorId) -> Select[tuple[AuthorModel]]:
+    return (
+        select(AuthorModel)
+        .where(AuthorModel.id == author_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+def select_authors_by_ids(author_ids: Sequence[AuthorId]) -> Select[tuple[AuthorModel]]:
+    return select(AuthorModel).where(AuthorModel.id.in_(author_ids))
 
-class AuthorRepository:
+
+class _AuthorReader:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    async def get_for_read(self, author_id: AuthorId) -> Author:
+        author = await self.find(author_id)
+        if author is None:
+            raise NotFoundError(entity_type=Author, key=author_id)
+        return author
+
+    async def find(self, author_id: AuthorId) -> Author | None:
+        model = await self._session.get(AuthorModel, author_id)
+        return Author(model=model) if model is not None else None
+
+    async def find_many(self, author_ids: Sequence[AuthorId]) -> list[Author | None]:
+        # Результат выровнен по author_ids: на месте ненайденного автора None
+        models = await self._load_many(author_ids, lambda query: query)
+        return [
+            (
+                Author(model=model)
+                if (model := models.get(author_id)) is not None
+                else None
+            )
+            for author_id in author_ids
+        ]
+
+    async def _load_many(
+        self,
+        author_ids: Sequence[AuthorId],
+        prepare: Callable[[Select[tuple[AuthorModel]]], Select[tuple[AuthorModel]]],
+    ) -> dict[AuthorId, AuthorModel]:
+        models = {}
+        for chunk in _chunked(list(dict.fromkeys(author_ids)), _IN_CHUNK_SIZE):
+            result = await self._session.execute(
+                prepare(select_authors_by_ids(chunk)),
+            )
+            models.update({model.id: model for model in result.scalars()})
+        return models
+
+
+class AuthorRepository(_AuthorReader):
     async def get(self, author_id: AuthorId) -> Author:
-        result = await self._session.execute(
-            select(AuthorModel).where(AuthorModel.id == author_id).with_for_update(),
-        )
+        result = await self._session.execute(select_author_for_update(author_id))
         model: AuthorModel | None = result.scalar_one_or_none()
         if model is None:
             raise NotFoundError(entity_type=Author, key=author_id)
         return Author(model=model)
 
+    async def get_many(self, author_ids: Sequence[AuthorId]) -> list[Author]:
+        # Авторы возвращаются в том же порядке, что и author_ids
+        models = await self._load_many(
+            author_ids,
+            lambda query: query.with_for_update().execution_options(
+                populate_existing=True,
+            ),
+        )
+        authors = []
+        for author_id in author_ids:
+            model = models.get(author_id)
+            if model is None:
+                raise NotFoundError(entity_type=Author, key=author_id)
+            authors.append(Author(model=model))
+        return authors
+
     async def save(self, author: Author) -> None:
         model = author._model  # noqa: SLF001
         self._session.add(model)
@@ -29,3 +101,15 @@ class AuthorRepository:
         await self._session.execute(
             delete(AuthorModel).where(AuthorModel.id == author_id),
         )
+
+
+class ReadOnlyAuthorRepository(_AuthorReader):
+    # Только чтение через читающую сессию (реплику, если она настроена),
+    # для публичного API
+    def __init__(self, session: ReadOnlyAsyncSession) -> None:
+        super().__init__(session=session)
+
+
+def _chunked(items: list[AuthorId], size: int) -> Iterator[list[AuthorId]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -1,29 +1,49 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Delete, Select, delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pisaka.app.authors.ids import AuthorId
-from pisaka.app.authors.models import DefaultAuthorModel
+from pisaka.app.authors.models import AuthorStatsModel, DefaultAuthorModel
+from pisaka.platform.cache import MISSING, TTLCache
+from pisaka.platform.write_queue import in_write_transaction
+
+
+class DefaultAuthorCache(TTLCache[UUID, AuthorId | None]):
+    # user_id -> автор по умолчанию. Отсутствие автора по умолчанию (None)
+    # тоже кэшируется, чтобы не ходить в БД за такими пользователями каждый раз
+    pass
 
 
 class DefaultAuthorService:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        default_author_cache: DefaultAuthorCache,
+    ) -> None:
         self._session = session
+        self._cache = default_author_cache
 
     async def get_all(self) -> Sequence[DefaultAuthorModel]:
         result = await self._session.execute(select(DefaultAuthorModel))
         return result.scalars().all()
 
     async def get(self, user_id: UUID) -> AuthorId | None:
-        result = await self._session.execute(
-            select(DefaultAuthorModel).where(DefaultAuthorModel.user_id == user_id),
-        )
-        model: DefaultAuthorModel | None = result.scalar_one_or_none()
-        if model is None:
-            return None
-        return model.author_id
+        cached = self._cache.get(user_id)
+        if cached is not MISSING:
+            return cached
+        result = await self._session.execute(select_default_author_id(user_id))
+        author_id: AuthorId | None = result.scalar_one_or_none()
+        # В пишущей транзакции значение может оказаться откаченным,
+        # в кэш попадают только закоммиченные данные
+        if not in_write_transaction(self._session):
+            self._cache.put(user_id, author_id)
+        return author_id
+
+    def invalidate_cache(self, user_id: UUID) -> None:
+        self._cache.invalidate(user_id)
 
     async def set(self, user_id: UUID, author_id: AuthorId) -> None:
         result_1 = await self._session.execute(
@@ -43,3 +63,95 @@ class DefaultAuthorService:
         await self._session.execute(
             delete(DefaultAuthorModel).where(DefaultAuthorModel.user_id == user_id),
         )
+
+
+class AuthorStatsService:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_all(self) -> Sequence[AuthorStatsModel]:
+        result = await self._session.execute(select(AuthorStatsModel))
+        return result.scalars().all()
+
+    async def create(self, author_id: AuthorId) -> None:
+        model = AuthorStatsModel(
+            author_id=author_id,
+            count_of_articles=0,
+            count_of_article_drafts_in_work=0,
+        )
+        self._session.add(model)
+        await self._session.flush([model])
+
+    async def add(
+        self,
+        author_id: AuthorId,
+        *,
+        articles: int = 0,
+        article_drafts_in_work: int = 0,
+    ) -> None:
+        # Инкремент на стороне БД, без чтения строки в приложение. Строки
+        # статистики может не быть (автор заведен до ее появления или в обход
+        # CreateAuthorCommand), тогда она создается, а не теряет изменения.
+        # Счетчики такой строки начинаются с приращения, точные значения
+        # восстанавливает `pisaka authors rebuild-stats`
+        statement = sqlite_insert(AuthorStatsModel).values(
+            author_id=author_id,
+            count_of_articles=articles,
+            count_of_article_drafts_in_work=article_drafts_in_work,
+        )
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[AuthorStatsModel.author_id],
+                set_={
+                    AuthorStatsModel.count_of_articles: (
+                        AuthorStatsModel.count_of_articles
+                        + statement.excluded.count_of_articles
+                    ),
+                    AuthorStatsModel.count_of_article_drafts_in_work: (
+                        AuthorStatsModel.count_of_article_drafts_in_work
+                        + statement.excluded.count_of_article_drafts_in_work
+                    ),
+                },
+            ),
+        )
+
+    async def set(
+        self,
+        author_id: AuthorId,
+        *,
+        count_of_articles: int,
+        count_of_article_drafts_in_work: int,
+    ) -> None:
+        result = await self._session.execute(
+            select_author_stats_for_update(author_id),
+        )
+        model = result.scalar_one_or_none()
+        if model is None:
+            model = AuthorStatsModel(author_id=author_id)
+        model.count_of_articles = count_of_articles
+        model.count_of_article_drafts_in_work = count_of_article_drafts_in_work
+        self._session.add(model)
+        await self._session.flush([model])
+
+    async def delete(self, author_id: AuthorId) -> None:
+        await self._session.execute(delete_author_stats(author_id))
+
+
+def select_default_author_id(user_id: UUID) -> Select[tuple[AuthorId]]:
+    return select(DefaultAuthorModel.author_id).where(
+        DefaultAuthorModel.user_id == user_id,
+    )
+
+
+def select_author_stats_for_update(
+    author_id: AuthorId,
+) -> Select[tuple[AuthorStatsModel]]:
+    return (
+        select(AuthorStatsModel)
+        .where(AuthorStatsModel.author_id == author_id)
+        .with_for_update()
+    )
+
+
+def delete_author_stats(author_id: AuthorId) -> Delete:
+    return delete(AuthorStatsModel).where(AuthorStatsModel.author_id == author_id)
@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import logging
+from typing import Final
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.authors.ids import AuthorId
+from pisaka.app.authors.models import AUTHORS_COLLECTION_NAME
+from pisaka.app.authors.queries import select_authors_list_page
+from pisaka.platform.api import BaseSchema
+from pisaka.platform.cache import MISSING, TTLCache
+from pisaka.platform.db import ReadOnlyAsyncEngine, ReadOnlyAsyncSession
+from pisaka.platform.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from pisaka.platform.response_snapshots import ResponseSnapshot
+from pisaka.platform.versions import get_collection_version
+
+# Публичный список авторов между записями одинаков для тысяч запросов, поэтому
+# страницы списка хранятся готовыми снимками ответа: JSON и его сжатые
+# варианты. Ключ снимка включает версию коллекции авторов, так что после
+# любой записи старые снимки просто перестают находиться. Это работает и
+# в других процессах, которые о записи ничего не знают.
+#
+# Команды авторов после коммита заново строят в фоне первую страницу,
+# чтобы после записи ее не пришлось строить первому пришедшему запросу
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_AUTHORS_PAGE_SIZE: Final[int] = 100
+
+
+class AuthorSchema(BaseSchema):
+    id: AuthorId
+    name: str
+
+
+class AuthorsListSchema(BaseSchema):
+    authors: list[AuthorSchema]
+    next_cursor: str | None
+
+
+class AuthorsListSnapshotCache(
+    TTLCache[tuple[int, int, str | None], ResponseSnapshot],
+):
+    # (версия коллекции, размер страницы, курсор) -> снимок страницы
+    pass
+
+
+class AuthorsListSnapshotService:
+    def __init__(
+        self,
+        authors_list_snapshot_cache: AuthorsListSnapshotCache,
+        read_only_engine: ReadOnlyAsyncEngine,
+    ) -> None:
+        self._cache = authors_list_snapshot_cache
+        self._read_only_engine = read_only_engine
+        self._rebuild_task: asyncio.Task[None] | None = None
+        self._rebuild_requested = False
+
+    async def get(
+        self,
+        session: AsyncSession,
+        *,
+        version: int,
+        limit: int,
+        cursor: str | None,
+    ) -> ResponseSnapshot:
+        key = (version, limit, cursor)
+        snapshot = self._cache.get(key)
+        if snapshot is MISSING:
+            snapshot = ResponseSnapshot.build(
+                await _build_authors_list_page(session, limit=limit, cursor=cursor),
+            )
+            self._cache.put(key, snapshot)
+        return snapshot
+
+    def schedule_rebuild(self) -> None:
+        # Вызывается после коммита. Частые записи не запускают по перестроению
+        # на каждую: пока перестроение идет, новые просьбы схлопываются в одну
+        self._rebuild_requested = True
+        if self._rebuild_task is None or self._rebuild_task.done():
+            self._rebuild_task = asyncio.create_task(self._rebuild())
+
+    async def stop(self) -> None:
+        if self._rebuild_task is None:
+            return
+        self._rebuild_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._rebuild_task
+        self._rebuild_task = None
+
+    async def _rebuild(self) -> None:
+        while self._rebuild_requested:
+            self._rebuild_requested = False
+            try:
+                async with ReadOnlyAsyncSession(
+                    bind=self._read_only_engine.engine,
+                    autoflush=False,
+                ) as session:
+                    version = await get_collection_version(
+                        session,
+                        AUTHORS_COLLECTION_NAME,
+                    )
+                    await self.get(
+                        session,
+                        version=version,
+                        limit=DEFAULT_AUTHORS_PAGE_SIZE,
+                        cursor=None,
+                    )
+            except Exception:
+                # Снимок не обязателен: запрос построит его сам
+                _logger.exception("Failed to rebuild authors list snapshot")
+
+
+async def _build_authors_list_page(
+    session: AsyncSession,
+    *,
+    limit: int,
+    cursor: str | None,
+) -> bytes:
+    after = None
+    if cursor is not None:
+        (last_id,) = decode_cursor(cursor, size=1)
+        try:
+            after = UUID(last_id)
+        except ValueError as err:
+            raise InvalidCursorError from err
+    result = await session.execute(
+        select_authors_list_page(limit=limit + 1, after=after),
+    )
+    rows = result.tuples().all()
+
+    authors = [
+        AuthorSchema(id=author_id, name=name) for author_id, name in rows[:limit]
+    ]
+    next_cursor = encode_cursor(str(authors[-1].id)) if len(rows) > limit else None
+    return (
+        AuthorsListSchema(authors=authors, next_cursor=next_cursor)
+        .model_dump_json()
+        .encode()
+    )
@@ -8,25 +8,34 @@ from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from starlette import status
 
+from pisaka.platform.api import SchemaResponse
+from pisaka.platform.db import DBPoolWarmer
+from pisaka.platform.di import validate_and_warm_up_container
 from pisaka.platform.security.authorization import AuthorizationError
 
 InternalAPIApp = NewType("InternalAPIApp", FastAPI)
 
 
 def create_app(container: aioinject.Container) -> InternalAPIApp:
-    from pisaka.app.internal_api import articles, authors
+    from pisaka.app.internal_api import articles, authors, batch, system
 
     @asynccontextmanager
     async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         async with container:
+            await validate_and_warm_up_container(container, app.routes)
+            async with container.context() as ctx:
+                db_pool_warmer = await ctx.resolve(DBPoolWarmer)
+                await db_pool_warmer.warm_up()
             yield
 
-    app = FastAPI(lifespan=lifespan)
+    app = FastAPI(lifespan=lifespan, default_response_class=SchemaResponse)
 
     app.add_middleware(AioInjectMiddleware, container=container)
 
     app.include_router(authors.router)
     app.include_router(articles.router)
+    app.include_router(batch.router)
+    app.include_router(system.router)
 
     async def handle_authorization_error(_: Request, exception: Exception) -> Response:
         assert isinstance(exception, AuthorizationError)  # noqa: S101
@@ -1,20 +1,28 @@
-from collections.abc import Sequence
-from typing import Annotated
+from collections.abc import AsyncIterator
+from typing import Annotated, Final
 from uuid import UUID
 
 from aioinject import Inject
-from aioinject.ext.fastapi import inject
-from fastapi import APIRouter
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from pisaka.app.articles.commands import CreateArticleDraftCommand
-from pisaka.app.articles.db import ArticleDraftModel
-from pisaka.app.articles.ids import ArticleDraftId
+from fastapi import APIRouter, Body, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from pisaka.app.articles.commands import (
+    CreateArticleDraftCommand,
+    DeleteArticleDraftCommand,
+    DisproveArticleCommand,
+)
+from pisaka.app.articles.ids import ArticleDraftId, ArticleId
+from pisaka.app.articles.queries import (
+    ArticleDraftListRow,
+    list_article_drafts,
+    stream_article_drafts,
+)
+from pisaka.app.articles.search import ReadOnlySearchIndex, SearchHit
 from pisaka.app.articles.security import ListArticleDraftsPermission
-from pisaka.app.authors import AuthorId, AuthorModel
-from pisaka.platform.api import BaseSchema
+from pisaka.app.authors import AuthorId
+from pisaka.platform.api import BaseSchema, SchemaResponse
+from pisaka.platform.db import ReadOnlyAsyncSession
+from pisaka.platform.di import inject
 from pisaka.platform.security.authentication.internal_api import Authentication
 from pisaka.platform.security.authorization import AuthorizationError
 
@@ -38,44 +46,74 @@ class ArtileDraftsListSchema(BaseSchema):
     drafts: list[Item]
 
 
-@router.get(path="/article-drafts")
+NDJSON_MEDIA_TYPE: Final[str] = "application/x-ndjson"
+_STREAM_BATCH_SIZE: Final[int] = 500
+
+
+@router.get(
+    path="/article-drafts",
+    response_model=ArtileDraftsListSchema,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 @inject
 async def get_article_drafts_list(
-    session: Annotated[AsyncSession, Inject],
+    request: Request,
+    session: Annotated[ReadOnlyAsyncSession, Inject],
     authentication: Authentication,
     list_article_drafts_permission: Annotated[ListArticleDraftsPermission, Inject],
-) -> ArtileDraftsListSchema:
-    can_list_drafts = await list_article_drafts_permission.evaluate(
+    *,
+    stream: Annotated[
+        bool,
+        Query(description=f"Отдать список построчно в формате {NDJSON_MEDIA_TYPE}"),
+    ] = False,
+) -> Response:
+    can_list_drafts = list_article_drafts_permission.evaluate_sync(
         principal=authentication.principal,
     )
     if not can_list_drafts:
         raise AuthorizationError
 
-    result = await session.execute(
-        select(ArticleDraftModel, AuthorModel)
-        .join(AuthorModel, AuthorModel.id == ArticleDraftModel.author_id, isouter=True)
-        .options(selectinload(ArticleDraftModel.editors)),
+    if stream or NDJSON_MEDIA_TYPE in request.headers.get("Accept", ""):
+        return StreamingResponse(
+            _stream_article_drafts(session),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    drafts = await list_article_drafts(session)
+    return SchemaResponse(
+        ArtileDraftsListSchema(
+            drafts=[_make_article_drafts_list_item(draft) for draft in drafts],
+        ),
     )
-    drafts: Sequence[tuple[ArticleDraftModel, AuthorModel]] = result.tuples().all()
-
-    return ArtileDraftsListSchema(
-        drafts=[
-            ArtileDraftsListSchema.Item(
-                id=draft.id,
-                is_published=draft.is_published,
-                author=(
-                    ArtileDraftsListSchema.Item.Author(
-                        id=author.id,
-                        name=author.name,
-                    )
-                    if author
-                    else None
-                ),
-                headline=draft.headline,
-                editors=[editor.user_id for editor in draft.editors],
+
+
+async def _stream_article_drafts(
+    session: ReadOnlyAsyncSession,
+) -> AsyncIterator[bytes]:
+    # Каждая пачка строк сразу уходит клиенту
+    async for drafts in stream_article_drafts(session, _STREAM_BATCH_SIZE):
+        yield b"".join(
+            _make_article_drafts_list_item(draft).model_dump_json().encode() + b"\n"
+            for draft in drafts
+        )
+
+
+def _make_article_drafts_list_item(
+    draft: ArticleDraftListRow,
+) -> ArtileDraftsListSchema.Item:
+    return ArtileDraftsListSchema.Item(
+        id=draft.id,
+        is_published=draft.is_published,
+        author=(
+            ArtileDraftsListSchema.Item.Author(
+                id=draft.author_id,
+                name=draft.author_name,
             )
-            for draft, author in drafts
-        ],
+            if draft.author_id is not None and draft.author_name is not None
+            else None
+        ),
+        headline=draft.headline,
+        editors=draft.editors,
     )
 
 
@@ -102,3 +140,86 @@ async def create_article_draft(
         principal=authentication.principal,
     )
     return CreateArticleDraftResponseSchema(draft=DraftSchema.model_validate(draft))
+
+
+@router.delete(path="/article-drafts/{article_draft_id}")
+@inject
+async def delete_article_draft(
+    article_draft_id: Annotated[ArticleDraftId, Path(description="ID черновика")],
+    delete_article_draft_command: Annotated[DeleteArticleDraftCommand, Inject],
+    authentication: Authentication,
+) -> None:
+    await delete_article_draft_command.execute(
+        article_draft_id=article_draft_id,
+        principal=authentication.principal,
+        agent=authentication.agent,
+    )
+
+
+class ArticleSchema(BaseSchema):
+    id: ArticleId
+    author_id: AuthorId
+    headline: str
+    content: str
+    slug: str
+    disproof: str | None
+
+
+class DisproveArticleResponseSchema(BaseSchema):
+    article: ArticleSchema
+
+
+@router.put(path="/articles/{article_id}/disproof")
+@inject
+async def disprove_article(
+    article_id: Annotated[ArticleId, Path(description="ID статьи")],
+    disproof: Annotated[str, Body(embed=True, min_length=1)],
+    disprove_article_command: Annotated[DisproveArticleCommand, Inject],
+    authentication: Authentication,
+) -> DisproveArticleResponseSchema:
+    article = await disprove_article_command.execute(
+        article_id=article_id,
+        disproof=disproof,
+        principal=authentication.principal,
+        agent=authentication.agent,
+    )
+    return DisproveArticleResponseSchema(article=ArticleSchema.model_validate(article))
+
+
+class SearchResultsSchema(BaseSchema):
+    class Hit(BaseSchema):
+        id: UUID
+        headline: str
+        snippet: str
+        rank: float
+
+    articles: list[Hit]
+    drafts: list[Hit]
+
+
+MAX_SEARCH_LIMIT: Final[int] = 100
+
+
+@router.get(path="/search")
+@inject
+async def search_articles_and_drafts(
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Запрос")],
+    search_index: Annotated[ReadOnlySearchIndex, Inject],
+    authentication: Authentication,
+    list_article_drafts_permission: Annotated[ListArticleDraftsPermission, Inject],
+    limit: Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)] = 20,
+) -> SearchResultsSchema:
+    can_list_drafts = list_article_drafts_permission.evaluate_sync(
+        principal=authentication.principal,
+    )
+    if not can_list_drafts:
+        raise AuthorizationError
+
+    return SearchResultsSchema(
+        articles=_make_search_hits(await search_index.search_articles(q, limit)),
+        drafts=_make_search_hits(await search_index.search_drafts(q, limit)),
+    )
+
+
+def _make_search_hits(hits: list[SearchHit]) -> list[SearchResultsSchema.Hit]:
+    return SearchResultsSchema.Hit.model_validate_list(hits)
@@ -1,16 +1,10 @@
-from collections import defaultdict
-from collections.abc import Sequence
 from typing import Annotated
 from uuid import UUID
 
 from aioinject import Inject
-from aioinject.ext.fastapi import inject
-from fastapi import APIRouter, Body, Path
+from fastapi import APIRouter, Body, Path, Response
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.functions import count
 
-from pisaka.app.articles.db import ArticleDraftModel, ArticleModel
 from pisaka.app.authors.commands import (
     CreateAuthorCommand,
     DeleteAuthorCommand,
@@ -19,10 +13,13 @@ from pisaka.app.authors.commands import (
     UpdateAuthorCommand,
 )
 from pisaka.app.authors.ids import AuthorId
-from pisaka.app.authors.models import AuthorModel, DefaultAuthorModel
+from pisaka.app.authors.models import AuthorModel
+from pisaka.app.authors.queries import list_authors_with_stats
 from pisaka.app.authors.security import EditAuthorsPermission, ListAuthorsPermission
 from pisaka.app.authors.services import DefaultAuthorService
-from pisaka.platform.api import BaseSchema
+from pisaka.platform.api import BaseSchema, SchemaResponse
+from pisaka.platform.db import ReadOnlyAsyncSession
+from pisaka.platform.di import inject
 from pisaka.platform.security.authentication.internal_api import Authentication
 from pisaka.platform.security.authorization import AuthorizationError
 
@@ -48,59 +45,27 @@ class AuthorsListSchema(BaseSchema):
     authors: list[AuthorExtendedSchema]
 
 
-@router.get(path="/")
+@router.get(path="/", response_model=AuthorsListSchema)
 @inject
 async def get_authors_list(
-    session: Annotated[AsyncSession, Inject],
+    session: Annotated[ReadOnlyAsyncSession, Inject],
     authentication: Authentication,
     list_authors_permission: Annotated[ListAuthorsPermission, Inject],
-) -> AuthorsListSchema:
-    can_list_authors = await list_authors_permission.evaluate(
+) -> Response:
+    can_list_authors = list_authors_permission.evaluate_sync(
         principal=authentication.principal,
         agent=authentication.agent,
     )
     if not can_list_authors:
         raise AuthorizationError
 
-    result_1 = await session.execute(select(AuthorModel))
-    authors: Sequence[AuthorModel] = result_1.scalars().all()
-
-    result_2 = await session.execute(select(DefaultAuthorModel))
-    default_authors: dict[AuthorId, list[UUID]] = defaultdict(list)
-    for default_author in result_2.scalars().all():
-        default_authors[default_author.author_id].append(default_author.user_id)
-
-    result_3 = await session.execute(
-        select(ArticleModel.author_id, count("*")).group_by(ArticleModel.author_id),
-    )
-    count_of_articles: dict[AuthorId, int] = defaultdict(lambda: 0)
-    for author_id, cnt in result_3.tuples().all():
-        count_of_articles[author_id] = cnt
-
-    result_4 = await session.execute(
-        select(ArticleDraftModel.author_id, count("*"))
-        .where(~ArticleDraftModel.is_published)
-        .group_by(ArticleDraftModel.author_id),
-    )
-    count_of_article_drafts_in_work: dict[AuthorId, int] = defaultdict(lambda: 0)
-    for author_id_4, cnt in result_4.tuples().all():
-        if author_id_4 is not None:
-            count_of_article_drafts_in_work[author_id_4] = cnt
-
-    return AuthorsListSchema(
-        authors=[
-            AuthorExtendedSchema(
-                id=author.id,
-                name=author.name,
-                is_real_person=author.is_real_person,
-                default_for_users=default_authors[author.id],
-                count_of_articles=count_of_articles[author.id],
-                count_of_article_drafts_in_work=count_of_article_drafts_in_work[
-                    author.id
-                ],
-            )
-            for author in authors
-        ],
+    # Схема собрана здесь же из строк БД, повторная проверка FastAPI не нужна
+    return SchemaResponse(
+        AuthorsListSchema(
+            authors=AuthorExtendedSchema.model_validate_list(
+                await list_authors_with_stats(session),
+            ),
+        ),
     )
 
 
@@ -108,11 +73,11 @@ async def get_authors_list(
 @inject
 async def get_author(
     author_id: Annotated[AuthorId, Path(description="ID автора")],
-    session: Annotated[AsyncSession, Inject],
+    session: Annotated[ReadOnlyAsyncSession, Inject],
     authentication: Authentication,
     edit_authors_permission: Annotated[EditAuthorsPermission, Inject],
 ) -> AuthorSchema:
-    can_edit_authors = await edit_authors_permission.evaluate(
+    can_edit_authors = edit_authors_permission.evaluate_sync(
         principal=authentication.principal,
     )
     if not can_edit_authors:
@@ -191,10 +156,7 @@ async def get_all_default_authors(
 ) -> DefaultAuthorsListSchema:
     defaults_authors = await default_author_service.get_all()
     return DefaultAuthorsListSchema(
-        items=[
-            DefaultAuthorSchema.model_validate(default_author)
-            for default_author in defaults_authors
-        ],
+        items=DefaultAuthorSchema.model_validate_list(defaults_authors),
     )
 
 
@@ -0,0 +1,316 @@
+from dataclasses import dataclass
+from typing import Annotated, Final, Literal
+from uuid import UUID
+
+from aioinject import Inject
+from fastapi import APIRouter, Body
+from pydantic import Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.articles.commands import (
+    CreateArticleDraftCommand,
+    PublishArticleCommand,
+    UpdateArticleDraftHeadlineCommand,
+)
+from pisaka.app.articles.ids import ArticleDraftId
+from pisaka.app.articles.services import ArticlePageCache
+from pisaka.app.authors.commands import (
+    CreateAuthorCommand,
+    ResetDefaultAuthorCommand,
+    SetDefaultAuthorCommand,
+    UpdateAuthorCommand,
+)
+from pisaka.app.authors.ids import AuthorId
+from pisaka.app.authors.services import DefaultAuthorService
+from pisaka.app.authors.snapshots import AuthorsListSnapshotService
+from pisaka.app.internal_api.articles import ArticleSchema, DraftSchema
+from pisaka.app.internal_api.authors import AuthorSchema
+from pisaka.platform.api import BaseSchema
+from pisaka.platform.di import inject
+from pisaka.platform.errors import InvalidStateError, NotFoundError
+from pisaka.platform.security.authentication.internal_api import Authentication
+from pisaka.platform.security.authorization import AuthorizationError
+from pisaka.platform.write_queue import WriteQueue
+
+# Пакетное выполнение операций: админка присылает упорядоченный список операций
+# одним запросом, и все они выполняются в одном DI контексте.
+#
+# В атомарном режиме (по умолчанию) все операции идут в одной транзакции,
+# каждая в своей точке сохранения. Первая же ошибка откатывает весь пакет,
+# а оставшиеся операции не выполняются. Без атомарности каждая операция
+# коммитится отдельно, и ошибка одной не мешает остальным.
+#
+# Ошибкой операции считаются только ошибки предметной области (нет сущности,
+# нет прав, недопустимое состояние). Прочие исключения, например ошибки БД,
+# не превращаются в результат операции, а дают 500. В атомарном режиме пакет
+# при этом откатывается, без атомарности уже выполненные операции остаются
+
+router = APIRouter(
+    tags=["Пакетные операции"],
+)
+
+MAX_BATCH_OPERATIONS: Final[int] = 1000
+
+
+class CreateAuthorOperation(BaseSchema):
+    op: Literal["create_author"]
+    name: str
+    is_real_person: bool
+
+
+class UpdateAuthorOperation(BaseSchema):
+    op: Literal["update_author"]
+    author_id: AuthorId
+    name: str
+
+
+class SetDefaultAuthorOperation(BaseSchema):
+    op: Literal["set_default_author"]
+    user_id: UUID
+    author_id: AuthorId
+
+
+class ResetDefaultAuthorOperation(BaseSchema):
+    op: Literal["reset_default_author"]
+    user_id: UUID
+
+
+class CreateArticleDraftOperation(BaseSchema):
+    op: Literal["create_article_draft"]
+
+
+class UpdateArticleDraftHeadlineOperation(BaseSchema):
+    op: Literal["update_article_draft_headline"]
+    article_draft_id: ArticleDraftId
+    headline: str
+
+
+class PublishArticleOperation(BaseSchema):
+    op: Literal["publish_article"]
+    article_draft_id: ArticleDraftId
+
+
+BatchOperation = Annotated[
+    CreateAuthorOperation
+    | UpdateAuthorOperation
+    | SetDefaultAuthorOperation
+    | ResetDefaultAuthorOperation
+    | CreateArticleDraftOperation
+    | UpdateArticleDraftHeadlineOperation
+    | PublishArticleOperation,
+    Field(discriminator="op"),
+]
+
+
+class BatchOperationResultSchema(BaseSchema):
+    # rolled_back - операция выполнилась, но пакет откатился из-за ошибки
+    # в другой операции; skipped - операция не выполнялась
+    status: Literal["ok", "failed", "rolled_back", "skipped"]
+    error: str | None = None
+    author: AuthorSchema | None = None
+    draft: DraftSchema | None = None
+    article: ArticleSchema | None = None
+
+
+class BatchResponseSchema(BaseSchema):
+    results: list[BatchOperationResultSchema]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _BatchCommands:
+    create_author: CreateAuthorCommand
+    update_author: UpdateAuthorCommand
+    set_default_author: SetDefaultAuthorCommand
+    reset_default_author: ResetDefaultAuthorCommand
+    create_article_draft: CreateArticleDraftCommand
+    update_article_draft_headline: UpdateArticleDraftHeadlineCommand
+    publish_article: PublishArticleCommand
+
+
+class _BatchAbortedError(Exception):
+    pass
+
+
+@router.post(path="/batch")
+@inject
+async def execute_batch(
+    operations: Annotated[
+        list[BatchOperation],
+        Body(embed=True, min_length=1, max_length=MAX_BATCH_OPERATIONS),
+    ],
+    session: Annotated[AsyncSession, Inject],
+    write_queue: Annotated[WriteQueue, Inject],
+    default_author_service: Annotated[DefaultAuthorService, Inject],
+    article_page_cache: Annotated[ArticlePageCache, Inject],
+    authors_list_snapshot_service: Annotated[AuthorsListSnapshotService, Inject],
+    create_author_command: Annotated[CreateAuthorCommand, Inject],
+    update_author_command: Annotated[UpdateAuthorCommand, Inject],
+    set_default_author_command: Annotated[SetDefaultAuthorCommand, Inject],
+    reset_default_author_command: Annotated[ResetDefaultAuthorCommand, Inject],
+    create_article_draft_command: Annotated[CreateArticleDraftCommand, Inject],
+    update_article_draft_headline_command: Annotated[
+        UpdateArticleDraftHeadlineCommand,
+        Inject,
+    ],
+    publish_article_command: Annotated[PublishArticleCommand, Inject],
+    authentication: Authentication,
+    *,
+    atomic: Annotated[bool, Body(embed=True)] = True,
+) -> BatchResponseSchema:
+    commands = _BatchCommands(
+        create_author=create_author_command,
+        update_author=update_author_command,
+        set_default_author=set_default_author_command,
+        reset_default_author=reset_default_author_command,
+        create_article_draft=create_article_draft_command,
+        update_article_draft_headline=update_article_draft_headline_command,
+        publish_article=publish_article_command,
+    )
+
+    if not atomic:
+        return BatchResponseSchema(
+            results=[
+                await _execute_operation(operation, commands, authentication)
+                for operation in operations
+            ],
+        )
+
+    results: list[BatchOperationResultSchema] = []
+    try:
+        async with write_queue.begin(session):
+            await _execute_all_or_abort(operations, commands, authentication, results)
+    except _BatchAbortedError:
+        # Команды уже сбросили кэш после своих точек сохранения, и до отката
+        # в него могли попасть значения из откаченных изменений
+        _invalidate_default_authors(operations, default_author_service)
+        *done, failed = results
+        return BatchResponseSchema(
+            results=[
+                *(BatchOperationResultSchema(status="rolled_back") for _ in done),
+                failed,
+                *(
+                    BatchOperationResultSchema(status="skipped")
+                    for _ in range(len(operations) - len(results))
+                ),
+            ],
+        )
+
+    # Команды сбрасывают кэши сразу после своей точки сохранения,
+    # а параллельный запрос мог успеть закэшировать старое значение
+    # до коммита пакета
+    _invalidate_default_authors(operations, default_author_service)
+    for result in results:
+        if result.article is not None:
+            article_page_cache.invalidate(result.article.slug)
+    if any(
+        isinstance(operation, CreateAuthorOperation | UpdateAuthorOperation)
+        for operation in operations
+    ):
+        authors_list_snapshot_service.schedule_rebuild()
+
+    return BatchResponseSchema(results=results)
+
+
+def _invalidate_default_authors(
+    operations: list[BatchOperation],
+    default_author_service: DefaultAuthorService,
+) -> None:
+    for operation in operations:
+        if isinstance(
+            operation,
+            SetDefaultAuthorOperation | ResetDefaultAuthorOperation,
+        ):
+            default_author_service.invalidate_cache(user_id=operation.user_id)
+
+
+async def _execute_all_or_abort(
+    operations: list[BatchOperation],
+    commands: _BatchCommands,
+    authentication: Authentication,
+    results: list[BatchOperationResultSchema],
+) -> None:
+    for operation in operations:
+        result = await _execute_operation(operation, commands, authentication)
+        results.append(result)
+        if result.status == "failed":
+            raise _BatchAbortedError
+
+
+async def _execute_operation(
+    operation: BatchOperation,
+    commands: _BatchCommands,
+    authentication: Authentication,
+) -> BatchOperationResultSchema:
+    try:
+        return await _dispatch_operation(operation, commands, authentication)
+    except AuthorizationError:
+        return BatchOperationResultSchema(status="failed", error="Unauthorized")
+    except (NotFoundError, InvalidStateError) as err:
+        return BatchOperationResultSchema(status="failed", error=str(err))
+
+
+async def _dispatch_operation(
+    operation: BatchOperation,
+    commands: _BatchCommands,
+    authentication: Authentication,
+) -> BatchOperationResultSchema:
+    principal, agent = authentication.principal, authentication.agent
+    result = BatchOperationResultSchema(status="ok")
+    match operation:
+        case CreateAuthorOperation():
+            author = await commands.create_author.execute(
+                name=operation.name,
+                is_real_person=operation.is_real_person,
+                principal=principal,
+                agent=agent,
+            )
+            result = BatchOperationResultSchema(
+                status="ok",
+                author=AuthorSchema.model_validate(author),
+            )
+        case UpdateAuthorOperation():
+            author = await commands.update_author.execute(
+                author_id=operation.author_id,
+                new_name=operation.name,
+                principal=principal,
+                agent=agent,
+            )
+            result = BatchOperationResultSchema(
+                status="ok",
+                author=AuthorSchema.model_validate(author),
+            )
+        case SetDefaultAuthorOperation():
+            await commands.set_default_author.execute(
+                user_id=operation.user_id,
+                author_id=operation.author_id,
+            )
+        case ResetDefaultAuthorOperation():
+            await commands.reset_default_author.execute(user_id=operation.user_id)
+        case CreateArticleDraftOperation():
+            draft = await commands.create_article_draft.execute(principal=principal)
+            result = BatchOperationResultSchema(
+                status="ok",
+                draft=DraftSchema.model_validate(draft),
+            )
+        case UpdateArticleDraftHeadlineOperation():
+            draft = await commands.update_article_draft_headline.execute(
+                article_draft_id=operation.article_draft_id,
+                new_headline=operation.headline,
+                principal=principal,
+                agent=agent,
+            )
+            result = BatchOperationResultSchema(
+                status="ok",
+                draft=DraftSchema.model_validate(draft),
+            )
+        case PublishArticleOperation():
+            article = await commands.publish_article.execute(
+                article_draft_id=operation.article_draft_id,
+                principal=principal,
+                agent=agent,
+            )
+            result = BatchOperationResultSchema(
+                status="ok",
+                article=ArticleSchema.model_validate(article),
+            )
+    return result
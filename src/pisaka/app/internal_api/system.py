@@ -0,0 +1,50 @@
+from typing import Annotated
+
+from aioinject import Inject
+from fastapi import APIRouter
+
+from pisaka.platform.api import BaseSchema
+from pisaka.platform.di import inject
+from pisaka.platform.security.authentication.internal_api import Authentication
+from pisaka.platform.security.authorization import AuthorizationError
+from pisaka.platform.security.roles import PisakaRole
+from pisaka.platform.security.utils import has_role
+from pisaka.platform.write_queue import WriteQueue
+
+router = APIRouter(
+    prefix="/system",
+    tags=["Система"],
+)
+
+
+class WriteQueueStatsSchema(BaseSchema):
+    enabled: bool
+    depth: int
+    max_depth: int
+    transactions: int
+    failed_transactions: int
+    batches: int
+    avg_wait_sec: float
+    max_wait_sec: float
+
+
+@router.get(path="/write-queue")
+@inject
+async def get_write_queue_stats(
+    write_queue: Annotated[WriteQueue, Inject],
+    authentication: Authentication,
+) -> WriteQueueStatsSchema:
+    if not has_role(authentication.principal, PisakaRole.CHIEF):
+        raise AuthorizationError
+
+    stats = write_queue.stats()
+    return WriteQueueStatsSchema(
+        enabled=write_queue.enabled,
+        depth=stats.depth,
+        max_depth=stats.max_depth,
+        transactions=stats.transactions,
+        failed_transactions=stats.failed_transactions,
+        batches=stats.batches,
+        avg_wait_sec=stats.avg_wait_sec,
+        max_wait_sec=stats.max_wait_sec,
+    )
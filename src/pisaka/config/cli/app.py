@@ -2,8 +2,10 @@
 # запускалось быстрее. В идеале должно быть всего два следующие импорта
 from typer import Typer
 
-from pisaka.config.cli import authors, dev
+from pisaka.config.cli import articles, authors, dev, export
 
 app = Typer(no_args_is_help=True)
+app.add_typer(articles.cli, name="articles")
 app.add_typer(authors.cli, name="authors")
 app.add_typer(dev.cli, name="dev")
+app.add_typer(export.cli, name="export")
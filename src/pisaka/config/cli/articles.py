@@ -0,0 +1,50 @@
+# Старайтесь делать здесь как можно меньше импортов, чтобы приложение
+# запускалось быстрее. Если каким-то командам не хватает импортов,
+# то они должны делать их локально у себя
+from collections.abc import Awaitable, Callable
+
+import aioinject
+import anyio
+from rich import print
+from typer import Typer
+
+cli = Typer(
+    no_args_is_help=True,
+    short_help="Статьи",
+    help="Команды для работы с модулем статей",
+)
+
+
+@cli.command()
+def rebuild_search_index() -> None:
+    """Перестроить полнотекстовый индекс статей и черновиков.
+
+    Нужно после VACUUM, при включении поиска на заполненной БД
+    и если поиск перестал находить изменённые статьи.
+    """
+    from pisaka.app.articles.commands import RebuildSearchIndexCommand
+    from pisaka.platform.security.authentication.cli import authenticate_cli
+
+    async def main(ctx: aioinject.InjectionContext) -> None:
+        rebuild_search_index_command = await ctx.resolve(RebuildSearchIndexCommand)
+        authentication = authenticate_cli()
+        await rebuild_search_index_command.execute(agent=authentication.agent)
+        print("Search index rebuilt")
+
+    _run(main)
+
+
+def _run(fn: Callable[[aioinject.InjectionContext], Awaitable[None]]) -> None:
+    from pisaka.config.config_files import load_config
+    from pisaka.config.di import create_base_di_container
+    from pisaka.platform.logging import init_logging
+
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config=config)
+
+    async def main() -> None:
+        async with container, container.context() as ctx:
+            await fn(ctx)
+
+    anyio.run(main)
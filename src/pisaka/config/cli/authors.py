@@ -1,14 +1,15 @@
 # Старайтесь делать здесь как можно меньше импортов, чтобы приложение
 # запускалось быстрее. Если каким-то командам не хватает импортов,
 # то они должны делать их локально у себя
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
 import aioinject
 import anyio
 from rich import print
-from typer import Argument, Option, Typer
+from typer import Argument, Exit, Option, Typer
 
 cli = Typer(
     no_args_is_help=True,
@@ -72,6 +73,121 @@ def create(
     _run(main)
 
 
+@cli.command(name="import")
+def import_(
+    *,
+    file: Annotated[
+        Path,
+        Argument(
+            help="CSV с заголовком name,is_real_person[,id] или NDJSON",
+            exists=True,
+            dir_okay=False,
+            show_default=False,
+        ),
+    ],
+    import_format: Annotated[
+        str | None,
+        Option(
+            "--format",
+            help="csv или ndjson, по умолчанию определяется по расширению файла",
+            show_default=False,
+        ),
+    ] = None,
+    batch_size: Annotated[
+        int,
+        Option(min=1, help="Сколько строк вставлять одной транзакцией"),
+    ] = 5_000,
+    rejected_file: Annotated[
+        Path | None,
+        Option(help="Записать отклоненные строки в файл (NDJSON)", dir_okay=False),
+    ] = None,
+) -> None:
+    """Импортировать авторов из файла.
+
+    Файл читается потоком и вставляется пачками, так что подходит
+    для миллионов строк. Строки, не прошедшие валидацию, пропускаются
+    и выводятся в конце.
+    """
+    import json
+    import time
+    from itertools import islice
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    from pisaka.app.authors import ImportAuthorsCommand
+    from pisaka.app.authors.importing import (
+        ParsedRow,
+        RejectedRow,
+        read_authors,
+        resolve_import_format,
+    )
+    from pisaka.config.cli.authors_utils import repr_rejected_rows_as_table
+    from pisaka.platform.security.authentication.cli import authenticate_cli
+
+    try:
+        resolved_import_format = resolve_import_format(file.name, import_format)
+    except ValueError as err:
+        print(f"[red]{err}[/red]")
+        raise Exit(code=2) from err
+
+    async def main(ctx: aioinject.InjectionContext) -> None:
+        import_authors_command = await ctx.resolve(ImportAuthorsCommand)
+        authentication = authenticate_cli()
+        imported = 0
+        rejected: list[RejectedRow] = []
+        started_at = time.perf_counter()
+
+        def _parsed_rows(lines: Iterable[str]) -> Iterator[ParsedRow]:
+            for parsed_row in read_authors(lines, resolved_import_format):
+                if isinstance(parsed_row, RejectedRow):
+                    rejected.append(parsed_row)
+                else:
+                    yield parsed_row
+
+        with (
+            file.open(newline="", encoding="utf-8") as lines,
+            Progress(
+                SpinnerColumn(),
+                TextColumn("{task.description}"),
+                TimeElapsedColumn(),
+            ) as progress,
+        ):
+            task = progress.add_task("Importing")
+            parsed_rows = _parsed_rows(lines)
+            while batch := list(islice(parsed_rows, batch_size)):
+                conflicts = await import_authors_command.execute(
+                    [parsed_row.row for parsed_row in batch],
+                    agent=authentication.agent,
+                )
+                for index, reason in conflicts:
+                    rejected.append(RejectedRow(line=batch[index].line, reason=reason))
+                imported += len(batch) - len(conflicts)
+                rows_per_sec = imported / (time.perf_counter() - started_at)
+                progress.update(
+                    task,
+                    description=(
+                        f"Imported {imported:,} rows ({rows_per_sec:,.0f} rows/s), "
+                        f"rejected {len(rejected):,}"
+                    ),
+                )
+
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"Imported {imported:,} authors in {elapsed:.1f} s "
+            f"({imported / elapsed:,.0f} rows/s), rejected {len(rejected):,} rows",
+        )
+        if rejected:
+            print(repr_rejected_rows_as_table(rejected, "Rejected rows"))
+        if rejected_file is not None:
+            with rejected_file.open("w", encoding="utf-8") as output:
+                output.writelines(
+                    json.dumps({"line": row.line, "reason": row.reason}) + "\n"
+                    for row in rejected
+                )
+
+    _run(main)
+
+
 @cli.command()
 def update(
     author_id: Annotated[UUID, Argument(help="ID автора", show_default=False)],
@@ -97,6 +213,54 @@ def update(
     _run(main)
 
 
+@cli.command()
+def rebuild_stats(
+    *,
+    check: Annotated[
+        bool,
+        Option("--check", is_flag=True, help="Только проверить, ничего не менять"),
+    ] = False,
+) -> None:
+    """Пересчитать статистику авторов.
+
+    Заново считает количество статей и черновиков в работе у каждого автора
+    и сравнивает с сохраненными счетчиками. Расхождения исправляются,
+    если не указан флаг --check.
+    """
+    from rich.table import Table
+
+    from pisaka.app.articles.commands import RebuildAuthorStatsCommand
+    from pisaka.platform.security.authentication.cli import authenticate_cli
+
+    async def main(ctx: aioinject.InjectionContext) -> None:
+        rebuild_author_stats_command = await ctx.resolve(RebuildAuthorStatsCommand)
+        authentication = authenticate_cli()
+        mismatches = await rebuild_author_stats_command.execute(
+            dry_run=check,
+            agent=authentication.agent,
+        )
+        if not mismatches:
+            print("Author stats are consistent")
+            return
+        table = Table(
+            "Author ID",
+            "Articles (expected / actual)",
+            "Drafts in work (expected / actual)",
+            title="Found mismatches" if check else "Fixed mismatches",
+        )
+        for mismatch in mismatches:
+            table.add_row(
+                str(mismatch.author_id),
+                f"{mismatch.expected_count_of_articles} / {mismatch.actual_count_of_articles}",
+                f"{mismatch.expected_count_of_article_drafts_in_work} / {mismatch.actual_count_of_article_drafts_in_work}",
+            )
+        print(table)
+        if check:
+            raise Exit(code=1)
+
+    _run(main)
+
+
 def _run_in_container(
     container: aioinject.Container,
     fn: Callable[[aioinject.InjectionContext], Awaitable[None]],
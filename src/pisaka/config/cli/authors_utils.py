@@ -4,6 +4,7 @@
 from rich.table import Table
 
 from pisaka.app.authors import Author
+from pisaka.app.authors.importing import RejectedRow
 
 
 def repr_author_as_table(author: Author, title: str) -> Table:
@@ -14,3 +15,16 @@ def repr_author_as_table(author: Author, title: str) -> Table:
     table.add_row("Name", author.name)
     table.add_row("Is real person?", str(author.is_real_person))
     return table
+
+
+def repr_rejected_rows_as_table(
+    rejected_rows: list[RejectedRow],
+    title: str,
+    limit: int = 20,
+) -> Table:
+    table = Table("Line", "Reason", title=title)
+    for rejected_row in rejected_rows[:limit]:
+        table.add_row(str(rejected_row.line), rejected_row.reason)
+    if len(rejected_rows) > limit:
+        table.add_row("...", f"and {len(rejected_rows) - limit} more")
+    return table
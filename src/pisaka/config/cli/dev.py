@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from typer import Option, Typer
+from typer import Exit, Option, Typer
 
 cli = Typer(
     no_args_is_help=True,
@@ -32,6 +32,55 @@ def init_db() -> None:
         pisaka.platform.db.DBModel.metadata.create_all(bind=engine)
 
 
+@cli.command()
+def explain() -> None:
+    """Проверить планы частых запросов.
+
+    Прогоняет частые запросы всех модулей через EXPLAIN QUERY PLAN
+    и выводит их планы. Завершается с ошибкой, если какой-то запрос
+    читает таблицу целиком, то есть ему не хватает индекса.
+
+    Работает только с SQLite. Структура таблиц берется из текущей БД,
+    так что после изменения индексов ее нужно пересоздать
+    """
+    from rich import print
+    from rich.markup import escape
+    from sqlalchemy import Engine
+
+    from pisaka.app.articles.hot_queries import HOT_QUERIES as ARTICLES_HOT_QUERIES
+    from pisaka.app.authors.hot_queries import HOT_QUERIES as AUTHORS_HOT_QUERIES
+    from pisaka.config.config_files import load_config
+    from pisaka.config.di import create_base_di_container
+    from pisaka.platform.logging import init_logging
+    from pisaka.platform.query_plan import explain_query_plan
+
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config=config)
+    with container, container.sync_context() as ctx:
+        engine: Engine = ctx.resolve(Engine)
+        if engine.dialect.name != "sqlite":
+            print(f"[red]Only SQLite is supported, got {engine.dialect.name}[/red]")
+            raise Exit(code=2)
+        with engine.connect() as connection:
+            plans = [
+                explain_query_plan(connection, query)
+                for query in [*AUTHORS_HOT_QUERIES, *ARTICLES_HOT_QUERIES]
+            ]
+
+    for plan in plans:
+        status = "[red]FULL SCAN[/red]" if plan.full_scans else "[green]OK[/green]"
+        print(f"{status} {escape(plan.query.name)}")
+        for step in plan.steps:
+            print(f"    {escape(step)}")
+
+    failed = [plan for plan in plans if plan.full_scans]
+    if failed:
+        print(f"[red]{len(failed)} of {len(plans)} queries do full table scans[/red]")
+        raise Exit(code=1)
+    print(f"[green]All {len(plans)} queries use indexes[/green]")
+
+
 @cli.command()
 def jwt() -> None:
     """Создать тестовый JWT."""
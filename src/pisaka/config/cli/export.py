@@ -0,0 +1,227 @@
+# Старайтесь делать здесь как можно меньше импортов, чтобы приложение
+# запускалось быстрее. Если каким-то командам не хватает импортов,
+# то они должны делать их локально у себя
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any
+
+import aioinject
+import anyio
+from typer import Option, Typer
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+
+cli = Typer(
+    no_args_is_help=True,
+    short_help="Выгрузка данных",
+    help="Потоковая выгрузка таблиц в NDJSON или CSV, например для аналитики",
+)
+
+ExportFormatOption = Annotated[
+    str,
+    Option("--format", help="ndjson или csv"),
+]
+OutputOption = Annotated[
+    Path | None,
+    Option(
+        "--output",
+        "-o",
+        help="Файл для выгрузки, по умолчанию stdout",
+        dir_okay=False,
+        show_default=False,
+    ),
+]
+GzipOption = Annotated[
+    bool,
+    Option("--gzip", is_flag=True, help="Сжать вывод gzip"),
+]
+BatchSizeOption = Annotated[
+    int,
+    Option(min=1, help="Сколько строк читать из БД за раз"),
+]
+
+
+@cli.command()
+def authors(
+    *,
+    export_format: ExportFormatOption = "ndjson",
+    output: OutputOption = None,
+    compress: GzipOption = False,
+    batch_size: BatchSizeOption = 10_000,
+) -> None:
+    """Выгрузить авторов."""
+    from sqlalchemy import select
+
+    from pisaka.app.authors import AuthorModel
+
+    _export(
+        query=select(
+            AuthorModel.id,
+            AuthorModel.name,
+            AuthorModel.is_real_person,
+        ).order_by(AuthorModel.id),
+        fieldnames=["id", "name", "is_real_person"],
+        export_format=export_format,
+        output=output,
+        compress=compress,
+        batch_size=batch_size,
+    )
+
+
+@cli.command()
+def articles(
+    *,
+    export_format: ExportFormatOption = "ndjson",
+    output: OutputOption = None,
+    compress: GzipOption = False,
+    batch_size: BatchSizeOption = 10_000,
+) -> None:
+    """Выгрузить опубликованные статьи."""
+    from sqlalchemy import select
+
+    from pisaka.app.articles.db import ArticleModel
+
+    _export(
+        query=select(
+            ArticleModel.id,
+            ArticleModel.article_draft_id,
+            ArticleModel.author_id,
+            ArticleModel.headline,
+            ArticleModel.slug,
+            ArticleModel.content,
+            ArticleModel.disproof,
+            ArticleModel.published_at,
+        ).order_by(ArticleModel.id),
+        fieldnames=[
+            "id",
+            "article_draft_id",
+            "author_id",
+            "headline",
+            "slug",
+            "content",
+            "disproof",
+            "published_at",
+        ],
+        export_format=export_format,
+        output=output,
+        compress=compress,
+        batch_size=batch_size,
+    )
+
+
+@cli.command()
+def article_drafts(
+    *,
+    export_format: ExportFormatOption = "ndjson",
+    output: OutputOption = None,
+    compress: GzipOption = False,
+    batch_size: BatchSizeOption = 10_000,
+) -> None:
+    """Выгрузить черновики статей вместе с редакторами."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from pisaka.app.articles.db import ArticleDraftModel
+
+    # Редакторы подгружаются отдельным запросом на каждую пачку черновиков,
+    # так что в памяти одновременно только одна пачка
+    _export(
+        query=select(ArticleDraftModel)
+        .options(selectinload(ArticleDraftModel.editors))
+        .order_by(ArticleDraftModel.id),
+        fieldnames=[
+            "id",
+            "is_published",
+            "author_id",
+            "headline",
+            "slug",
+            "auto_slug",
+            "content",
+            "editors",
+        ],
+        export_format=export_format,
+        output=output,
+        compress=compress,
+        batch_size=batch_size,
+        to_row=lambda row: (
+            row[0].id,
+            row[0].is_published,
+            row[0].author_id,
+            row[0].headline,
+            row[0].slug,
+            row[0].auto_slug,
+            row[0].content,
+            [editor.user_id for editor in row[0].editors],
+        ),
+    )
+
+
+def _export(
+    *,
+    query: "Select[Any]",
+    fieldnames: Sequence[str],
+    export_format: str,
+    output: Path | None,
+    compress: bool,
+    batch_size: int,
+    to_row: Callable[[Any], Sequence[Any]] | None = None,
+) -> None:
+    import sys
+    import time
+
+    from rich.console import Console
+
+    from pisaka.config.cli.export_utils import (
+        create_record_writer,
+        open_output,
+        resolve_export_format,
+    )
+    from pisaka.platform.db import ReadOnlyAsyncSession
+
+    resolved_export_format = resolve_export_format(export_format)
+    # В stdout идут сами данные, поэтому служебный вывод только в stderr
+    console = Console(stderr=True)
+
+    async def main(ctx: aioinject.InjectionContext) -> None:
+        session = await ctx.resolve(ReadOnlyAsyncSession)
+        exported = 0
+        started_at = time.perf_counter()
+        with open_output(output, compress=compress) as stream:
+            writer = create_record_writer(stream, resolved_export_format, fieldnames)
+            result = await session.stream(
+                query.execution_options(yield_per=batch_size),
+            )
+            # partitions() объявлен как корутина, хотя на деле это асинхронный генератор
+            async for partition in result.partitions():  # type: ignore[attr-defined]
+                writer.write_many(
+                    map(to_row, partition) if to_row is not None else partition,
+                )
+                exported += len(partition)
+                # Сессия больше не нужна загруженным объектам, а identity map
+                # иначе растет вместе с размером таблицы
+                session.expunge_all()
+        elapsed = time.perf_counter() - started_at
+        console.print(
+            f"Exported {exported:,} rows in {elapsed:.1f} s "
+            f"({exported / elapsed:,.0f} rows/s)",
+        )
+        sys.stderr.flush()
+
+    _run(main)
+
+
+def _run(fn: Callable[[aioinject.InjectionContext], Awaitable[None]]) -> None:
+    from pisaka.config.config_files import load_config
+    from pisaka.config.di import create_base_di_container
+    from pisaka.platform.logging import init_logging
+
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config=config)
+
+    async def main() -> None:
+        async with container, container.context() as ctx:
+            await fn(ctx)
+
+    anyio.run(main)
@@ -0,0 +1,125 @@
+# Этот модуль должен быть импортирован не в момент инициализации приложения,
+# а в момент выполнения CLI команды, так что скорость импортов нам здесь
+# уже не важна
+import csv
+import gzip
+import io
+import json
+import logging
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Literal, Protocol, TextIO, cast
+
+ExportFormat = Literal["ndjson", "csv"]
+
+_BUFFER_SIZE = 1024 * 1024
+
+
+class RecordWriter(Protocol):
+    # Строки передаются кортежами в порядке fieldnames
+    def write_many(self, rows: Iterable[Sequence[Any]]) -> None: ...
+
+
+@contextmanager
+def open_output(path: Path | None, *, compress: bool) -> Iterator[TextIO]:
+    # Без path пишем в stdout. Вывод буферизуется крупными блоками,
+    # чтобы не делать системный вызов на каждую строку
+    raw: IO[bytes]
+    if path is None:
+        _redirect_stdout_logging_to_stderr()
+        raw = sys.stdout.buffer
+        close_raw = False
+    else:
+        raw = io.BufferedWriter(io.FileIO(path, "w"), buffer_size=_BUFFER_SIZE)
+        close_raw = True
+    binary: IO[bytes] = (
+        cast(IO[bytes], gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6))
+        if compress
+        else raw
+    )
+    output = io.TextIOWrapper(
+        binary,
+        encoding="utf-8",
+        newline="",
+        write_through=False,
+    )
+    try:
+        yield output
+    finally:
+        output.flush()
+        output.detach()
+        if compress:
+            binary.close()
+        if close_raw:
+            raw.close()
+        else:
+            raw.flush()
+
+
+def _redirect_stdout_logging_to_stderr() -> None:
+    # Логи в stdout перемешались бы с выгружаемыми данными
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            if (
+                isinstance(handler, logging.StreamHandler)
+                and handler.stream is sys.stdout
+            ):
+                handler.setStream(sys.stderr)
+
+
+def resolve_export_format(export_format: str) -> ExportFormat:
+    if export_format == "ndjson":
+        return "ndjson"
+    if export_format == "csv":
+        return "csv"
+    raise ValueError(f"Unknown export format: {export_format}")
+
+
+def create_record_writer(
+    output: TextIO,
+    export_format: ExportFormat,
+    fieldnames: Sequence[str],
+) -> RecordWriter:
+    if export_format == "csv":
+        return _CSVRecordWriter(output, fieldnames)
+    return _NDJSONRecordWriter(output, fieldnames)
+
+
+class _NDJSONRecordWriter:
+    def __init__(self, output: TextIO, fieldnames: Sequence[str]) -> None:
+        self._output = output
+        self._fieldnames = fieldnames
+        self._encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+
+    def write_many(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._output.writelines(
+            self._encoder.encode(dict(zip(self._fieldnames, row, strict=True))) + "\n"
+            for row in rows
+        )
+
+
+class _CSVRecordWriter:
+    def __init__(self, output: TextIO, fieldnames: Sequence[str]) -> None:
+        self._writer = csv.writer(output)
+        self._writer.writerow(fieldnames)
+
+    def write_many(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._writer.writerows([_to_csv_value(value) for value in row] for row in rows)
+
+
+def _to_csv_value(value: Any) -> Any:  # noqa: ANN401
+    # Формат значений совместим с `pisaka authors import`
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    if value is None:
+        return ""
+    return value
@@ -2,20 +2,49 @@ from dynaconf import Dynaconf  # type:ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict, ValidationError
 
 from pisaka.platform.logging import LoggingConfig
+from pisaka.platform.sqlite import SQLiteProfile
+
+
+class DBPool(BaseModel):
+    size: int = 5
+    max_overflow: int = 10
+    recycle_sec: int = -1
+    pre_ping: bool = False
+    timeout_sec: float = 30
+    warm_up: bool = True
+
+
+class DBWriteQueue(BaseModel):
+    # Режим одного писателя для SQLite, см. pisaka.platform.write_queue
+    enabled: bool = False
+    max_size: int = 1000
+    max_batch_size: int = 32
+    # Сколько писатель ждет завершения одной транзакции команды
+    turn_timeout_sec: float = 30
 
 
 class DB(BaseModel):
     url_sync: str
     url_async: str
+    # Реплика только для чтения. Если не задана, читающие сессии
+    # работают с основной БД
+    read_replica_url_async: str | None = None
+    pool: DBPool = DBPool()
+    write_queue: DBWriteQueue = DBWriteQueue()
+    # Применяется только к SQLite, для других СУБД игнорируется
+    sqlite: SQLiteProfile | None = None
 
 
 class JWT(BaseModel):
     private_key: str
-    public_key: str
+    public_key: str | None = None
+    jwks_file: str | None = None
+    jwks_reload_interval_sec: float = 60
     audience: str
     issuer: str
     algorithm: str
     leeway_sec: int
+    token_cache_size: int = 10_000
 
 
 class API(BaseModel):
@@ -30,6 +59,17 @@ class Security(BaseModel):
     agent_name_admin_panel: str
 
 
+class Cache(BaseModel):
+    max_size: int
+    ttl_sec: float
+
+
+class Caches(BaseModel):
+    default_author: Cache = Cache(max_size=10_000, ttl_sec=300)
+    article_page: Cache = Cache(max_size=10_000, ttl_sec=60)
+    authors_list_snapshot: Cache = Cache(max_size=1_000, ttl_sec=300)
+
+
 class Config(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -38,6 +78,7 @@ class Config(BaseModel):
     api: API
     internal_api: InternalAPI
     security: Security
+    caches: Caches = Caches()
 
 
 def load_raw_config() -> Dynaconf:
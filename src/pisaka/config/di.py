@@ -1,5 +1,6 @@
 from collections.abc import AsyncIterator, Iterator
 from contextlib import asynccontextmanager, contextmanager
+from typing import Any
 
 import aioinject
 
@@ -10,6 +11,7 @@ def create_base_di_container(config: Config) -> aioinject.Container:
     container = aioinject.Container()
     container.register(aioinject.Object(container, aioinject.Container))
     container.register(aioinject.Object(config))
+    _register_db_engines(container)
     _register_db(container)
     _register_security(container)
     _register_authors(container)
@@ -17,23 +19,111 @@ def create_base_di_container(config: Config) -> aioinject.Container:
     return container
 
 
-def _register_db(container: aioinject.Container) -> None:
+def _register_db_engines(container: aioinject.Container) -> None:
     from sqlalchemy import Engine, create_engine
-    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-    from sqlalchemy.orm import Session
+    from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+    from pisaka.platform.db import DBPoolWarmer, ReadOnlyAsyncEngine
+    from pisaka.platform.sqlite import (
+        apply_sqlite_profile,
+        use_explicit_sqlite_transactions,
+    )
+
+    def _pool_options(config: Config, poolclass: type[Pool]) -> dict[str, Any]:
+        # Пул задается явно: иначе aiosqlite по умолчанию получает NullPool,
+        # то есть новое соединение на каждую сессию
+        return {
+            "poolclass": poolclass,
+            "pool_size": config.db.pool.size,
+            "max_overflow": config.db.pool.max_overflow,
+            "pool_recycle": config.db.pool.recycle_sec,
+            "pool_pre_ping": config.db.pool.pre_ping,
+            "pool_timeout": config.db.pool.timeout_sec,
+        }
 
     @contextmanager
     def _create_engine(config: Config) -> Iterator[Engine]:
-        engine = create_engine(url=config.db.url_sync)
+        engine = create_engine(
+            url=config.db.url_sync,
+            **_pool_options(config, QueuePool),
+        )
+        use_explicit_sqlite_transactions(engine)
+        if config.db.sqlite is not None:
+            apply_sqlite_profile(engine, config.db.sqlite)
         yield engine
         engine.dispose()
 
+    def _make_async_engine(config: Config, url: str) -> AsyncEngine:
+        engine = create_async_engine(
+            url=url,
+            **_pool_options(config, AsyncAdaptedQueuePool),
+        )
+        use_explicit_sqlite_transactions(engine.sync_engine)
+        if config.db.sqlite is not None:
+            apply_sqlite_profile(engine.sync_engine, config.db.sqlite)
+        return engine
+
     @asynccontextmanager
     async def _create_async_engine(config: Config) -> AsyncIterator[AsyncEngine]:
-        engine = create_async_engine(url=config.db.url_async)
+        engine = _make_async_engine(config, config.db.url_async)
         yield engine
         await engine.dispose()
 
+    @asynccontextmanager
+    async def _create_read_only_async_engine(
+        config: Config,
+        engine: AsyncEngine,
+    ) -> AsyncIterator[ReadOnlyAsyncEngine]:
+        if config.db.read_replica_url_async is None:
+            yield ReadOnlyAsyncEngine(engine=engine)
+            return
+        replica_engine = _make_async_engine(config, config.db.read_replica_url_async)
+        yield ReadOnlyAsyncEngine(engine=replica_engine)
+        await replica_engine.dispose()
+
+    def _create_db_pool_warmer(
+        config: Config,
+        engine: AsyncEngine,
+        read_only_engine: ReadOnlyAsyncEngine,
+    ) -> DBPoolWarmer:
+        return DBPoolWarmer(
+            engine=engine,
+            read_only_engine=read_only_engine,
+            connections=config.db.pool.size if config.db.pool.warm_up else 0,
+        )
+
+    container.register(aioinject.Singleton(_create_engine))
+    container.register(aioinject.Singleton(_create_async_engine))
+    container.register(aioinject.Singleton(_create_read_only_async_engine))
+    container.register(aioinject.Singleton(_create_db_pool_warmer))
+
+
+def _register_db(container: aioinject.Container) -> None:
+    from sqlalchemy import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+    from sqlalchemy.orm import Session
+
+    from pisaka.platform.db import ReadOnlyAsyncEngine, ReadOnlyAsyncSession
+    from pisaka.platform.versions import CollectionVersionService
+    from pisaka.platform.write_queue import WriteQueue
+
+    @asynccontextmanager
+    async def _create_write_queue(
+        config: Config,
+        engine: AsyncEngine,
+    ) -> AsyncIterator[WriteQueue]:
+        write_queue = WriteQueue(
+            engine=engine,
+            enabled=config.db.write_queue.enabled,
+            max_size=config.db.write_queue.max_size,
+            max_batch_size=config.db.write_queue.max_batch_size,
+            turn_timeout_sec=config.db.write_queue.turn_timeout_sec,
+        )
+        await write_queue.start()
+        yield write_queue
+        await write_queue.stop()
+
     @contextmanager
     def _create_session(engine: Engine) -> Iterator[Session]:
         with Session(bind=engine, expire_on_commit=False) as session:
@@ -44,10 +134,22 @@ def _register_db(container: aioinject.Container) -> None:
         async with AsyncSession(bind=engine, expire_on_commit=False) as session:
             yield session
 
-    container.register(aioinject.Singleton(_create_engine))
-    container.register(aioinject.Singleton(_create_async_engine))
+    @asynccontextmanager
+    async def _create_read_only_async_session(
+        read_only_engine: ReadOnlyAsyncEngine,
+    ) -> AsyncIterator[ReadOnlyAsyncSession]:
+        async with ReadOnlyAsyncSession(
+            bind=read_only_engine.engine,
+            autoflush=False,
+            expire_on_commit=False,
+        ) as session:
+            yield session
+
+    container.register(aioinject.Singleton(_create_write_queue))
     container.register(aioinject.Scoped(_create_session))
     container.register(aioinject.Scoped(_create_async_session))
+    container.register(aioinject.Scoped(_create_read_only_async_session))
+    container.register(aioinject.Scoped(CollectionVersionService))
 
 
 def _register_security(container: aioinject.Container) -> None:
@@ -56,21 +158,59 @@ def _register_security(container: aioinject.Container) -> None:
         AlmightyTestsPermission,
     )
 
-    container.register(aioinject.Scoped(AlmightyLocalCliPermission))
-    container.register(aioinject.Scoped(AlmightyTestsPermission))
+    # Привилегии не хранят состояния запроса, поэтому создаются один раз
+    # на приложение. Зависеть от сессии или команд им нельзя, это проверяет
+    # validate_and_warm_up_container при старте API
+    container.register(aioinject.Singleton(AlmightyLocalCliPermission))
+    container.register(aioinject.Singleton(AlmightyTestsPermission))
 
 
 def _register_authors(container: aioinject.Container) -> None:
     from pisaka.app.authors import (
         AuthorRepository,
+        AuthorStatsService,
         CreateAuthorCommand,
         DefaultAuthorService,
         DeleteAuthorCommand,
+        ImportAuthorsCommand,
+        ReadOnlyAuthorRepository,
         ResetDefaultAuthorCommand,
         SetDefaultAuthorCommand,
         UpdateAuthorCommand,
     )
     from pisaka.app.authors.security import EditAuthorsPermission, ListAuthorsPermission
+    from pisaka.app.authors.services import DefaultAuthorCache
+    from pisaka.app.authors.snapshots import (
+        AuthorsListSnapshotCache,
+        AuthorsListSnapshotService,
+    )
+    from pisaka.platform.db import ReadOnlyAsyncEngine
+
+    def _create_default_author_cache(config: Config) -> DefaultAuthorCache:
+        return DefaultAuthorCache(
+            max_size=config.caches.default_author.max_size,
+            ttl_sec=config.caches.default_author.ttl_sec,
+        )
+
+    def _create_authors_list_snapshot_cache(
+        config: Config,
+    ) -> AuthorsListSnapshotCache:
+        return AuthorsListSnapshotCache(
+            max_size=config.caches.authors_list_snapshot.max_size,
+            ttl_sec=config.caches.authors_list_snapshot.ttl_sec,
+        )
+
+    @asynccontextmanager
+    async def _create_authors_list_snapshot_service(
+        authors_list_snapshot_cache: AuthorsListSnapshotCache,
+        read_only_engine: ReadOnlyAsyncEngine,
+    ) -> AsyncIterator[AuthorsListSnapshotService]:
+        service = AuthorsListSnapshotService(
+            authors_list_snapshot_cache=authors_list_snapshot_cache,
+            read_only_engine=read_only_engine,
+        )
+        yield service
+        await service.stop()
 
     def _create_list_authors_permission(config: Config) -> ListAuthorsPermission:
         return ListAuthorsPermission(
@@ -78,35 +218,60 @@ def _register_authors(container: aioinject.Container) -> None:
         )
 
     container.register(aioinject.Scoped(AuthorRepository))
+    container.register(aioinject.Scoped(ReadOnlyAuthorRepository))
     container.register(aioinject.Scoped(CreateAuthorCommand))
     container.register(aioinject.Scoped(UpdateAuthorCommand))
     container.register(aioinject.Scoped(DeleteAuthorCommand))
+    container.register(aioinject.Scoped(ImportAuthorsCommand))
+    container.register(aioinject.Singleton(_create_default_author_cache))
+    container.register(aioinject.Singleton(_create_authors_list_snapshot_cache))
+    container.register(aioinject.Singleton(_create_authors_list_snapshot_service))
     container.register(aioinject.Scoped(DefaultAuthorService))
+    container.register(aioinject.Scoped(AuthorStatsService))
     container.register(aioinject.Scoped(SetDefaultAuthorCommand))
     container.register(aioinject.Scoped(ResetDefaultAuthorCommand))
-    container.register(aioinject.Scoped(_create_list_authors_permission))
-    container.register(aioinject.Scoped(EditAuthorsPermission))
+    container.register(aioinject.Singleton(_create_list_authors_permission))
+    container.register(aioinject.Singleton(EditAuthorsPermission))
 
 
 def _register_articles(container: aioinject.Container) -> None:
     from pisaka.app.articles.commands import (
         CreateArticleDraftCommand,
+        DeleteArticleDraftCommand,
+        DisproveArticleCommand,
         PublishArticleCommand,
+        RebuildAuthorStatsCommand,
+        RebuildSearchIndexCommand,
         UpdateArticleDraftHeadlineCommand,
     )
     from pisaka.app.articles.repositories import (
         ArticleDraftRepository,
         ArticleRepository,
     )
+    from pisaka.app.articles.search import ReadOnlySearchIndex, SearchIndex
     from pisaka.app.articles.security import (
         ListArticleDraftsPermission,
         PublishArticlePermission,
     )
+    from pisaka.app.articles.services import ArticlePageCache
+
+    def _create_article_page_cache(config: Config) -> ArticlePageCache:
+        return ArticlePageCache(
+            max_size=config.caches.article_page.max_size,
+            ttl_sec=config.caches.article_page.ttl_sec,
+        )
 
     container.register(aioinject.Scoped(CreateArticleDraftCommand))
     container.register(aioinject.Scoped(UpdateArticleDraftHeadlineCommand))
     container.register(aioinject.Scoped(PublishArticleCommand))
+    container.register(aioinject.Scoped(DeleteArticleDraftCommand))
+    container.register(aioinject.Scoped(DisproveArticleCommand))
+    container.register(aioinject.Scoped(RebuildAuthorStatsCommand))
+    container.register(aioinject.Scoped(RebuildSearchIndexCommand))
     container.register(aioinject.Scoped(ArticleRepository))
     container.register(aioinject.Scoped(ArticleDraftRepository))
-    container.register(aioinject.Scoped(ListArticleDraftsPermission))
-    container.register(aioinject.Scoped(PublishArticlePermission))
+    container.register(aioinject.Singleton(_create_article_page_cache))
+    container.register(aioinject.Scoped(SearchIndex))
+    container.register(aioinject.Scoped(ReadOnlySearchIndex))
+    container.register(aioinject.Singleton(ListArticleDraftsPermission))
+    container.register(aioinject.Singleton(PublishArticlePermission))
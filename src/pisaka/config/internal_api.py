@@ -5,6 +5,11 @@ from pisaka.config.config_files import Config, load_config
 from pisaka.config.di import create_base_di_container
 from pisaka.platform.logging import init_logging
 from pisaka.platform.security.authentication.common import JWTAuthenticationOptions
+from pisaka.platform.security.authentication.key_ring import (
+    SigningKeyRing,
+    create_signing_key_ring,
+)
+from pisaka.platform.security.authentication.token_cache import VerifiedTokenCache
 
 
 def internal_api_app() -> ASGIApp:
@@ -17,12 +22,29 @@ def internal_api_app() -> ASGIApp:
     def _create_jwt_authentication_options(config: Config) -> JWTAuthenticationOptions:
         return JWTAuthenticationOptions(
             public_key=config.internal_api.jwt_authentication.public_key,
+            jwks_file=config.internal_api.jwt_authentication.jwks_file,
+            jwks_reload_interval_sec=config.internal_api.jwt_authentication.jwks_reload_interval_sec,
             audience=config.internal_api.jwt_authentication.audience,
             issuer=config.internal_api.jwt_authentication.issuer,
             algorithm=config.internal_api.jwt_authentication.algorithm,
             leeway_sec=config.internal_api.jwt_authentication.leeway_sec,
+            token_cache_size=config.internal_api.jwt_authentication.token_cache_size,
         )
 
+    def _create_verified_token_cache(
+        options: JWTAuthenticationOptions,
+    ) -> VerifiedTokenCache:
+        return VerifiedTokenCache(max_size=options.token_cache_size)
+
     container = create_base_di_container(config=config)
     container.register(aioinject.Singleton(_create_jwt_authentication_options))
+    # Ключи разбираются сразу при старте, чтобы ошибка в конфиге
+    # не дожидалась первого запроса
+    container.register(
+        aioinject.Object(
+            create_signing_key_ring(_create_jwt_authentication_options(config)),
+            SigningKeyRing,
+        ),
+    )
+    container.register(aioinject.Singleton(_create_verified_token_cache))
     return create_app(container=container)
@@ -1,7 +1,10 @@
 from collections.abc import Iterable
+from functools import cache
 from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class BaseSchema(BaseModel):
@@ -9,4 +12,27 @@ class BaseSchema(BaseModel):
 
     @classmethod
     def model_validate_list(cls, objs: Iterable[Any]) -> list[Self]:
-        return [cls.model_validate(obj=obj) for obj in objs]
+        # Весь список проверяется одним вызовом в pydantic-core, без перехода
+        # в Python на каждый элемент
+        adapter: TypeAdapter[list[Self]] = _list_adapter(cls)
+        return adapter.validate_python(
+            objs if isinstance(objs, list) else list(objs),
+            from_attributes=True,
+        )
+
+
+@cache
+def _list_adapter(schema: type[BaseSchema]) -> TypeAdapter[list[Any]]:
+    # Построение TypeAdapter дорогое, поэтому он создается один раз на схему
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+class SchemaResponse(JSONResponse):
+    # Ответ, который сериализуется сразу в pydantic-core, минуя
+    # jsonable_encoder и json.dumps. Если эндпоинт возвращает его сам,
+    # FastAPI не проверяет результат повторно по response_model, поэтому
+    # так стоит отдавать только схемы, собранные самим эндпоинтом
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode()
+        return pydantic_core.to_json(content, by_alias=True)
@@ -0,0 +1,88 @@
+import enum
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Final, Generic, Literal, TypeVar
+
+# Простой in-process кэш с ограничением по размеру (LRU) и по времени жизни
+# записей. Кэш живет внутри одного процесса, поэтому явная инвалидация
+# не видна другим воркерам, и для них время жизни записи это верхняя граница
+# того, насколько устаревшие данные они могут отдать
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class Missing(enum.Enum):
+    MISSING = enum.auto()
+
+
+MISSING: Final = Missing.MISSING
+
+
+@dataclass(frozen=True, kw_only=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl_sec: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl_sec = ttl_sec
+        self._clock = clock
+        self._entries: OrderedDict[KeyT, tuple[float, ValueT]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: KeyT) -> ValueT | Literal[Missing.MISSING]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return MISSING
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(
+        self,
+        key: KeyT,
+        value: ValueT,
+        expires_at: float | None = None,
+    ) -> None:
+        # expires_at по часам кэша задает время жизни конкретной записи,
+        # если оно известно заранее, например exp токена
+        now = self._clock()
+        if expires_at is None:
+            expires_at = now + self._ttl_sec
+        if self._max_size <= 0 or expires_at <= now:
+            return
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: KeyT) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+        )
@@ -1,5 +1,72 @@
-from sqlalchemy.orm import DeclarativeBaseNoMeta
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import DeclarativeBaseNoMeta, Session
 
 
 class DBModel(DeclarativeBaseNoMeta):
     pass
+
+
+# Сессия только для чтения. Используется в эндпоинтах и проверках, которые
+# ничего не меняют: они не должны брать блокировки строк (SELECT ... FOR UPDATE)
+# и не должны случайно что-то записать. Отдельный тип нужен еще и для DI,
+# чтобы читающий код явно запрашивал именно такую сессию
+
+
+class ReadOnlySessionError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Read-only session can not flush changes")
+
+
+class ReadOnlySession(Session):
+    def flush(self, objects: Sequence[Any] | None = None) -> None:
+        if self.new or self.dirty or self.deleted:
+            raise ReadOnlySessionError
+        super().flush(objects)
+
+
+class ReadOnlyAsyncSession(AsyncSession):
+    sync_session_class = ReadOnlySession
+
+
+@dataclass(frozen=True)
+class ReadOnlyAsyncEngine:
+    # Движок для читающих сессий: реплика, если она настроена, иначе основной.
+    # Обертка нужна, чтобы DI различал его и основной AsyncEngine
+    engine: AsyncEngine
+
+
+class DBPoolWarmer:
+    # Заранее открывает соединения в пулах, чтобы первые запросы после деплоя
+    # не платили за установку соединений
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        read_only_engine: ReadOnlyAsyncEngine,
+        connections: int,
+    ) -> None:
+        self._engines = [engine]
+        if read_only_engine.engine is not engine:
+            self._engines.append(read_only_engine.engine)
+        self._connections = connections
+
+    async def warm_up(self) -> None:
+        await asyncio.gather(
+            *(
+                self._check_connection(engine)
+                for engine in self._engines
+                for _ in range(self._connections)
+            ),
+        )
+
+    @staticmethod
+    async def _check_connection(engine: AsyncEngine) -> None:
+        # Соединения открываются параллельно, поэтому пул держит их все
+        # одновременно и после закрытия оставляет у себя
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
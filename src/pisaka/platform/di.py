@@ -0,0 +1,120 @@
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Final, ParamSpec, TypeVar
+
+import aioinject
+from aioinject import Provider
+from aioinject.ext import fastapi as aioinject_fastapi
+from aioinject.providers import Dependency, DependencyLifetime, collect_dependencies
+from aioinject.validation import DEFAULT_VALIDATORS, validate_container
+from aioinject.validation.error import (
+    ContainerValidationError,
+    ContainerValidationErrorGroup,
+    DependencyNotFoundError,
+)
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+
+# Граф зависимостей всех эндпоинтов проверяется при старте приложения,
+# а не первым запросом:
+# - у всех зависимостей эндпоинтов должны быть провайдеры, а синглтоны
+#   не должны зависеть от провайдеров с меньшим временем жизни (сессия,
+#   команды);
+# - aioinject заранее разбирает аннотации всех провайдеров, на первом
+#   запросе это заметно дорого;
+# - создаются все синглтоны, которые понадобятся эндпоинтам.
+# Ошибка в графе зависимостей роняет старт, а не отдельный запрос.
+#
+# Сами зависимости на запросе по-прежнему разрешает aioinject
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+_logger = logging.getLogger(__name__)
+
+# aioinject убирает Inject аннотации из обработчика, чтобы их не увидел
+# FastAPI, поэтому зависимости запоминаются до декорирования
+_DEPENDENCIES_ATTR: Final[str] = "__pisaka_di_dependencies__"
+
+
+def inject(function: Callable[_P, _T]) -> Callable[_P, _T]:
+    dependencies = tuple(collect_dependencies(function))
+    wrapper = aioinject_fastapi.inject(function)
+    setattr(wrapper, _DEPENDENCIES_ATTR, dependencies)
+    return wrapper
+
+
+def collect_endpoint_dependencies(
+    routes: Iterable[BaseRoute],
+) -> dict[str, tuple[Dependency[object], ...]]:
+    # Зависимости обработчика и его FastAPI зависимостей, например
+    # аутентификации, по эндпоинтам вида "GET /path"
+    return {
+        f"{','.join(sorted(route.methods))} {route.path}": tuple(
+            _collect_route_dependencies(route.dependant),
+        )
+        for route in routes
+        if isinstance(route, APIRoute)
+    }
+
+
+def collect_providers(
+    container: aioinject.Container,
+    types: Iterable[type[Any]],
+) -> tuple[Provider[Any], ...]:
+    # Все провайдеры, нужные для types, каждый после своих зависимостей
+    ordered: dict[type[Any], Provider[Any]] = {}
+
+    def visit(type_: type[Any]) -> None:
+        if type_ in ordered:
+            return
+        provider = container.get_provider(type_)
+        for dependency in provider.resolve_dependencies(container.type_context):
+            visit(dependency.type_)
+        ordered[type_] = provider
+
+    for type_ in types:
+        visit(type_)
+    return tuple(ordered.values())
+
+
+async def validate_and_warm_up_container(
+    container: aioinject.Container,
+    routes: Iterable[BaseRoute],
+) -> None:
+    validate_container(container, DEFAULT_VALIDATORS)
+
+    endpoints = collect_endpoint_dependencies(routes)
+    errors: list[ContainerValidationError] = [
+        DependencyNotFoundError(
+            message=f"{endpoint}: provider for type {dependency.type_} not found",
+            dependency=dependency.type_,
+        )
+        for endpoint, dependencies in endpoints.items()
+        for dependency in dependencies
+        if dependency.type_ not in container.providers
+    ]
+    if errors:
+        raise ContainerValidationErrorGroup(errors=errors)
+
+    providers = collect_providers(
+        container,
+        [
+            dependency.type_
+            for dependencies in endpoints.values()
+            for dependency in dependencies
+        ],
+    )
+    async with container.context() as ctx:
+        for provider in providers:
+            if provider.lifetime is DependencyLifetime.singleton:
+                await ctx.resolve(provider.type_)
+
+    _logger.info("DI container is validated for %d endpoints", len(endpoints))
+
+
+def _collect_route_dependencies(dependant: Dependant) -> Iterator[Dependency[object]]:
+    for sub_dependant in dependant.dependencies:
+        yield from _collect_route_dependencies(sub_dependant)
+    yield from getattr(dependant.call, _DEPENDENCIES_ATTR, ())
@@ -6,3 +6,9 @@ class NotFoundError(Exception):
         if isinstance(entity_type, type):
             entity_type = entity_type.__name__
         super().__init__(f"{entity_type}({key}) is not found")
+
+
+class InvalidStateError(Exception):
+    # Команда не может быть выполнена при текущем состоянии сущностей,
+    # например черновик еще не готов к публикации
+    pass
@@ -0,0 +1,54 @@
+from datetime import UTC, datetime
+from email.utils import format_datetime
+
+from fastapi import Request, Response
+from starlette import status
+
+
+def make_etag(*parts: object) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    # Для If-None-Match используется слабое сравнение (RFC 9110, 13.1.2),
+    # поэтому префикс W/ у присланных клиентом тегов игнорируется
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def set_public_cache(
+    response: Response,
+    *,
+    max_age_sec: int,
+    last_modified: datetime | None,
+) -> None:
+    # Ответ одинаков для всех клиентов, поэтому его может кэшировать CDN
+    response.headers["Cache-Control"] = f"public, max-age={max_age_sec}"
+    if last_modified is None:
+        return
+    # Время без часового пояса считается UTC, так его возвращает SQLite
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=UTC)
+    response.headers["Last-Modified"] = format_datetime(
+        last_modified.astimezone(UTC),
+        usegmt=True,
+    )
@@ -0,0 +1,31 @@
+import base64
+import binascii
+import json
+
+# Курсор для keyset пагинации. Для клиента это непрозрачная строка,
+# внутри лежат значения ключа сортировки последней отданной записи
+
+
+class InvalidCursorError(Exception):
+    def __init__(self) -> None:
+        super().__init__("invalid cursor")
+
+
+def encode_cursor(*values: str) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as err:
+        raise InvalidCursorError from err
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(isinstance(value, str) for value in values)
+    ):
+        raise InvalidCursorError
+    return values
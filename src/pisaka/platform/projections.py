@@ -0,0 +1,29 @@
+import json
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, ScalarSelect, func, select
+from sqlalchemy.sql.elements import SQLCoreOperations
+
+# Проекции для списков только на чтение. Запрос выбирает ровно те колонки,
+# которые нужны ответу, а строки результата превращаются в легкие записи
+# (dataclass со slots) без ORM: без identity map, без инструментирования
+# атрибутов и без отдельных запросов на связанные коллекции. Связанные
+# коллекции собираются в JSON массив прямо в SQL.
+#
+# json_group_array есть в SQLite, в PostgreSQL ему соответствует json_agg
+
+
+def json_uuid_array(
+    column: SQLCoreOperations[UUID],
+    whereclause: ColumnElement[bool],
+) -> ScalarSelect[str]:
+    # Коррелированный подзапрос: для каждой строки внешнего запроса собирает
+    # значения column из строк, подходящих под whereclause. Без совпадений
+    # получается "[]", а не "[null]", как было бы с LEFT JOIN и GROUP BY
+    return select(func.json_group_array(column)).where(whereclause).scalar_subquery()
+
+
+def parse_json_uuid_array(raw: str) -> list[UUID]:
+    # SQLite хранит UUID как 32 hex символа, PostgreSQL как строку с дефисами.
+    # UUID() принимает оба вида
+    return [UUID(value) for value in json.loads(raw)]
@@ -0,0 +1,57 @@
+import re
+from dataclasses import dataclass, field
+
+from sqlalchemy import Connection
+from sqlalchemy.sql import ClauseElement
+
+# Проверка планов частых запросов. Каждый модуль перечисляет свои горячие
+# запросы, а `pisaka dev explain` прогоняет их через EXPLAIN QUERY PLAN
+# и падает, если какой-то из них читает таблицу целиком. Так пропавший
+# или не подходящий под запрос индекс заметен сразу, а не по росту задержек
+# на проде.
+#
+# Работает только с SQLite, формат плана у других БД другой
+
+# До SQLite 3.36 шаг выглядел как "SCAN TABLE articles"
+_FULL_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(?P<table>\w+)(?: AS \w+)?$")
+
+
+@dataclass(frozen=True, kw_only=True)
+class HotQuery:
+    name: str
+    statement: ClauseElement
+    # Таблицы, которые запрос по своей сути читает целиком, например выгрузка
+    # всего списка. Полный просмотр остальных таблиц считается ошибкой
+    full_scan_allowed: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass(frozen=True, kw_only=True)
+class QueryPlan:
+    query: HotQuery
+    steps: list[str]
+    full_scans: list[str]
+
+
+def explain_query_plan(connection: Connection, query: HotQuery) -> QueryPlan:
+    compiled = query.statement.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    result = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+    steps = [detail for _, _, _, detail in result.tuples()]
+    return QueryPlan(
+        query=query,
+        steps=steps,
+        full_scans=[
+            table
+            for table in map(find_full_scan, steps)
+            if table is not None and table not in query.full_scan_allowed
+        ],
+    )
+
+
+def find_full_scan(step: str) -> str | None:
+    # "SCAN articles" - полный просмотр таблицы, а "SCAN articles USING
+    # COVERING INDEX ..." - просмотр индекса, он намного дешевле
+    match = _FULL_SCAN_RE.match(step)
+    return match["table"] if match else None
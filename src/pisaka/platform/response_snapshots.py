@@ -0,0 +1,74 @@
+import gzip
+from dataclasses import dataclass
+from typing import Final
+
+from fastapi import Request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    # brotli - необязательная зависимость (pisaka-demo-01[brotli]). Без нее
+    # снимки сжимаются только gzip
+    brotli = None
+
+# Снимок ответа: уже сериализованное тело плюс заранее сжатые варианты.
+# Нужен для горячих ответов, которые между записями одинаковы для всех
+# клиентов. Тело сжимается один раз при построении снимка, а запросы
+# отдают готовые байты без сериализации и без сжатия на лету
+
+_GZIP_LEVEL: Final[int] = 9
+_BROTLI_QUALITY: Final[int] = 11
+
+IDENTITY: Final[str] = "identity"
+# В порядке предпочтения, brotli сжимает JSON лучше gzip
+_ENCODINGS: Final[tuple[str, ...]] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ResponseSnapshot:
+    # Кодировка (значение Content-Encoding) -> тело ответа
+    bodies: dict[str, bytes]
+
+    @classmethod
+    def build(cls, body: bytes) -> "ResponseSnapshot":
+        bodies = {
+            IDENTITY: body,
+            "gzip": gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0),
+        }
+        if brotli is not None:
+            bodies["br"] = brotli.compress(body, quality=_BROTLI_QUALITY)
+        return cls(bodies=bodies)
+
+
+def choose_encoding(request: Request) -> str:
+    # Не зависит от снимка, поэтому ETag можно посчитать и ответить 304,
+    # даже не доставая снимок
+    accepted, rejected = _parse_accept_encoding(
+        request.headers.get("Accept-Encoding", ""),
+    )
+    for encoding in _ENCODINGS:
+        if encoding in rejected:
+            continue
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return IDENTITY
+
+
+def _parse_accept_encoding(header: str) -> tuple[set[str], set[str]]:
+    # Возвращает принятые и явно отклоненные (q=0) кодировки. Отклоненные
+    # нужны отдельно: "*" не разрешает кодировку, которую клиент запретил
+    # по имени. Остальные веса не важны
+    accepted: set[str] = set()
+    rejected: set[str] = set()
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = params.strip().removeprefix("q=").strip() if params else "1"
+        try:
+            weight = float(q)
+        except ValueError:
+            continue
+        (accepted if weight > 0 else rejected).add(name)
+    return accepted, rejected
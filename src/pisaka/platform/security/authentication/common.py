@@ -3,8 +3,11 @@ from dataclasses import dataclass
 
 @dataclass(kw_only=True)
 class JWTAuthenticationOptions:
-    public_key: str
     audience: str
     issuer: str
+    public_key: str | None = None
+    jwks_file: str | None = None
+    jwks_reload_interval_sec: float = 60
     algorithm: str = "RS256"
     leeway_sec: int = 60
+    token_cache_size: int = 10_000
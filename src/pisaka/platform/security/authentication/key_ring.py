@@ -0,0 +1,137 @@
+import logging
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import jwt
+from jwt import PyJWTError
+
+from pisaka.platform.security.authentication.common import JWTAuthenticationOptions
+
+# Набор публичных ключей для проверки подписи JWT. Ключи разбираются один раз
+# при загрузке, а не на каждом вызове jwt.decode, и индексируются по kid
+# из заголовка токена.
+#
+# Ключи берутся либо из PEM строки в конфиге, либо из локального JWKS файла.
+# JWKS файл перечитывается при изменении, так что ротация ключей
+# не требует перезапуска приложения.
+
+_logger = logging.getLogger(__name__)
+
+
+class UnknownSigningKeyError(PyJWTError):
+    def __init__(self, kid: str | None) -> None:
+        super().__init__(f"Signing key (kid={kid}) is not found")
+
+
+class SigningKeyRing:
+    def __init__(
+        self,
+        keys: Mapping[str, Any],
+        default_key: Any | None = None,  # noqa: ANN401
+    ) -> None:
+        self._keys = dict(keys)
+        self._default_key = default_key
+
+    @classmethod
+    def from_pem(cls, public_key: str, algorithm: str) -> "SigningKeyRing":
+        key = jwt.get_algorithm_by_name(algorithm).prepare_key(public_key)
+        return cls(keys={}, default_key=key)
+
+    @classmethod
+    def from_jwks(cls, jwks: str) -> "SigningKeyRing":
+        keys, default_key = _parse_jwks(jwks)
+        return cls(keys=keys, default_key=default_key)
+
+    @property
+    def generation(self) -> int:
+        # Номер загрузки набора ключей. По его смене сбрасываются
+        # уже проверенные токены, подпись которых могла стать недействительной
+        return 0
+
+    def get_key(self, token: str) -> Any:  # noqa: ANN401
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.find(kid)
+        if key is None:
+            raise UnknownSigningKeyError(kid=kid)
+        return key
+
+    def find(self, kid: str | None) -> Any | None:  # noqa: ANN401
+        # Ключ из PEM не привязан ни к какому kid, поэтому подходит любому токену
+        if kid is None or not self._keys:
+            return self._default_key
+        return self._keys.get(kid)
+
+
+class JWKSFileSigningKeyRing(SigningKeyRing):
+    def __init__(
+        self,
+        path: Path,
+        check_interval_sec: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(keys={})
+        self._path = path
+        self._check_interval_sec = check_interval_sec
+        self._clock = clock
+        self._mtime_ns: int | None = None
+        self._generation = 0
+        self._checked_at = clock()
+        self.reload()
+
+    @property
+    def generation(self) -> int:
+        # Кэш проверенных токенов не доходит до find, поэтому файл
+        # проверяется и здесь, иначе ротация не видна, пока все токены
+        # попадают в кэш
+        self._reload_if_changed()
+        return self._generation
+
+    def reload(self) -> None:
+        mtime_ns = self._path.stat().st_mtime_ns
+        self._keys, self._default_key = _parse_jwks(self._path.read_text())
+        self._mtime_ns = mtime_ns
+        self._generation += 1
+
+    def find(self, kid: str | None) -> Any | None:  # noqa: ANN401
+        self._reload_if_changed()
+        return super().find(kid)
+
+    def _reload_if_changed(self) -> None:
+        now = self._clock()
+        if now - self._checked_at < self._check_interval_sec:
+            return
+        self._checked_at = now
+        try:
+            if self._path.stat().st_mtime_ns == self._mtime_ns:
+                return
+            self.reload()
+        except (OSError, ValueError, PyJWTError):
+            # Битый или недописанный файл не должен ломать аутентификацию,
+            # продолжаем работать со старым набором ключей
+            _logger.exception("Failed to reload JWKS file %s", self._path)
+        else:
+            _logger.info("JWKS file %s is reloaded", self._path)
+
+
+def create_signing_key_ring(options: JWTAuthenticationOptions) -> SigningKeyRing:
+    if options.jwks_file is not None:
+        return JWKSFileSigningKeyRing(
+            path=Path(options.jwks_file),
+            check_interval_sec=options.jwks_reload_interval_sec,
+        )
+    if options.public_key is not None:
+        return SigningKeyRing.from_pem(
+            public_key=options.public_key,
+            algorithm=options.algorithm,
+        )
+    raise ValueError("either public_key or jwks_file must be set")
+
+
+def _parse_jwks(jwks: str) -> tuple[dict[str, Any], Any | None]:
+    jwk_set = jwt.PyJWKSet.from_json(jwks)
+    keys = {jwk.key_id: jwk.key for jwk in jwk_set.keys if jwk.key_id}
+    # Токен без kid можно проверить, только если выбирать не из чего
+    default_key = jwk_set.keys[0].key if len(jwk_set.keys) == 1 else None
+    return keys, default_key
@@ -5,14 +5,16 @@ from uuid import UUID
 
 import jwt
 from aioinject import Inject
-from aioinject.ext.fastapi import inject
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import PyJWTError
 from pydantic import BaseModel, ValidationError
 from starlette import status
 
+from pisaka.platform.di import inject
 from pisaka.platform.security.authentication.common import JWTAuthenticationOptions
+from pisaka.platform.security.authentication.key_ring import SigningKeyRing
+from pisaka.platform.security.authentication.token_cache import VerifiedTokenCache
 from pisaka.platform.security.claims import (
     ISSUER_LOCAL_AUTHORITY,
     AgentNameClaim,
@@ -27,6 +29,7 @@ from pisaka.platform.security.claims import (
 class _JWTClaimsSchema(BaseModel):
     iss: str
     sub: str
+    exp: float
     email: str | None
     azp: str | None
 
@@ -51,12 +54,46 @@ async def _authenticate(
         ),
     ],
     jwt_auth_opt: Annotated[JWTAuthenticationOptions, Inject],
+    key_ring: Annotated[SigningKeyRing, Inject],
+    verified_token_cache: Annotated[VerifiedTokenCache, Inject],
 ) -> AuthenticationResult:
+    verified_token_cache.use_key_ring_generation(key_ring.generation)
+    token_key = VerifiedTokenCache.make_key(http_cred.credentials)
+    verified = verified_token_cache.get(token_key)
+    if not isinstance(verified, AuthenticationResult):
+        verified, expires_at = _verify_jwt(
+            token=http_cred.credentials,
+            jwt_auth_opt=jwt_auth_opt,
+            key_ring=key_ring,
+        )
+        verified_token_cache.put(token_key, verified, expires_at=expires_at)
+
+    if user_agent := request.headers.get("User-Agent"):
+        return AuthenticationResult(
+            principal=verified.principal,
+            agent=ClaimsIdentity(
+                claims=[
+                    AgentPlatformClaim(
+                        issuer=ISSUER_LOCAL_AUTHORITY,
+                        platform_name=user_agent,
+                    ),
+                    *verified.agent.claims,
+                ],
+            ),
+        )
+    return verified
+
+
+def _verify_jwt(
+    token: str,
+    jwt_auth_opt: JWTAuthenticationOptions,
+    key_ring: SigningKeyRing,
+) -> tuple[AuthenticationResult, float]:
     try:
         jwt_claims = _JWTClaimsSchema.model_validate(
             jwt.decode(
-                jwt=http_cred.credentials,
-                key=jwt_auth_opt.public_key,
+                jwt=token,
+                key=key_ring.get_key(token),
                 algorithms=[jwt_auth_opt.algorithm],
                 options={
                     "verify_signature": True,
@@ -87,17 +124,16 @@ async def _authenticate(
     principal = ClaimsIdentity(claims=principal_claims)
 
     agent_claims: list[Claim] = []
-    if user_agent := request.headers.get("User-Agent"):
-        agent_claims.append(
-            AgentPlatformClaim(issuer=ISSUER_LOCAL_AUTHORITY, platform_name=user_agent),
-        )
     if authorized_party := jwt_claims.azp:
         agent_claims.append(
             AgentNameClaim(issuer=jwt_issuer, agent_name=authorized_party),
         )
     agent = ClaimsIdentity(claims=agent_claims)
 
-    return AuthenticationResult(principal=principal, agent=agent)
+    return (
+        AuthenticationResult(principal=principal, agent=agent),
+        jwt_claims.exp - jwt_auth_opt.leeway_sec,
+    )
 
 
 Authentication = Annotated[AuthenticationResult, Depends(_authenticate)]
@@ -0,0 +1,38 @@
+import hashlib
+import math
+import time
+from collections.abc import Callable
+
+from pisaka.platform.cache import TTLCache
+
+# Кэш уже проверенных JWT. Проверка подписи RS256 и валидация клеймов стоят
+# заметно дороже, чем поиск в словаре, а админка присылает один и тот же токен
+# сотни раз за время его жизни.
+#
+# Ключом служит sha256 от токена, чтобы не держать в памяти сами токены.
+# Запись живет не дольше, чем сам токен (exp минус leeway), при переполнении
+# вытесняется давно не использовавшаяся запись (LRU).
+#
+# Токен проверен ключом из текущего набора, поэтому при перезагрузке набора
+# (ротация, отзыв скомпрометированного ключа) кэш сбрасывается целиком.
+
+
+class VerifiedTokenCache(TTLCache[bytes, object]):
+    def __init__(
+        self,
+        max_size: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        # Время жизни каждой записи задает exp токена, поэтому часы
+        # настенные, а не монотонные, и общего TTL нет
+        super().__init__(max_size=max_size, ttl_sec=math.inf, clock=clock)
+        self._key_ring_generation: int | None = None
+
+    def use_key_ring_generation(self, generation: int) -> None:
+        if generation != self._key_ring_generation:
+            self.clear()
+            self._key_ring_generation = generation
+
+    @staticmethod
+    def make_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Final, TypeVar
 from uuid import UUID
 
@@ -64,12 +64,37 @@ ClaimT = TypeVar("ClaimT", bound=Claim)
 @dataclass(frozen=True)
 class ClaimsIdentity:
     claims: list[Claim]
+    # Индексы строятся один раз при создании, так что поиск клейма по типу
+    # и проверка роли не перебирают весь список клеймов
+    roles: frozenset[str] = field(init=False, repr=False, compare=False)
+    _claims_by_type: dict[type[Claim], list[Claim]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        claims_by_type: dict[type[Claim], list[Claim]] = {}
+        for claim in self.claims:
+            # Учитываем базовые классы, чтобы поиск работал как isinstance
+            for claim_type in type(claim).__mro__[:-1]:
+                claims_by_type.setdefault(claim_type, []).append(claim)
+        object.__setattr__(self, "_claims_by_type", claims_by_type)
+        object.__setattr__(
+            self,
+            "roles",
+            frozenset(
+                claim.role
+                for claim in self.claims
+                if isinstance(claim, PisakaRoleClaim)
+            ),
+        )
 
     def find_first(self, claim_type: type[ClaimT]) -> ClaimT | None:
-        for claim in self.claims:
-            if isinstance(claim, claim_type):
-                return claim
-        return None
+        claims = self._claims_by_type.get(claim_type)
+        if not claims:
+            return None
+        return claims[0]  # type: ignore[return-value]
 
     def find_all(self, claim_type: type[ClaimT]) -> list[ClaimT]:
-        return [claim for claim in self.claims if isinstance(claim, claim_type)]
+        return list(self._claims_by_type.get(claim_type, ()))  # type: ignore[arg-type]
@@ -33,10 +33,17 @@ from pisaka.platform.security.claims import (
 # Авторизация должна вернуть результат на выбор: разрешить доступ или запретить.
 # На практике удобно для разрешения возвращать None, для запрета делать
 # raise AuthorizationError
+#
+# Если привилегии для вычисления ничего не нужно ждать (БД, сеть), то помимо
+# evaluate у нее есть синхронный evaluate_sync. Его стоит вызывать на горячих
+# путях, чтобы не создавать корутину на каждую проверку
 
 
 class AlmightyLocalCliPermission:
     async def evaluate(self, agent: ClaimsIdentity) -> bool:
+        return self.evaluate_sync(agent=agent)
+
+    def evaluate_sync(self, agent: ClaimsIdentity) -> bool:
         agent_name_claim = agent.find_first(AgentNameClaim)
         return (
             agent_name_claim is not None
@@ -46,6 +53,9 @@ class AlmightyLocalCliPermission:
 
 class AlmightyTestsPermission:
     async def evaluate(self, agent: ClaimsIdentity) -> bool:
+        return self.evaluate_sync(agent=agent)
+
+    def evaluate_sync(self, agent: ClaimsIdentity) -> bool:
         agent_name_claim = agent.find_first(AgentNameClaim)
         return (
             agent_name_claim is not None
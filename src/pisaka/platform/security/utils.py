@@ -8,26 +8,21 @@ from pisaka.platform.security.claims import (
     AgentNameClaim,
     AgentPlatformClaim,
     ClaimsIdentity,
-    PisakaRoleClaim,
     UserIdClaim,
 )
 
 
 def has_any_role(principal: ClaimsIdentity, roles: Iterable[str]) -> bool:
-    for role_claim in principal.find_all(PisakaRoleClaim):
-        if role_claim.role in roles:
-            return True
-    return False
+    # Для частых проверок передавайте заранее собранный frozenset ролей
+    return not principal.roles.isdisjoint(roles)
 
 
 def has_role(principal: ClaimsIdentity, role: str) -> bool:
-    return has_any_role(principal=principal, roles=[role])
+    return role in principal.roles
 
 
 def has_all_roles(principal: ClaimsIdentity, roles: Iterable[str]) -> bool:
-    has_roles = [role_claim.role for role_claim in principal.find_all(PisakaRoleClaim)]
-    missing_roles = set(roles) - set(has_roles)
-    return not missing_roles
+    return principal.roles.issuperset(roles)
 
 
 class NoUserIdClaimError(Exception):
@@ -0,0 +1,67 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel
+from sqlalchemy import Connection, Engine, event
+
+# Настройки SQLite для прода. По умолчанию SQLite работает с журналом отката
+# и synchronous=FULL, держит маленький кэш страниц и не использует mmap,
+# а конкурентный писатель сразу получает "database is locked".
+#
+# Прагмы применяются к каждому новому соединению через событие connect,
+# так как почти все из них действуют только в рамках соединения
+
+
+class SQLiteProfile(BaseModel):
+    journal_mode: Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL"] = "WAL"
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    # Отрицательное значение задает размер в КиБ, положительное в страницах
+    cache_size: int = -64_000
+    mmap_size: int = 256 * 1024 * 1024
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    busy_timeout_ms: int = 5_000
+
+    def pragmas(self) -> list[str]:
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA cache_size={self.cache_size:d}",
+            f"PRAGMA mmap_size={self.mmap_size:d}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms:d}",
+        ]
+
+
+def apply_sqlite_profile(engine: Engine, profile: SQLiteProfile) -> None:
+    # Для AsyncEngine нужно передавать engine.sync_engine
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = profile.pragmas()
+
+    def _on_connect(dbapi_connection: Any, _: Any) -> None:  # noqa: ANN401
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    event.listen(engine, "connect", _on_connect)
+
+
+def use_explicit_sqlite_transactions(engine: Engine) -> None:
+    # Драйвер sqlite3 сам решает, когда открыть транзакцию, и не открывает ее
+    # перед SAVEPOINT. Тогда RELEASE первой точки сохранения коммитит все
+    # сразу, и откат внешней транзакции уже ничего не отменяет. Поэтому
+    # отключаем автоматику драйвера и открываем транзакцию явно.
+    # Для AsyncEngine нужно передавать engine.sync_engine
+    if engine.dialect.name != "sqlite":
+        return
+
+    def _on_connect(dbapi_connection: Any, _: Any) -> None:  # noqa: ANN401
+        dbapi_connection.isolation_level = None
+
+    def _on_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    event.listen(engine, "connect", _on_connect)
+    event.listen(engine, "begin", _on_begin)
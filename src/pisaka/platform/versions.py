@@ -0,0 +1,47 @@
+from sqlalchemy import Integer, Select, String, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from pisaka.platform.db import DBModel
+
+# Версия коллекции сущностей. Увеличивается командами при любом изменении
+# состава или содержимого коллекции, так что по ней можно дешево понять,
+# изменился ли список, не читая сам список (ETag, кэши)
+
+
+class CollectionVersionModel(DBModel):
+    __tablename__ = "collection_versions"
+
+    name: Mapped[str] = mapped_column(String(length=50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer)
+
+
+def select_collection_version(name: str) -> Select[tuple[int]]:
+    return select(CollectionVersionModel.version).where(
+        CollectionVersionModel.name == name,
+    )
+
+
+async def get_collection_version(session: AsyncSession, name: str) -> int:
+    result = await session.execute(select_collection_version(name))
+    version: int | None = result.scalar_one_or_none()
+    return version or 0
+
+
+class CollectionVersionService:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, name: str) -> int:
+        return await get_collection_version(self._session, name)
+
+    async def bump(self, name: str) -> None:
+        result = await self._session.execute(
+            update(CollectionVersionModel)
+            .where(CollectionVersionModel.name == name)
+            .values(version=CollectionVersionModel.version + 1),
+        )
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            model = CollectionVersionModel(name=name, version=1)
+            self._session.add(model)
+            await self._session.flush([model])
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+# Очередь пишущих транзакций для SQLite. В SQLite одновременно пишет только одно
+# соединение, поэтому конкурентные команды упираются в блокировку БД, ловят
+# "database is locked" и дают всплески задержек.
+#
+# В режиме одного писателя все транзакции команд проходят через одну asyncio
+# задачу с ограниченной очередью. Писатель забирает из очереди сразу несколько
+# ожидающих транзакций и выполняет их в одной транзакции БД (group commit):
+# каждая команда работает в своей точке сохранения (SAVEPOINT), так что ошибка
+# одной команды не откатывает остальные, а коммит и fsync на всю пачку один.
+# Команда получает управление обратно только после коммита пачки.
+#
+# Для SQLite это работает, только если транзакция открыта явно
+# (pisaka.platform.sqlite.use_explicit_sqlite_transactions): иначе драйвер
+# sqlite3 не открывает ее перед SAVEPOINT, и RELEASE точки сохранения первой
+# команды сразу коммитит ее изменения, не дожидаясь остальных.
+#
+# Тело транзакции выполняется в задаче самой команды, писатель лишь выдает ей
+# соединение и ждет завершения. Чтения идут мимо очереди через пул соединений.
+# Если режим выключен, begin() просто открывает транзакцию сессии.
+#
+# Вложенный begin() для той же сессии (например, пакетный запрос выполняет
+# несколько команд в одной транзакции) не встает в очередь повторно,
+# а открывает точку сохранения внутри внешней транзакции.
+
+_logger = logging.getLogger(__name__)
+
+_IN_WRITE_TRANSACTION_KEY = "pisaka.write_queue.in_transaction"
+
+
+def in_write_transaction(session: AsyncSession) -> bool:
+    # Внутри WriteQueue.begin() сессия видит еще не закоммиченные изменения,
+    # которые могут откатиться. Процессные кэши из нее заполнять нельзя
+    return bool(session.info.get(_IN_WRITE_TRANSACTION_KEY))
+
+
+@dataclass(frozen=True, kw_only=True)
+class WriteQueueStats:
+    depth: int
+    max_depth: int
+    transactions: int
+    failed_transactions: int
+    batches: int
+    avg_wait_sec: float
+    max_wait_sec: float
+
+
+@dataclass(kw_only=True)
+class _Turn:
+    enqueued_at: float
+    started: "asyncio.Future[AsyncConnection]" = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future(),
+    )
+    finished: "asyncio.Future[bool]" = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future(),
+    )
+    committed: "asyncio.Future[None]" = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future(),
+    )
+
+
+class WriteQueue:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        enabled: bool,
+        max_size: int,
+        max_batch_size: int,
+        turn_timeout_sec: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._engine = engine
+        self._enabled = enabled
+        self._max_size = max_size
+        self._max_batch_size = max_batch_size
+        self._turn_timeout_sec = turn_timeout_sec
+        self._clock = clock
+        self._queue: asyncio.Queue[_Turn | None] = asyncio.Queue(maxsize=max_size)
+        self._writer: asyncio.Task[None] | None = None
+        self._transactions = 0
+        self._failed_transactions = 0
+        self._batches = 0
+        self._total_wait_sec = 0.0
+        self._max_wait_sec = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    async def start(self) -> None:
+        if self._enabled and self._writer is None:
+            self._writer = asyncio.create_task(self._run_writer())
+
+    async def stop(self) -> None:
+        # Уже поставленные в очередь транзакции выполняются до конца
+        if self._writer is None:
+            return
+        await self._queue.put(None)
+        await self._writer
+        self._writer = None
+
+    @asynccontextmanager
+    async def begin(self, session: AsyncSession) -> AsyncIterator[None]:
+        if in_write_transaction(session):
+            async with session.begin_nested():
+                yield
+            return
+
+        session.info[_IN_WRITE_TRANSACTION_KEY] = True
+        try:
+            async with self._begin_transaction(session):
+                yield
+        finally:
+            del session.info[_IN_WRITE_TRANSACTION_KEY]
+
+    def stats(self) -> WriteQueueStats:
+        return WriteQueueStats(
+            depth=self._queue.qsize(),
+            max_depth=self._max_size,
+            transactions=self._transactions,
+            failed_transactions=self._failed_transactions,
+            batches=self._batches,
+            avg_wait_sec=(
+                self._total_wait_sec / self._transactions if self._transactions else 0
+            ),
+            max_wait_sec=self._max_wait_sec,
+        )
+
+    @asynccontextmanager
+    async def _begin_transaction(self, session: AsyncSession) -> AsyncIterator[None]:
+        if not self._enabled:
+            async with session.begin():
+                yield
+            return
+
+        async with self._turn() as connection:
+            sync_session = session.sync_session
+            bind, join_transaction_mode = (
+                sync_session.bind,
+                sync_session.join_transaction_mode,
+            )
+            sync_session.bind = connection.sync_connection
+            sync_session.join_transaction_mode = "create_savepoint"
+            try:
+                async with session.begin():
+                    yield
+            finally:
+                sync_session.bind = bind
+                sync_session.join_transaction_mode = join_transaction_mode
+
+    @asynccontextmanager
+    async def _turn(self) -> AsyncIterator[AsyncConnection]:
+        if self._writer is None:
+            raise RuntimeError("WriteQueue is not started")
+        turn = _Turn(enqueued_at=self._clock())
+        await self._queue.put(turn)
+        try:
+            # Отмена может прийти, когда писатель уже выдал соединение, но задача
+            # команды еще не проснулась. Писатель в этот момент ждет finished,
+            # поэтому его нужно завершить и здесь, а не только после yield
+            connection = await turn.started
+            yield connection
+        except BaseException:
+            if not turn.started.done():
+                turn.started.cancel()
+            elif not turn.finished.done():
+                turn.finished.set_result(False)
+            raise
+        if not turn.finished.done():
+            turn.finished.set_result(True)
+        await turn.committed
+
+    async def _run_writer(self) -> None:
+        stopping = False
+        while not stopping:
+            turn = await self._queue.get()
+            if turn is None:
+                break
+            batch = [turn]
+            while len(batch) < self._max_batch_size and not self._queue.empty():
+                next_turn = self._queue.get_nowait()
+                if next_turn is None:
+                    stopping = True
+                    break
+                batch.append(next_turn)
+            try:
+                await self._execute_batch(batch)
+            except Exception as err:
+                _logger.exception("Write batch failed")
+                for failed_turn in batch:
+                    _fail(failed_turn, err)
+
+    async def _execute_batch(self, batch: list[_Turn]) -> None:
+        self._batches += 1
+        async with self._engine.connect() as connection:
+            await connection.begin()
+            succeeded = []
+            for turn in batch:
+                if turn.started.done():
+                    # Команду отменили, пока она ждала своей очереди
+                    continue
+                self._record_wait(turn)
+                turn.started.set_result(connection)
+                if await self._wait_finished(turn):
+                    succeeded.append(turn)
+                else:
+                    self._failed_transactions += 1
+            await connection.commit()
+        for turn in succeeded:
+            if not turn.committed.done():
+                turn.committed.set_result(None)
+
+    async def _wait_finished(self, turn: _Turn) -> bool:
+        # Ожидание ограничено: зависшая команда не должна навсегда остановить
+        # все остальные записи. По таймауту пачка откатывается целиком,
+        # соединение закрывается, а команды пачки получают ошибку
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(turn.finished),
+                timeout=self._turn_timeout_sec,
+            )
+        except TimeoutError as err:
+            raise TimeoutError(
+                f"Write transaction did not finish in {self._turn_timeout_sec} sec",
+            ) from err
+
+    def _record_wait(self, turn: _Turn) -> None:
+        wait_sec = self._clock() - turn.enqueued_at
+        self._transactions += 1
+        self._total_wait_sec += wait_sec
+        self._max_wait_sec = max(self._max_wait_sec, wait_sec)
+
+
+def _fail(turn: _Turn, err: Exception) -> None:
+    if not turn.started.done():
+        turn.started.set_exception(err)
+        return
+    if turn.started.cancelled() or turn.committed.done():
+        return
+    # Команда еще выполняется (таймаут) или успешно завершилась и ждет
+    # коммита пачки. Упавшая команда коммита уже не ждет
+    if not turn.finished.done() or turn.finished.result():
+        turn.committed.set_exception(err)
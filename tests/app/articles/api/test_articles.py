@@ -0,0 +1,126 @@
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import aioinject
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.articles.db import ArticleModel
+from pisaka.app.articles.ids import ArticleDraftId, ArticleId
+from pisaka.app.articles.search import SearchIndex
+from pisaka.app.authors import AuthorId
+from pisaka.config.public_api import public_api_app
+
+pytestmark = [pytest.mark.anyio]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _PublicAPI:
+    client: httpx.AsyncClient
+    container: aioinject.Container
+
+
+@pytest.fixture
+async def public_api() -> AsyncGenerator[_PublicAPI, None]:
+    app = public_api_app()
+    assert isinstance(app, FastAPI)
+    # Контейнер приложения доступен только через его middleware,
+    # lifespan через ASGITransport не запускается
+    [middleware] = app.user_middleware
+    container = middleware.kwargs["container"]
+    assert isinstance(container, aioinject.Container)
+    async with (
+        container,
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://api",
+        ) as client,
+    ):
+        yield _PublicAPI(client=client, container=container)
+
+
+async def _create_articles(
+    container: aioinject.Container,
+    count: int,
+    published_at: datetime,
+    content: str = "Content",
+) -> list[ArticleModel]:
+    articles = [
+        ArticleModel(
+            id=ArticleId(uuid4()),
+            article_draft_id=ArticleDraftId(uuid4()),
+            author_id=AuthorId(uuid4()),
+            headline="Headline",
+            content=content,
+            slug=f"feed-{uuid4().hex[:20]}",
+            disproof=None,
+            published_at=published_at,
+        )
+        for _ in range(count)
+    ]
+    async with container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        search_index = SearchIndex(session=session)
+        async with session.begin():
+            for article in articles:
+                async with search_index.updating_article(article.id):
+                    session.add(article)
+                    await session.flush([article])
+    return articles
+
+
+async def test_get_articles_feed__pages_through_equal_published_at(
+    public_api: _PublicAPI,
+) -> None:
+    # Время одно на все статьи, порядок внутри него задает только id, и
+    # границы страниц при limit=2 проходят внутри группы. SQLite хранит
+    # время без зоны, так что курсор сравнивается с наивным datetime
+    articles = await _create_articles(
+        public_api.container,
+        count=5,
+        published_at=datetime(2100, 1, 1, tzinfo=UTC),
+    )
+
+    slugs: list[str] = []
+    cursor: str | None = None
+    while True:
+        response = await public_api.client.get(
+            "/articles/",
+            params={"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor},
+        )
+        assert response.status_code == httpx.codes.OK
+        feed = response.json()
+        assert len(feed["articles"]) <= 2  # noqa: PLR2004
+        slugs.extend(article["slug"] for article in feed["articles"])
+        cursor = feed["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(slugs) == len(set(slugs))
+    # Статьи из будущего идут в ленте первыми, а среди них по убыванию id
+    expected = [
+        article.slug
+        for article in sorted(articles, key=lambda article: article.id, reverse=True)
+    ]
+    assert [slug for slug in slugs if slug in expected] == expected
+
+
+async def test_search_articles(public_api: _PublicAPI) -> None:
+    word = f"word{uuid4().hex}"
+    [article] = await _create_articles(
+        public_api.container,
+        count=1,
+        published_at=datetime(2000, 1, 1, tzinfo=UTC),
+        content=f"Content with {word}",
+    )
+
+    response = await public_api.client.get("/articles/search", params={"q": word})
+
+    assert response.status_code == httpx.codes.OK
+    [hit] = response.json()["articles"]
+    assert hit["id"] == str(article.id)
+    assert f"<b>{word}</b>" in hit["snippet"]
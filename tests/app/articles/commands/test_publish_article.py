@@ -0,0 +1,205 @@
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import aioinject
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.articles.commands import (
+    CreateArticleDraftCommand,
+    DisproveArticleCommand,
+    PublishArticleCommand,
+)
+from pisaka.app.articles.db import ArticleModel
+from pisaka.app.articles.entities import Article, ArticleDraft
+from pisaka.app.articles.repositories import ArticleDraftRepository, ArticleRepository
+from pisaka.app.articles.search import SearchIndex
+from pisaka.app.articles.services import ArticlePageCache
+from pisaka.app.authors import AuthorStatsService, CreateAuthorCommand
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.cache import MISSING
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.claims import (
+    ClaimsIdentity,
+    PisakaRoleClaim,
+    UserIdClaim,
+)
+from pisaka.platform.security.roles import PisakaRole
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def _create_valid_draft(container: aioinject.Container) -> ArticleDraft:
+    journalist = ClaimsIdentity(
+        claims=[
+            UserIdClaim(user_id=uuid4()),
+            PisakaRoleClaim(role=PisakaRole.JOURNALIST),
+        ],
+    )
+    async with container.context() as ctx:
+        create_author_command = await ctx.resolve(CreateAuthorCommand)
+        author = await create_author_command.execute(
+            name="J. Doe",
+            is_real_person=True,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+        create_draft_command = await ctx.resolve(CreateArticleDraftCommand)
+        draft = await create_draft_command.execute(principal=journalist)
+
+    async with container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        repo = await ctx.resolve(ArticleDraftRepository)
+        author_stats_service = await ctx.resolve(AuthorStatsService)
+        async with session.begin():
+            draft = await repo.get(article_draft_id=draft.id)
+            async with SearchIndex(session=session).updating_draft(draft.id):
+                draft.author_id = author.id
+                draft.headline = f"Headline {uuid4().hex[:8]}"
+                draft._model.content = "Content"
+                await repo.save(draft)
+            await author_stats_service.add(
+                author_id=author.id,
+                article_drafts_in_work=1,
+            )
+    return draft
+
+
+async def _rename_draft(
+    container: aioinject.Container,
+    draft: ArticleDraft,
+    headline: str,
+) -> None:
+    async with container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        repo = await ctx.resolve(ArticleDraftRepository)
+        async with session.begin():
+            draft = await repo.get(article_draft_id=draft.id)
+            async with SearchIndex(session=session).updating_draft(draft.id):
+                draft.headline = headline
+                await repo.save(draft)
+
+
+async def _publish(container: aioinject.Container, draft: ArticleDraft) -> Article:
+    async with container.context() as ctx:
+        command = await ctx.resolve(PublishArticleCommand)
+        return await command.execute(
+            article_draft_id=draft.id,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+
+
+async def test_republish__updates_article_and_invalidates_cache(
+    di_container: aioinject.Container,
+) -> None:
+    draft = await _create_valid_draft(di_container)
+    async with di_container.context() as ctx:
+        command = await ctx.resolve(PublishArticleCommand)
+        article = await command.execute(
+            article_draft_id=draft.id,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+        cache = await ctx.resolve(ArticlePageCache)
+
+    cache.put(article.slug, b"{}")
+    async with di_container.context() as ctx:
+        command_2 = await ctx.resolve(PublishArticleCommand)
+        republished = await command_2.execute(
+            article_draft_id=draft.id,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+        author_stats_service = await ctx.resolve(AuthorStatsService)
+        stats = {
+            stats.author_id: stats for stats in await author_stats_service.get_all()
+        }
+
+    assert republished.id == article.id
+    assert cache.get(article.slug) is MISSING
+    assert stats[article.author_id].count_of_articles == 1
+    assert stats[article.author_id].count_of_article_drafts_in_work == 0
+
+
+async def test_disprove__invalidates_cache(di_container: aioinject.Container) -> None:
+    draft = await _create_valid_draft(di_container)
+    async with di_container.context() as ctx:
+        command = await ctx.resolve(PublishArticleCommand)
+        article = await command.execute(
+            article_draft_id=draft.id,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+        cache = await ctx.resolve(ArticlePageCache)
+
+    cache.put(article.slug, b"{}")
+    async with di_container.context() as ctx:
+        command_2 = await ctx.resolve(DisproveArticleCommand)
+        disproved = await command_2.execute(
+            article_id=article.id,
+            disproof="Fake",
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+
+    assert disproved.disproof == "Fake"
+    assert cache.get(article.slug) is MISSING
+
+
+async def test_republish_after_slug_change__updates_same_article(
+    di_container: aioinject.Container,
+) -> None:
+    draft = await _create_valid_draft(di_container)
+    article = await _publish(di_container, draft)
+    async with di_container.context() as ctx:
+        cache = await ctx.resolve(ArticlePageCache)
+    cache.put(article.slug, b"{}")
+
+    await _rename_draft(di_container, draft, f"Renamed {uuid4().hex[:8]}")
+    republished = await _publish(di_container, draft)
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        slugs = list(
+            await session.scalars(
+                select(ArticleModel.slug).where(
+                    ArticleModel.article_draft_id == draft.id,
+                ),
+            ),
+        )
+    assert republished.id == article.id
+    assert republished.slug != article.slug
+    assert slugs == [republished.slug]
+    assert cache.get(article.slug) is MISSING
+
+
+async def test_republish__rejects_slug_of_another_article(
+    di_container: aioinject.Container,
+) -> None:
+    draft_a = await _create_valid_draft(di_container)
+    await _publish(di_container, draft_a)
+    draft_b = await _create_valid_draft(di_container)
+    article_b = await _publish(di_container, draft_b)
+
+    await _rename_draft(di_container, draft_a, article_b.headline)
+    with pytest.raises(Exception, match="already taken"):
+        await _publish(di_container, draft_a)
+
+    async with di_container.context() as ctx:
+        repo = await ctx.resolve(ArticleRepository)
+        saved_b = await repo.get_for_read(article_b.id)
+    assert saved_b.article_draft_id == draft_b.id
+    assert saved_b.content == article_b.content
@@ -0,0 +1,52 @@
+from collections.abc import AsyncGenerator
+
+import aioinject
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.articles.commands import RebuildAuthorStatsCommand
+from pisaka.app.authors import AuthorStatsService, CreateAuthorCommand
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def test_execute__fixes_missing_stats(di_container: aioinject.Container) -> None:
+    async with di_container.context() as ctx:
+        command = await ctx.resolve(CreateAuthorCommand)
+        author = await command.execute(
+            name="J. Doe",
+            is_real_person=True,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        author_stats_service = await ctx.resolve(AuthorStatsService)
+        command_2 = await ctx.resolve(RebuildAuthorStatsCommand)
+        async with session.begin():
+            await author_stats_service.delete(author_id=author.id)
+        mismatches = await command_2.execute(dry_run=False, agent=AGENT_FOR_TESTS)
+
+    assert [mismatch.author_id for mismatch in mismatches] == [author.id]
+    assert mismatches[0].actual_count_of_articles is None
+    assert mismatches[0].expected_count_of_articles == 0
+
+    async with di_container.context() as ctx:
+        command_3 = await ctx.resolve(RebuildAuthorStatsCommand)
+        mismatches = await command_3.execute(dry_run=True, agent=AGENT_FOR_TESTS)
+
+    assert all(mismatch.author_id != author.id for mismatch in mismatches)
@@ -0,0 +1,77 @@
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import aioinject
+import pytest
+
+from pisaka.app.articles.commands import (
+    CreateArticleDraftCommand,
+    UpdateArticleDraftHeadlineCommand,
+)
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.authorization import AuthorizationError
+from pisaka.platform.security.claims import (
+    AgentNameClaim,
+    ClaimsIdentity,
+    PisakaRoleClaim,
+    UserIdClaim,
+)
+from pisaka.platform.security.roles import PisakaRole
+
+pytestmark = [pytest.mark.anyio]
+
+AGENT = ClaimsIdentity(claims=[AgentNameClaim(agent_name="admin-panel")])
+
+
+def _journalist() -> ClaimsIdentity:
+    return ClaimsIdentity(
+        claims=[
+            UserIdClaim(user_id=uuid4()),
+            PisakaRoleClaim(role=PisakaRole.JOURNALIST),
+        ],
+    )
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def test_execute__by_editor_of_draft(di_container: aioinject.Container) -> None:
+    journalist = _journalist()
+    async with di_container.context() as ctx:
+        command = await ctx.resolve(CreateArticleDraftCommand)
+        draft = await command.execute(principal=journalist)
+
+    async with di_container.context() as ctx:
+        command_2 = await ctx.resolve(UpdateArticleDraftHeadlineCommand)
+        updated_draft = await command_2.execute(
+            article_draft_id=draft.id,
+            new_headline="Заголовок",
+            principal=journalist,
+            agent=AGENT,
+        )
+
+    assert updated_draft.headline == "Заголовок"
+
+
+async def test_execute__by_stranger(di_container: aioinject.Container) -> None:
+    async with di_container.context() as ctx:
+        command = await ctx.resolve(CreateArticleDraftCommand)
+        draft = await command.execute(principal=_journalist())
+
+    async with di_container.context() as ctx:
+        command_2 = await ctx.resolve(UpdateArticleDraftHeadlineCommand)
+        with pytest.raises(AuthorizationError):
+            await command_2.execute(
+                article_draft_id=draft.id,
+                new_headline="Заголовок",
+                principal=_journalist(),
+                agent=AGENT,
+            )
@@ -0,0 +1,83 @@
+from collections.abc import AsyncGenerator
+from uuid import UUID, uuid4
+
+import aioinject
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.articles.commands import CreateArticleDraftCommand
+from pisaka.app.articles.db import ArticleDraftEditorModel
+from pisaka.app.articles.entities import ArticleDraft
+from pisaka.app.articles.queries import list_article_drafts
+from pisaka.app.authors import CreateAuthorCommand, SetDefaultAuthorCommand
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.claims import (
+    ClaimsIdentity,
+    PisakaRoleClaim,
+    UserIdClaim,
+)
+from pisaka.platform.security.roles import PisakaRole
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def _create_draft(container: aioinject.Container, user_id: UUID) -> ArticleDraft:
+    journalist = ClaimsIdentity(
+        claims=[
+            UserIdClaim(user_id=user_id),
+            PisakaRoleClaim(role=PisakaRole.JOURNALIST),
+        ],
+    )
+    async with container.context() as ctx:
+        command = await ctx.resolve(CreateArticleDraftCommand)
+        return await command.execute(principal=journalist)
+
+
+async def test_list_article_drafts(di_container: aioinject.Container) -> None:
+    user_id = uuid4()
+    async with di_container.context() as ctx:
+        create_author_command = await ctx.resolve(CreateAuthorCommand)
+        author = await create_author_command.execute(
+            name="J. Doe",
+            is_real_person=True,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+        set_command = await ctx.resolve(SetDefaultAuthorCommand)
+        await set_command.execute(user_id=user_id, author_id=author.id)
+    draft = await _create_draft(di_container, user_id)
+    draft_without_author = await _create_draft(di_container, uuid4())
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        async with session.begin():
+            await session.execute(
+                delete(ArticleDraftEditorModel).where(
+                    ArticleDraftEditorModel.article_draft_id == draft_without_author.id,
+                ),
+            )
+        rows = {row.id: row for row in await list_article_drafts(session)}
+
+    row = rows[draft.id]
+    assert row.author_id == author.id
+    assert row.author_name == "J. Doe"
+    assert row.editors == [user_id]
+    assert type(row.editors[0]) is UUID
+
+    row_without_author = rows[draft_without_author.id]
+    assert row_without_author.author_id is None
+    assert row_without_author.author_name is None
+    assert row_without_author.editors == []
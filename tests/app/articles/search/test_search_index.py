@@ -0,0 +1,174 @@
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import aioinject
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.articles.commands import (
+    CreateArticleDraftCommand,
+    DeleteArticleDraftCommand,
+    PublishArticleCommand,
+    UpdateArticleDraftHeadlineCommand,
+)
+from pisaka.app.articles.repositories import ArticleDraftRepository
+from pisaka.app.articles.search import (
+    ARTICLE_DRAFTS_FTS,
+    ARTICLES_FTS,
+    SearchIndex,
+    to_match_query,
+)
+from pisaka.app.authors import CreateAuthorCommand
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.claims import (
+    ClaimsIdentity,
+    PisakaRoleClaim,
+    UserIdClaim,
+)
+from pisaka.platform.security.roles import PisakaRole
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("кот", '"кот"*'),
+        ('кот OR "пес', '"кот" "OR" "пес"*'),
+        ("  *-:  ", None),
+    ],
+)
+def test_to_match_query(query: str, expected: str | None) -> None:
+    assert to_match_query(query) == expected
+
+
+async def _search_drafts(container: aioinject.Container, query: str) -> list[str]:
+    async with container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        hits = await SearchIndex(session=session).search_drafts(query, limit=10)
+        return [hit.headline for hit in hits]
+
+
+async def test_draft_commands_keep_index_in_sync(
+    di_container: aioinject.Container,
+) -> None:
+    journalist = ClaimsIdentity(
+        claims=[
+            UserIdClaim(user_id=uuid4()),
+            PisakaRoleClaim(role=PisakaRole.JOURNALIST),
+        ],
+    )
+    old_word, new_word = f"old{uuid4().hex}", f"new{uuid4().hex}"
+    async with di_container.context() as ctx:
+        create_command = await ctx.resolve(CreateArticleDraftCommand)
+        draft = await create_command.execute(principal=journalist)
+    for word in (old_word, new_word):
+        async with di_container.context() as ctx:
+            update_command = await ctx.resolve(UpdateArticleDraftHeadlineCommand)
+            await update_command.execute(
+                article_draft_id=draft.id,
+                new_headline=f"Заголовок <{word}>",
+                principal=journalist,
+                agent=AGENT_FOR_TESTS,
+            )
+
+    assert await _search_drafts(di_container, old_word) == []
+    assert await _search_drafts(di_container, new_word) == [f"Заголовок <{new_word}>"]
+
+    async with di_container.context() as ctx:
+        delete_command = await ctx.resolve(DeleteArticleDraftCommand)
+        await delete_command.execute(
+            article_draft_id=draft.id,
+            principal=journalist,
+            agent=AGENT_FOR_TESTS,
+        )
+
+    assert await _search_drafts(di_container, new_word) == []
+
+
+async def _check_integrity(container: aioinject.Container) -> None:
+    # rank=1 сверяет индекс с содержимым external content таблицы, а не только
+    # внутреннюю структуру индекса. При расхождении SQLite выдает ошибку
+    async with container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        for index in (ARTICLES_FTS, ARTICLE_DRAFTS_FTS):
+            await session.execute(
+                text(
+                    f"INSERT INTO {index.name}({index.name}, rank) "  # noqa: S608
+                    "VALUES ('integrity-check', 1)",
+                ),
+            )
+
+
+async def test_commands_keep_index_consistent_with_content(
+    di_container: aioinject.Container,
+) -> None:
+    journalist = ClaimsIdentity(
+        claims=[
+            UserIdClaim(user_id=uuid4()),
+            PisakaRoleClaim(role=PisakaRole.JOURNALIST),
+        ],
+    )
+    async with di_container.context() as ctx:
+        create_author_command = await ctx.resolve(CreateAuthorCommand)
+        author = await create_author_command.execute(
+            name="J. Doe",
+            is_real_person=True,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+        create_command = await ctx.resolve(CreateArticleDraftCommand)
+        draft = await create_command.execute(principal=journalist)
+    await _check_integrity(di_container)
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        repo = await ctx.resolve(ArticleDraftRepository)
+        async with session.begin():
+            draft = await repo.get(article_draft_id=draft.id)
+            async with SearchIndex(session=session).updating_draft(draft.id):
+                draft.author_id = author.id
+                draft._model.content = "Текст статьи"
+                await repo.save(draft)
+    for headline in (f"Первый {uuid4().hex}", f"Второй {uuid4().hex}"):
+        async with di_container.context() as ctx:
+            update_command = await ctx.resolve(UpdateArticleDraftHeadlineCommand)
+            await update_command.execute(
+                article_draft_id=draft.id,
+                new_headline=headline,
+                principal=journalist,
+                agent=AGENT_FOR_TESTS,
+            )
+        await _check_integrity(di_container)
+
+        # Второй раз статья уже есть, и публикация обновляет ее в индексе
+        async with di_container.context() as ctx:
+            publish_command = await ctx.resolve(PublishArticleCommand)
+            await publish_command.execute(
+                article_draft_id=draft.id,
+                principal=PRINCIPAL_DOES_NOT_MATTER,
+                agent=AGENT_FOR_TESTS,
+            )
+        await _check_integrity(di_container)
+
+    async with di_container.context() as ctx:
+        delete_command = await ctx.resolve(DeleteArticleDraftCommand)
+        await delete_command.execute(
+            article_draft_id=draft.id,
+            principal=journalist,
+            agent=AGENT_FOR_TESTS,
+        )
+    await _check_integrity(di_container)
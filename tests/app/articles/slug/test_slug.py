@@ -0,0 +1,55 @@
+import random
+
+from pisaka.app.articles.slug import (
+    _slugify_letter_by_letter,
+    is_valid_slug,
+    slugify,
+    slugify_many,
+)
+
+_ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyz"
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "0123456789"
+    "абвгдежзийклмнопрстуфхцчшщъыьэюяё"
+    "АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯЁ"
+    "  -_.,:;!?«»—–\"'()\t\n"
+    "İΣσςßÆæøéüñ中文🙂̇ "
+)
+
+
+def _random_texts(count: int, max_length: int) -> list[str]:
+    rnd = random.Random(20241127)
+    return [
+        "".join(rnd.choices(_ALPHABET, k=rnd.randint(0, max_length)))
+        for _ in range(count)
+    ]
+
+
+def test_slugify__same_as_letter_by_letter() -> None:
+    for text in _random_texts(count=5_000, max_length=40):
+        assert slugify(text) == _slugify_letter_by_letter(text), repr(text)
+
+
+def test_slugify__all_code_points() -> None:
+    for code_point in range(0x3000):
+        text = f"Ab {chr(code_point)} Яя"
+        assert slugify(text) == _slugify_letter_by_letter(text), hex(code_point)
+
+
+def test_slugify_many() -> None:
+    texts = _random_texts(count=100, max_length=40)
+    assert slugify_many(texts) == [_slugify_letter_by_letter(text) for text in texts]
+
+
+def test_slugify() -> None:
+    assert slugify("Привет, Мир! Hello-World 2024") == "privet-mir-helloworld-2024"
+
+
+def test_is_valid_slug() -> None:
+    assert is_valid_slug("privet-mir-2024")
+    assert not is_valid_slug("")
+    assert not is_valid_slug("Privet")
+    assert not is_valid_slug("privet mir")
+    assert not is_valid_slug("privet\n")
+    assert not is_valid_slug("привет")
@@ -0,0 +1,72 @@
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from uuid import uuid4
+
+import aioinject
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.authors import Author, AuthorId, AuthorRepository
+from pisaka.config.public_api import public_api_app
+
+pytestmark = [pytest.mark.anyio]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _PublicAPI:
+    client: httpx.AsyncClient
+    container: aioinject.Container
+
+
+@pytest.fixture
+async def public_api() -> AsyncGenerator[_PublicAPI, None]:
+    app = public_api_app()
+    assert isinstance(app, FastAPI)
+    # Контейнер приложения доступен только через его middleware,
+    # lifespan через ASGITransport не запускается
+    [middleware] = app.user_middleware
+    container = middleware.kwargs["container"]
+    assert isinstance(container, aioinject.Container)
+    async with (
+        container,
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://api",
+        ) as client,
+    ):
+        yield _PublicAPI(client=client, container=container)
+
+
+async def _create_author(container: aioinject.Container, name: str) -> AuthorId:
+    author_id = AuthorId(uuid4())
+    async with container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        repository = await ctx.resolve(AuthorRepository)
+        async with session.begin():
+            await repository.save(
+                Author.create(id_=author_id, name=name, is_real_person=True),
+            )
+    return author_id
+
+
+async def test_get_author(public_api: _PublicAPI) -> None:
+    author_id = await _create_author(public_api.container, "J. Doe")
+
+    response = await public_api.client.get(f"/authors/{author_id}")
+
+    assert response.status_code == httpx.codes.OK
+    assert response.json() == {"id": str(author_id), "name": "J. Doe"}
+    etag = response.headers["ETag"]
+    response = await public_api.client.get(
+        f"/authors/{author_id}",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == httpx.codes.NOT_MODIFIED
+
+
+async def test_get_author__not_found(public_api: _PublicAPI) -> None:
+    response = await public_api.client.get(f"/authors/{uuid4()}")
+
+    assert response.status_code == httpx.codes.NOT_FOUND
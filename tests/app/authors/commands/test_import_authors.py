@@ -0,0 +1,65 @@
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import aioinject
+import pytest
+
+from pisaka.app.authors import AuthorId, AuthorRepository, ImportAuthorsCommand
+from pisaka.app.authors.importing import AuthorImportRow
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.authorization import AuthorizationError
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+@pytest.fixture
+async def ctx(
+    di_container: aioinject.Container,
+) -> AsyncGenerator[aioinject.InjectionContext, None]:
+    async with di_container.context() as ctx:
+        yield ctx
+
+
+async def test_execute__rejects_conflicting_rows(
+    ctx: aioinject.InjectionContext,
+) -> None:
+    author_id = AuthorId(uuid4())
+    command = await ctx.resolve(ImportAuthorsCommand)
+    rejected_1 = await command.execute(
+        [AuthorImportRow(id=author_id, name="J. Doe")],
+        agent=AGENT_FOR_TESTS,
+    )
+    rejected_2 = await command.execute(
+        [
+            AuthorImportRow(name="Jane Doe"),
+            AuthorImportRow(id=author_id, name="J. Doe again"),
+        ],
+        agent=AGENT_FOR_TESTS,
+    )
+
+    assert rejected_1 == []
+    assert [index for index, _ in rejected_2] == [1]
+    repository = await ctx.resolve(AuthorRepository)
+    author = await repository.get_for_read(author_id)
+    assert author.name == "J. Doe"
+
+
+async def test_execute__unauthorized(ctx: aioinject.InjectionContext) -> None:
+    command = await ctx.resolve(ImportAuthorsCommand)
+    with pytest.raises(AuthorizationError):
+        await command.execute(
+            [AuthorImportRow(name="J. Doe")],
+            agent=PRINCIPAL_DOES_NOT_MATTER,
+        )
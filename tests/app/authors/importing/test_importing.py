@@ -0,0 +1,41 @@
+from pisaka.app.authors.importing import (
+    AuthorImportRow,
+    ParsedRow,
+    RejectedRow,
+    read_authors,
+)
+
+
+def test_read_authors__csv() -> None:
+    lines = [
+        "name,is_real_person,id\n",
+        "J. Doe,true,\n",
+        ",false,\n",
+        "Baron Munchausen,false,d2c5e3b4-6f4e-4b7a-8d7e-6a1c5d0b9a41\n",
+    ]
+
+    rows = list(read_authors(lines, "csv"))
+
+    assert rows[0] == ParsedRow(
+        line=2,
+        row=AuthorImportRow(name="J. Doe", is_real_person=True),
+    )
+    assert isinstance(rows[1], RejectedRow)
+    assert rows[1].line == 3  # noqa: PLR2004
+    assert isinstance(rows[2], ParsedRow)
+    assert rows[2].row.id is not None
+
+
+def test_read_authors__ndjson() -> None:
+    lines = [
+        '{"name": "J. Doe"}\n',
+        "\n",
+        "{not json}\n",
+        '{"name": "J. Doe", "age": 42}\n',
+    ]
+
+    rows = list(read_authors(lines, "ndjson"))
+
+    assert rows[0] == ParsedRow(line=1, row=AuthorImportRow(name="J. Doe"))
+    assert [row.line for row in rows[1:]] == [3, 4]
+    assert all(isinstance(row, RejectedRow) for row in rows[1:])
@@ -0,0 +1,69 @@
+from collections.abc import AsyncGenerator
+from uuid import UUID, uuid4
+
+import aioinject
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.authors import (
+    AuthorStatsService,
+    CreateAuthorCommand,
+    SetDefaultAuthorCommand,
+)
+from pisaka.app.authors.entities import Author
+from pisaka.app.authors.queries import list_authors_with_stats
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def _create_author(container: aioinject.Container) -> Author:
+    async with container.context() as ctx:
+        command = await ctx.resolve(CreateAuthorCommand)
+        return await command.execute(
+            name="J. Doe",
+            is_real_person=True,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+
+
+async def test_list_authors_with_stats(di_container: aioinject.Container) -> None:
+    author = await _create_author(di_container)
+    author_without_stats = await _create_author(di_container)
+    user_ids = {uuid4(), uuid4()}
+    for user_id in user_ids:
+        async with di_container.context() as ctx:
+            set_command = await ctx.resolve(SetDefaultAuthorCommand)
+            await set_command.execute(user_id=user_id, author_id=author.id)
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        author_stats_service = await ctx.resolve(AuthorStatsService)
+        async with session.begin():
+            await author_stats_service.add(author.id, articles=2)
+            await author_stats_service.delete(author_id=author_without_stats.id)
+        rows = {row.id: row for row in await list_authors_with_stats(session)}
+
+    row = rows[author.id]
+    assert set(row.default_for_users) == user_ids
+    assert all(type(user_id) is UUID for user_id in row.default_for_users)
+    assert row.count_of_articles == 2  # noqa: PLR2004
+    assert row.count_of_article_drafts_in_work == 0
+
+    row_without_stats = rows[author_without_stats.id]
+    assert row_without_stats.default_for_users == []
+    assert row_without_stats.count_of_articles == 0
+    assert row_without_stats.count_of_article_drafts_in_work == 0
@@ -5,7 +5,12 @@ import aioinject
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pisaka.app.authors import Author, AuthorId, AuthorRepository
+from pisaka.app.authors import (
+    Author,
+    AuthorId,
+    AuthorRepository,
+    ReadOnlyAuthorRepository,
+)
 from pisaka.config.config_files import load_config
 from pisaka.config.di import create_base_di_container
 from pisaka.platform.errors import NotFoundError
@@ -91,3 +96,68 @@ async def test_delete(ctx: aioinject.InjectionContext) -> None:
             await repository.get(author_id=author_id)
     finally:
         await session.rollback()
+
+
+async def test_find_many__preserves_order_and_reports_missing(
+    ctx: aioinject.InjectionContext,
+) -> None:
+    repository = await ctx.resolve(AuthorRepository)
+    session = await ctx.resolve(AsyncSession)
+
+    await session.begin()
+    try:
+        saved_ids = [AuthorId(uuid4()) for _ in range(3)]
+        for index, author_id in enumerate(saved_ids):
+            await repository.save(
+                Author.create(
+                    id_=author_id,
+                    name=f"Author {index}",
+                    is_real_person=True,
+                ),
+            )
+        session.expunge_all()
+
+        missing_id = AuthorId(uuid4())
+        ids = [saved_ids[2], missing_id, saved_ids[0], saved_ids[2]]
+        authors = await repository.find_many(ids)
+
+        assert [author.id if author else None for author in authors] == [
+            saved_ids[2],
+            None,
+            saved_ids[0],
+            saved_ids[2],
+        ]
+        with pytest.raises(NotFoundError):
+            await repository.get_many(ids)
+        assert [
+            author.id for author in await repository.get_many(saved_ids[::-1])
+        ] == saved_ids[::-1]
+    finally:
+        await session.rollback()
+
+
+async def test_find_many__splits_into_chunks(ctx: aioinject.InjectionContext) -> None:
+    repository = await ctx.resolve(AuthorRepository)
+    ids = [AuthorId(uuid4()) for _ in range(1200)]
+    assert await repository.find_many(ids) == [None] * len(ids)
+
+
+async def test_read_only_repository__reads_committed_authors(
+    ctx: aioinject.InjectionContext,
+) -> None:
+    repository = await ctx.resolve(AuthorRepository)
+    session = await ctx.resolve(AsyncSession)
+    author_id = AuthorId(uuid4())
+    async with session.begin():
+        await repository.save(
+            Author.create(id_=author_id, name="J. Doe", is_real_person=True),
+        )
+
+    read_only_repository = await ctx.resolve(ReadOnlyAuthorRepository)
+    [author, missing] = await read_only_repository.find_many(
+        [author_id, AuthorId(uuid4())],
+    )
+
+    assert author is not None
+    assert author.name == "J. Doe"
+    assert missing is None
@@ -0,0 +1,52 @@
+from collections.abc import AsyncGenerator
+
+import aioinject
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.authors import AuthorStatsService, CreateAuthorCommand
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def test_add__creates_missing_stats(di_container: aioinject.Container) -> None:
+    async with di_container.context() as ctx:
+        command = await ctx.resolve(CreateAuthorCommand)
+        author = await command.execute(
+            name="J. Doe",
+            is_real_person=True,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        service = await ctx.resolve(AuthorStatsService)
+        async with session.begin():
+            await service.delete(author_id=author.id)
+        async with session.begin():
+            await service.add(author.id, articles=1)
+        async with session.begin():
+            await service.add(author.id, articles=1, article_drafts_in_work=-1)
+        async with session.begin():
+            [stats] = [
+                stats
+                for stats in await service.get_all()
+                if stats.author_id == author.id
+            ]
+
+    assert stats.count_of_articles == 2  # noqa: PLR2004
+    assert stats.count_of_article_drafts_in_work == -1
@@ -0,0 +1,73 @@
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import aioinject
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.authors import (
+    AuthorId,
+    DefaultAuthorService,
+    ResetDefaultAuthorCommand,
+    SetDefaultAuthorCommand,
+)
+from pisaka.app.authors.services import DefaultAuthorCache
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.logging import init_logging
+from pisaka.platform.write_queue import WriteQueue
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    init_logging(config.logging)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def test_get__cached_and_invalidated(di_container: aioinject.Container) -> None:
+    user_id = uuid4()
+    author_id = AuthorId(uuid4())
+
+    async with di_container.context() as ctx:
+        cache = await ctx.resolve(DefaultAuthorCache)
+        service = await ctx.resolve(DefaultAuthorService)
+        assert await service.get(user_id=user_id) is None
+        assert await service.get(user_id=user_id) is None
+        assert cache.stats().hits == 1
+
+    async with di_container.context() as ctx:
+        set_command = await ctx.resolve(SetDefaultAuthorCommand)
+        await set_command.execute(user_id=user_id, author_id=author_id)
+
+    async with di_container.context() as ctx:
+        service = await ctx.resolve(DefaultAuthorService)
+        assert await service.get(user_id=user_id) == author_id
+
+    async with di_container.context() as ctx:
+        reset_command = await ctx.resolve(ResetDefaultAuthorCommand)
+        await reset_command.execute(user_id=user_id)
+
+    async with di_container.context() as ctx:
+        service = await ctx.resolve(DefaultAuthorService)
+        assert await service.get(user_id=user_id) is None
+
+
+async def test_get__not_cached_in_write_transaction(
+    di_container: aioinject.Container,
+) -> None:
+    user_id = uuid4()
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        write_queue = await ctx.resolve(WriteQueue)
+        cache = await ctx.resolve(DefaultAuthorCache)
+        service = await ctx.resolve(DefaultAuthorService)
+        async with write_queue.begin(session):
+            assert await service.get(user_id=user_id) is None
+
+    assert cache.stats().size == 0
@@ -0,0 +1,251 @@
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import aioinject
+import httpx
+import jwt
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.app.authors import AuthorModel, CreateAuthorCommand, DefaultAuthorService
+from pisaka.config.config_files import load_config
+from pisaka.config.internal_api import internal_api_app
+
+pytestmark = [pytest.mark.anyio]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _InternalAPI:
+    client: httpx.AsyncClient
+    container: aioinject.Container
+    user_id: UUID
+
+
+def _make_token(user_id: UUID) -> str:
+    # Такой же токен, как выдает `pisaka dev jwt` для админки
+    config = load_config()
+    options = config.internal_api.jwt_authentication
+    now = datetime.now(tz=UTC)
+    return jwt.encode(
+        payload={
+            "iss": options.issuer,
+            "sub": str(user_id),
+            "exp": (now + timedelta(minutes=5)).timestamp(),
+            "aud": [options.audience],
+            "azp": config.security.agent_name_admin_panel,
+            "username": "j.doe",
+            "email": "j.doe@mail.com",
+            "given_name": "John",
+            "family_name": "Doe",
+            "client_roles": {"pisaka-backend": ["journalist", "editor", "chief"]},
+        },
+        key=options.private_key,
+        algorithm=options.algorithm,
+    )
+
+
+@pytest.fixture
+async def internal_api() -> AsyncGenerator[_InternalAPI, None]:
+    app = internal_api_app()
+    assert isinstance(app, FastAPI)
+    # Контейнер приложения доступен только через его middleware,
+    # lifespan через ASGITransport не запускается
+    [middleware] = app.user_middleware
+    container = middleware.kwargs["container"]
+    assert isinstance(container, aioinject.Container)
+    user_id = uuid4()
+    async with (
+        container,
+        httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://internal-api",
+            headers={"Authorization": f"Bearer {_make_token(user_id)}"},
+        ) as client,
+    ):
+        yield _InternalAPI(client=client, container=container, user_id=user_id)
+
+
+async def _execute_batch(
+    internal_api: _InternalAPI,
+    operations: list[dict[str, Any]],
+    *,
+    atomic: bool,
+) -> list[dict[str, Any]]:
+    response = await internal_api.client.post(
+        "/batch",
+        json={"operations": operations, "atomic": atomic},
+    )
+    assert response.status_code == httpx.codes.OK
+    results: list[dict[str, Any]] = response.json()["results"]
+    return results
+
+
+async def _find_author_names(
+    internal_api: _InternalAPI,
+    names: list[str],
+) -> set[str]:
+    async with internal_api.container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        result = await session.scalars(
+            select(AuthorModel.name).where(AuthorModel.name.in_(names)),
+        )
+        return set(result)
+
+
+def _create_author(name: str) -> dict[str, Any]:
+    return {"op": "create_author", "name": name, "is_real_person": True}
+
+
+def _update_missing_author() -> dict[str, Any]:
+    return {"op": "update_author", "author_id": str(uuid4()), "name": "Nobody"}
+
+
+def _make_names(count: int) -> list[str]:
+    return [f"Batch {uuid4().hex[:8]}" for _ in range(count)]
+
+
+async def test_not_atomic__failure_does_not_affect_other_operations(
+    internal_api: _InternalAPI,
+) -> None:
+    name_1, name_2 = _make_names(2)
+
+    results = await _execute_batch(
+        internal_api,
+        [_create_author(name_1), _update_missing_author(), _create_author(name_2)],
+        atomic=False,
+    )
+
+    assert [result["status"] for result in results] == ["ok", "failed", "ok"]
+    assert results[0]["author"]["name"] == name_1
+    assert results[1]["error"]
+    assert results[2]["author"]["name"] == name_2
+    assert await _find_author_names(internal_api, [name_1, name_2]) == {
+        name_1,
+        name_2,
+    }
+
+
+async def test_atomic__results_of_each_operation(internal_api: _InternalAPI) -> None:
+    name_1, name_2 = _make_names(2)
+
+    results = await _execute_batch(
+        internal_api,
+        [
+            _create_author(name_1),
+            {
+                "op": "reset_default_author",
+                "user_id": str(uuid4()),
+            },
+            _create_author(name_2),
+        ],
+        atomic=True,
+    )
+
+    assert [result["status"] for result in results] == ["ok", "ok", "ok"]
+    assert [result["author"] and result["author"]["name"] for result in results] == [
+        name_1,
+        None,
+        name_2,
+    ]
+    assert await _find_author_names(internal_api, [name_1, name_2]) == {
+        name_1,
+        name_2,
+    }
+
+
+async def test_atomic__failure_rolls_back_earlier_operations(
+    internal_api: _InternalAPI,
+) -> None:
+    # Две операции до ошибки: точка сохранения первой уже освобождена,
+    # когда выполняется вторая, и откат пакета должен отменить обе
+    name_1, name_2, name_3 = _make_names(3)
+
+    results = await _execute_batch(
+        internal_api,
+        [
+            _create_author(name_1),
+            _create_author(name_2),
+            _update_missing_author(),
+            _create_author(name_3),
+        ],
+        atomic=True,
+    )
+
+    assert [result["status"] for result in results] == [
+        "rolled_back",
+        "rolled_back",
+        "failed",
+        "skipped",
+    ]
+    assert results[2]["error"]
+    assert await _find_author_names(internal_api, [name_1, name_2, name_3]) == set()
+
+
+async def test_atomic__failure_drops_default_authors_from_cache(
+    internal_api: _InternalAPI,
+) -> None:
+    [name] = _make_names(1)
+    [result] = await _execute_batch(internal_api, [_create_author(name)], atomic=True)
+    user_id = internal_api.user_id
+
+    # Создание черновика читает автора по умолчанию внутри транзакции пакета,
+    # уже после его изменения
+    results = await _execute_batch(
+        internal_api,
+        [
+            {
+                "op": "set_default_author",
+                "user_id": str(user_id),
+                "author_id": result["author"]["id"],
+            },
+            {"op": "create_article_draft"},
+            _update_missing_author(),
+        ],
+        atomic=True,
+    )
+
+    assert [result["status"] for result in results] == [
+        "rolled_back",
+        "rolled_back",
+        "failed",
+    ]
+    async with internal_api.container.context() as ctx:
+        default_author_service = await ctx.resolve(DefaultAuthorService)
+        assert await default_author_service.get(user_id=user_id) is None
+
+
+async def test_invalid_state__failed_result(internal_api: _InternalAPI) -> None:
+    [draft_result] = await _execute_batch(
+        internal_api,
+        [{"op": "create_article_draft"}],
+        atomic=True,
+    )
+
+    # У нового черновика нет автора и текста, публиковать его нельзя
+    [result] = await _execute_batch(
+        internal_api,
+        [{"op": "publish_article", "article_draft_id": draft_result["draft"]["id"]}],
+        atomic=False,
+    )
+
+    assert result["status"] == "failed"
+    assert result["error"].startswith("Invalid draft")
+
+
+async def test_unexpected_error__not_turned_into_result(
+    internal_api: _InternalAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def execute(*_: object, **__: object) -> None:
+        raise RuntimeError
+
+    monkeypatch.setattr(CreateAuthorCommand, "execute", execute)
+    [name] = _make_names(1)
+
+    with pytest.raises(RuntimeError):
+        await _execute_batch(internal_api, [_create_author(name)], atomic=False)
@@ -5,6 +5,20 @@ pytest_plugins = [
 ]
 
 
+class FakeClock:
+    # Часы для кэшей и прочего, что принимает clock, время двигает сам тест
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 @pytest.fixture(scope="session")
 def anyio_backend() -> str:
     return "asyncio"
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
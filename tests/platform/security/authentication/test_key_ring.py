@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from pisaka.platform.security.authentication.key_ring import (
+    JWKSFileSigningKeyRing,
+    SigningKeyRing,
+    UnknownSigningKeyError,
+)
+
+
+def _make_key_pair() -> tuple[rsa.RSAPrivateKey, rsa.RSAPublicKey]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key, private_key.public_key()
+
+
+def _make_jwks(keys: dict[str, rsa.RSAPublicKey]) -> str:
+    return json.dumps(
+        {
+            "keys": [
+                {**RSAAlgorithm.to_jwk(key, as_dict=True), "kid": kid, "alg": "RS256"}
+                for kid, key in keys.items()
+            ],
+        },
+    )
+
+
+def _sign(private_key: rsa.RSAPrivateKey, kid: str | None) -> str:
+    headers = {"kid": kid} if kid else None
+    return jwt.encode({"sub": "x"}, private_key, algorithm="RS256", headers=headers)
+
+
+def test_get_key__by_kid() -> None:
+    private_key_1, public_key_1 = _make_key_pair()
+    private_key_2, public_key_2 = _make_key_pair()
+    key_ring = SigningKeyRing.from_jwks(
+        _make_jwks({"key-1": public_key_1, "key-2": public_key_2}),
+    )
+
+    token = _sign(private_key_2, kid="key-2")
+
+    key = key_ring.get_key(token)
+    assert key.public_numbers() == public_key_2.public_numbers()
+    assert jwt.decode(token, key, algorithms=["RS256"]) == {"sub": "x"}
+
+
+def test_get_key__unknown_kid() -> None:
+    private_key_1, public_key_1 = _make_key_pair()
+    _, public_key_2 = _make_key_pair()
+    key_ring = SigningKeyRing.from_jwks(
+        _make_jwks({"key-1": public_key_1, "key-2": public_key_2}),
+    )
+
+    with pytest.raises(UnknownSigningKeyError):
+        key_ring.get_key(_sign(private_key_1, kid="key-3"))
+
+
+def test_jwks_file__reloaded_on_change(tmp_path: Path) -> None:
+    private_key_1, public_key_1 = _make_key_pair()
+    private_key_2, public_key_2 = _make_key_pair()
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(_make_jwks({"key-1": public_key_1}))
+    now = 0.0
+    key_ring = JWKSFileSigningKeyRing(
+        path=jwks_file,
+        check_interval_sec=10,
+        clock=lambda: now,
+    )
+    token = _sign(private_key_2, kid="key-2")
+    with pytest.raises(UnknownSigningKeyError):
+        key_ring.get_key(token)
+
+    jwks_file.write_text(_make_jwks({"key-1": public_key_1, "key-2": public_key_2}))
+    now = 10.0
+
+    assert key_ring.get_key(token).public_numbers() == public_key_2.public_numbers()
+
+
+def test_jwks_file__generation_checks_for_change(tmp_path: Path) -> None:
+    _, public_key_1 = _make_key_pair()
+    _, public_key_2 = _make_key_pair()
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(_make_jwks({"key-1": public_key_1}))
+    now = 0.0
+    key_ring = JWKSFileSigningKeyRing(
+        path=jwks_file,
+        check_interval_sec=10,
+        clock=lambda: now,
+    )
+    generation = key_ring.generation
+
+    jwks_file.write_text(_make_jwks({"key-2": public_key_2}))
+    now = 10.0
+
+    # Ротация видна без обращения к find, которого нет при попадании в кэш
+    assert key_ring.generation != generation
+    assert key_ring.find("key-1") is None
@@ -0,0 +1,68 @@
+from pisaka.platform.cache import MISSING
+from pisaka.platform.security.authentication.token_cache import VerifiedTokenCache
+from tests.conftest import FakeClock
+
+
+def test_get__hit_and_miss(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(max_size=10, clock=clock)
+    key = VerifiedTokenCache.make_key("token")
+    value = object()
+
+    assert cache.get(key) is MISSING
+    cache.put(key, value, expires_at=1000.0)
+    assert cache.get(key) is value
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_get__expired(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(max_size=10, clock=clock)
+    key = VerifiedTokenCache.make_key("token")
+    cache.put(key, object(), expires_at=500.0)
+
+    clock.now = 500.0
+
+    assert cache.get(key) is MISSING
+    assert cache.stats().size == 0
+
+
+def test_put__already_expired(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(max_size=10, clock=clock)
+    key = VerifiedTokenCache.make_key("token")
+    clock.now = 500.0
+
+    cache.put(key, object(), expires_at=500.0)
+
+    assert cache.stats().size == 0
+
+
+def test_put__evicts_least_recently_used(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(max_size=2, clock=clock)
+    key_1 = VerifiedTokenCache.make_key("token-1")
+    key_2 = VerifiedTokenCache.make_key("token-2")
+    key_3 = VerifiedTokenCache.make_key("token-3")
+    cache.put(key_1, 1, expires_at=1000.0)
+    cache.put(key_2, 2, expires_at=1000.0)
+
+    cache.get(key_1)
+    cache.put(key_3, 3, expires_at=1000.0)
+
+    assert cache.get(key_1) == 1
+    assert cache.get(key_2) is MISSING
+    assert cache.get(key_3) == 3  # noqa: PLR2004
+
+
+def test_use_key_ring_generation__clears_on_change(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(max_size=10, clock=clock)
+    key = VerifiedTokenCache.make_key("token")
+    cache.use_key_ring_generation(1)
+    cache.put(key, 1, expires_at=1000.0)
+
+    cache.use_key_ring_generation(1)
+    assert cache.get(key) == 1
+
+    cache.use_key_ring_generation(2)
+    assert cache.get(key) is MISSING
@@ -0,0 +1,43 @@
+from uuid import uuid4
+
+from pisaka.platform.security.claims import (
+    AgentNameClaim,
+    Claim,
+    ClaimsIdentity,
+    EmailClaim,
+    PisakaRoleClaim,
+    UserIdClaim,
+)
+from pisaka.platform.security.roles import PisakaRole
+from pisaka.platform.security.utils import has_all_roles, has_any_role, has_role
+
+
+def test_find_first_and_find_all() -> None:
+    user_id_claim = UserIdClaim(user_id=uuid4())
+    email_claim_1 = EmailClaim(email="j.doe@mail.com")
+    email_claim_2 = EmailClaim(email="john.doe@mail.com")
+    identity = ClaimsIdentity(claims=[email_claim_1, user_id_claim, email_claim_2])
+
+    assert identity.find_first(UserIdClaim) is user_id_claim
+    assert identity.find_first(EmailClaim) is email_claim_1
+    assert identity.find_first(AgentNameClaim) is None
+    assert identity.find_all(EmailClaim) == [email_claim_1, email_claim_2]
+    assert identity.find_all(AgentNameClaim) == []
+    assert identity.find_all(Claim) == [email_claim_1, user_id_claim, email_claim_2]
+
+
+def test_roles() -> None:
+    identity = ClaimsIdentity(
+        claims=[
+            PisakaRoleClaim(role=PisakaRole.JOURNALIST),
+            PisakaRoleClaim(role=PisakaRole.EDITOR),
+        ],
+    )
+
+    assert identity.roles == {PisakaRole.JOURNALIST, PisakaRole.EDITOR}
+    assert has_role(identity, PisakaRole.EDITOR)
+    assert not has_role(identity, PisakaRole.CHIEF)
+    assert has_any_role(identity, frozenset([PisakaRole.CHIEF, PisakaRole.EDITOR]))
+    assert not has_any_role(identity, [PisakaRole.CHIEF])
+    assert has_all_roles(identity, [PisakaRole.JOURNALIST, PisakaRole.EDITOR])
+    assert not has_all_roles(identity, [PisakaRole.JOURNALIST, PisakaRole.CHIEF])
@@ -0,0 +1,44 @@
+import json
+from dataclasses import dataclass
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from pisaka.platform.api import BaseSchema, SchemaResponse
+
+
+class _ItemSchema(BaseSchema):
+    id: UUID
+    name: str
+
+
+class _ListSchema(BaseSchema):
+    items: list[_ItemSchema]
+
+
+@dataclass
+class _Row:
+    id: UUID
+    name: str
+
+
+def test_model_validate_list__from_attributes() -> None:
+    rows = [_Row(id=UUID(int=1), name="a"), _Row(id=UUID(int=2), name="b")]
+    items = _ItemSchema.model_validate_list(row for row in rows)
+    assert items == [
+        _ItemSchema(id=UUID(int=1), name="a"),
+        _ItemSchema(id=UUID(int=2), name="b"),
+    ]
+
+
+def test_model_validate_list__invalid_item() -> None:
+    with pytest.raises(ValidationError):
+        _ItemSchema.model_validate_list([{"id": "not-uuid", "name": "a"}])
+
+
+def test_schema_response__matches_default_encoding() -> None:
+    schema = _ListSchema(items=[_ItemSchema(id=UUID(int=1), name="Имя")])
+    response = SchemaResponse(schema)
+    assert json.loads(bytes(response.body)) == json.loads(schema.model_dump_json())
+    assert response.media_type == "application/json"
@@ -0,0 +1,55 @@
+from pisaka.platform.cache import MISSING, TTLCache
+from tests.conftest import FakeClock
+
+
+def test_get__negative_value_is_cached() -> None:
+    cache: TTLCache[str, int | None] = TTLCache(max_size=10, ttl_sec=10)
+
+    assert cache.get("key") is MISSING
+    cache.put("key", None)
+
+    assert cache.get("key") is None
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_get__expired(clock: FakeClock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_sec=10, clock=clock)
+    cache.put("key", 1)
+
+    clock.now = 9.9
+    assert cache.get("key") == 1
+    clock.now = 10.0
+    assert cache.get("key") is MISSING
+
+
+def test_put__evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_sec=10)
+    cache.put("key-1", 1)
+    cache.put("key-2", 2)
+
+    cache.get("key-1")
+    cache.put("key-3", 3)
+
+    assert cache.get("key-1") == 1
+    assert cache.get("key-2") is MISSING
+    assert cache.get("key-3") == 3  # noqa: PLR2004
+
+
+def test_invalidate() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_sec=10)
+    cache.put("key", 1)
+
+    cache.invalidate("key")
+
+    assert cache.get("key") is MISSING
+
+
+def test_put__expires_at(clock: FakeClock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_sec=10, clock=clock)
+    cache.put("key", 1, expires_at=5.0)
+
+    clock.now = 4.9
+    assert cache.get("key") == 1
+    clock.now = 5.0
+    assert cache.get("key") is MISSING
@@ -0,0 +1,28 @@
+from collections.abc import AsyncGenerator
+
+import aioinject
+import pytest
+
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.db import ReadOnlyAsyncSession, ReadOnlySessionError
+from pisaka.platform.versions import CollectionVersionModel
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    container = create_base_di_container(load_config())
+    async with container:
+        yield container
+
+
+async def test_read_only_session__rejects_changes(
+    di_container: aioinject.Container,
+) -> None:
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(ReadOnlyAsyncSession)
+        session.add(CollectionVersionModel(name="test", version=1))
+        with pytest.raises(ReadOnlySessionError):
+            await session.flush()
@@ -0,0 +1,115 @@
+from typing import Annotated
+
+import aioinject
+import pytest
+from aioinject import Inject
+from aioinject.validation import DEFAULT_VALIDATORS, validate_container
+from aioinject.validation.error import ContainerValidationErrorGroup
+from fastapi import FastAPI
+
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.di import (
+    collect_endpoint_dependencies,
+    collect_providers,
+    inject,
+    validate_and_warm_up_container,
+)
+
+pytestmark = [pytest.mark.anyio]
+
+
+class _Session:
+    pass
+
+
+class _Permission:
+    created = 0
+
+    def __init__(self) -> None:
+        _Permission.created += 1
+
+
+class _Command:
+    def __init__(self, session: _Session, permission: _Permission) -> None:
+        self.session = session
+        self.permission = permission
+
+
+class _CachingPermission:
+    def __init__(self, session: _Session) -> None:
+        self.session = session
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/commands")
+    @inject
+    async def execute(command: Annotated[_Command, Inject]) -> None:
+        pass
+
+    return app
+
+
+def test_base_container_is_valid() -> None:
+    validate_container(create_base_di_container(load_config()), DEFAULT_VALIDATORS)
+
+
+def test_collect_providers() -> None:
+    container = aioinject.Container()
+    container.register(aioinject.Scoped(_Session))
+    container.register(aioinject.Singleton(_Permission))
+    container.register(aioinject.Scoped(_Command))
+
+    endpoints = collect_endpoint_dependencies(_create_app().routes)
+
+    assert {
+        endpoint: [dependency.type_ for dependency in dependencies]
+        for endpoint, dependencies in endpoints.items()
+    } == {"POST /commands": [_Command]}
+    assert [
+        provider.type_
+        for provider in collect_providers(container, [_Command, _Session])
+    ] == [_Session, _Permission, _Command]
+
+
+async def test_validate_and_warm_up_container() -> None:
+    container = aioinject.Container()
+    container.register(aioinject.Scoped(_Session))
+    container.register(aioinject.Singleton(_Permission))
+    container.register(aioinject.Scoped(_Command))
+    created = _Permission.created
+
+    async with container:
+        await validate_and_warm_up_container(container, _create_app().routes)
+        # Синглтон создан при старте, а не первым запросом
+        assert _Permission.created == created + 1
+        async with container.context() as ctx:
+            command = await ctx.resolve(_Command)
+        async with container.context() as ctx:
+            command_2 = await ctx.resolve(_Command)
+
+    assert _Permission.created == created + 1
+    assert command.permission is command_2.permission
+    assert command.session is not command_2.session
+
+
+async def test_validate_and_warm_up_container__missing_provider() -> None:
+    container = aioinject.Container()
+    container.register(aioinject.Scoped(_Session))
+    container.register(aioinject.Singleton(_Permission))
+
+    async with container:
+        with pytest.raises(ContainerValidationErrorGroup):
+            await validate_and_warm_up_container(container, _create_app().routes)
+
+
+async def test_validate_and_warm_up_container__singleton_depends_on_scoped() -> None:
+    container = aioinject.Container()
+    container.register(aioinject.Scoped(_Session))
+    container.register(aioinject.Singleton(_CachingPermission))
+
+    async with container:
+        with pytest.raises(ContainerValidationErrorGroup):
+            await validate_and_warm_up_container(container, [])
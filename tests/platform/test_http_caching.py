@@ -0,0 +1,46 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from fastapi import Request, Response
+
+from pisaka.platform.http_caching import is_not_modified, make_etag, set_public_cache
+
+
+def _request(if_none_match: str | None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ('"1"', False),
+        ('"7"', True),
+        ('W/"7"', True),
+        ('"1", W/"7"', True),
+        ("*", True),
+    ],
+)
+def test_is_not_modified(
+    if_none_match: str | None,
+    expected: bool,  # noqa: FBT001
+) -> None:
+    assert is_not_modified(_request(if_none_match), make_etag(7)) is expected
+
+
+@pytest.mark.parametrize(
+    "last_modified",
+    [
+        datetime(2026, 1, 2, 3, 4, 5),  # noqa: DTZ001
+        datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        datetime(2026, 1, 2, 6, 4, 5, tzinfo=timezone(timedelta(hours=3))),
+    ],
+)
+def test_set_public_cache(last_modified: datetime) -> None:
+    response = Response()
+    set_public_cache(response, max_age_sec=30, last_modified=last_modified)
+    assert response.headers["Cache-Control"] == "public, max-age=30"
+    assert response.headers["Last-Modified"] == "Fri, 02 Jan 2026 03:04:05 GMT"
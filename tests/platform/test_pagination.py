@@ -0,0 +1,17 @@
+import pytest
+
+from pisaka.platform.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_encode_decode() -> None:
+    cursor = encode_cursor("2024-11-27T10:00:00", "d2c5e3b4")
+    assert decode_cursor(cursor, size=2) == ["2024-11-27T10:00:00", "d2c5e3b4"]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "garbage!", encode_cursor("a", "b"), "eyJhIjogMX0"],
+)
+def test_decode__invalid(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, size=1)
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import create_engine
+
+from pisaka.app.articles.hot_queries import HOT_QUERIES as ARTICLES_HOT_QUERIES
+from pisaka.app.authors.hot_queries import HOT_QUERIES as AUTHORS_HOT_QUERIES
+from pisaka.platform.db import DBModel
+from pisaka.platform.query_plan import explain_query_plan, find_full_scan
+
+
+@pytest.mark.parametrize(
+    ("step", "table"),
+    [
+        ("SCAN articles", "articles"),
+        ("SCAN TABLE articles", "articles"),
+        ("SCAN articles AS a", "articles"),
+        ("SCAN articles USING COVERING INDEX ix_articles_author_id", None),
+        ("SEARCH authors USING INDEX sqlite_autoindex_authors_1 (id=?)", None),
+        ("SCAN CONSTANT ROW", None),
+        ("USE TEMP B-TREE FOR GROUP BY", None),
+    ],
+)
+def test_find_full_scan(step: str, table: str | None) -> None:
+    assert find_full_scan(step) == table
+
+
+def test_hot_queries_use_indexes() -> None:
+    engine = create_engine("sqlite://")
+    DBModel.metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        plans = [
+            explain_query_plan(connection, query)
+            for query in [*AUTHORS_HOT_QUERIES, *ARTICLES_HOT_QUERIES]
+        ]
+    assert {plan.query.name: plan.full_scans for plan in plans if plan.full_scans} == {}
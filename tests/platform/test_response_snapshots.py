@@ -0,0 +1,45 @@
+import gzip
+
+import pytest
+from fastapi import Request
+
+from pisaka.platform.response_snapshots import (
+    IDENTITY,
+    ResponseSnapshot,
+    brotli,
+    choose_encoding,
+)
+
+
+def _request(accept_encoding: str | None) -> Request:
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_build() -> None:
+    body = b'{"authors": []}' * 100
+    snapshot = ResponseSnapshot.build(body)
+    assert snapshot.bodies[IDENTITY] == body
+    assert gzip.decompress(snapshot.bodies["gzip"]) == body
+    assert ("br" in snapshot.bodies) is (brotli is not None)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, IDENTITY),
+        ("identity", IDENTITY),
+        ("gzip", "gzip"),
+        ("GZIP;q=0.5", "gzip"),
+        ("gzip;q=0", IDENTITY),
+        ("deflate, gzip;q=0.8", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br" if brotli is not None else "gzip"),
+        ("br;q=0, *", "gzip"),
+        ("br;q=0, gzip;q=0, *", IDENTITY),
+    ],
+)
+def test_choose_encoding(accept_encoding: str | None, expected: str) -> None:
+    assert choose_encoding(_request(accept_encoding)) == expected
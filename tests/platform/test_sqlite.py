@@ -0,0 +1,66 @@
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import aioinject
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.sqlite import SQLiteProfile, use_explicit_sqlite_transactions
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    config.db.sqlite = SQLiteProfile(busy_timeout_ms=1234)
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def test_profile_is_applied(di_container: aioinject.Container) -> None:
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(AsyncSession)
+        journal_mode = await session.scalar(text("PRAGMA journal_mode"))
+        busy_timeout = await session.scalar(text("PRAGMA busy_timeout"))
+        temp_store = await session.scalar(text("PRAGMA temp_store"))
+
+    assert journal_mode == "wal"
+    assert busy_timeout == 1234  # noqa: PLR2004
+    assert temp_store == 2  # noqa: PLR2004
+
+
+def _count_after_rollback_of_released_savepoint(engine: Engine) -> int:
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER)"))
+        connection.commit()
+
+        transaction = connection.begin()
+        with connection.begin_nested():
+            connection.execute(text("INSERT INTO items VALUES (1)"))
+        transaction.rollback()
+
+        count: int = connection.execute(text("SELECT count(*) FROM items")).scalar_one()
+    engine.dispose()
+    return count
+
+
+def test_explicit_transactions__rollback_undoes_released_savepoint(
+    tmp_path: Path,
+) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    use_explicit_sqlite_transactions(engine)
+
+    assert _count_after_rollback_of_released_savepoint(engine) == 0
+
+
+def test_implicit_transactions__release_commits_savepoint(tmp_path: Path) -> None:
+    # Без явных транзакций драйвер sqlite3 коммитит при RELEASE, на этом
+    # поведении и держится необходимость use_explicit_sqlite_transactions
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    assert _count_after_rollback_of_released_savepoint(engine) == 1
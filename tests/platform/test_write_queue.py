@@ -0,0 +1,247 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import aioinject
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from pisaka.app.authors import (
+    Author,
+    AuthorId,
+    AuthorModel,
+    CreateAuthorCommand,
+    UpdateAuthorCommand,
+)
+from pisaka.config.config_files import load_config
+from pisaka.config.di import create_base_di_container
+from pisaka.platform.db import ReadOnlyAsyncSession
+from pisaka.platform.errors import NotFoundError
+from pisaka.platform.security.utils import AGENT_FOR_TESTS, PRINCIPAL_DOES_NOT_MATTER
+from pisaka.platform.write_queue import WriteQueue, _Turn
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+async def di_container() -> AsyncGenerator[aioinject.Container, None]:
+    config = load_config()
+    config.db.write_queue.enabled = True
+    container = create_base_di_container(config)
+    async with container:
+        yield container
+
+
+async def _create_author(container: aioinject.Container, name: str) -> Author:
+    async with container.context() as ctx:
+        command = await ctx.resolve(CreateAuthorCommand)
+        return await command.execute(
+            name=name,
+            is_real_person=True,
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+
+
+async def _update_unknown_author(container: aioinject.Container) -> Author:
+    async with container.context() as ctx:
+        command = await ctx.resolve(UpdateAuthorCommand)
+        return await command.execute(
+            author_id=AuthorId(uuid4()),
+            new_name="Nobody",
+            principal=PRINCIPAL_DOES_NOT_MATTER,
+            agent=AGENT_FOR_TESTS,
+        )
+
+
+async def test_concurrent_commands_are_group_committed(
+    di_container: aioinject.Container,
+) -> None:
+    results = await asyncio.gather(
+        *(_create_author(di_container, f"Author {i}") for i in range(10)),
+        _update_unknown_author(di_container),
+        return_exceptions=True,
+    )
+
+    authors = [result for result in results if isinstance(result, Author)]
+    assert len(authors) == 10  # noqa: PLR2004
+    assert isinstance(results[-1], NotFoundError)
+
+    async with di_container.context() as ctx:
+        session = await ctx.resolve(ReadOnlyAsyncSession)
+        saved_ids = set(
+            await session.scalars(
+                select(AuthorModel.id).where(
+                    AuthorModel.id.in_([author.id for author in authors]),
+                ),
+            ),
+        )
+        write_queue = await ctx.resolve(WriteQueue)
+    assert saved_ids == {author.id for author in authors}
+
+    stats = write_queue.stats()
+    assert stats.transactions == 11  # noqa: PLR2004
+    assert stats.failed_transactions == 1
+    assert stats.batches < stats.transactions
+    assert stats.depth == 0
+
+
+class _RollbackError(Exception):
+    pass
+
+
+async def _create_author_in_rolled_back_transaction(
+    ctx: aioinject.InjectionContext,
+) -> AuthorId:
+    session = await ctx.resolve(AsyncSession)
+    write_queue = await ctx.resolve(WriteQueue)
+    command = await ctx.resolve(CreateAuthorCommand)
+    author_id = None
+    with contextlib.suppress(_RollbackError):
+        async with write_queue.begin(session):
+            author = await command.execute(
+                name="Rolled back",
+                is_real_person=True,
+                principal=PRINCIPAL_DOES_NOT_MATTER,
+                agent=AGENT_FOR_TESTS,
+            )
+            author_id = author.id
+            raise _RollbackError
+    assert author_id is not None
+    return author_id
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+async def test_nested_begin_is_rolled_back_with_outer_transaction(
+    *,
+    enabled: bool,
+) -> None:
+    config = load_config()
+    config.db.write_queue.enabled = enabled
+    container = create_base_di_container(config)
+    async with container:
+        async with container.context() as ctx:
+            author_id = await _create_author_in_rolled_back_transaction(ctx)
+
+        async with container.context() as ctx:
+            session = await ctx.resolve(ReadOnlyAsyncSession)
+            saved = await session.get(AuthorModel, author_id)
+    assert saved is None
+
+
+async def _write_in_turn(
+    write_queue: WriteQueue,
+    engine: AsyncEngine,
+    hold_sec: float = 0,
+) -> None:
+    async with AsyncSession(bind=engine) as session, write_queue.begin(session):
+        await session.execute(select(1))
+        await asyncio.sleep(hold_sec)
+
+
+async def test_cancel_after_connection_handoff_does_not_block_queue(
+    di_container: aioinject.Container,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async with di_container.context() as ctx:
+        engine = await ctx.resolve(AsyncEngine)
+    write_queue = WriteQueue(
+        engine=engine,
+        enabled=True,
+        max_size=10,
+        max_batch_size=1,
+        turn_timeout_sec=30,
+    )
+    await write_queue.start()
+
+    # Команду отменяем сразу после того, как писатель выдал ей соединение,
+    # но до того, как ее задача проснулась
+    cancelled: asyncio.Task[None] | None = None
+    put = write_queue._queue.put
+
+    async def put_and_cancel_on_handoff(turn: _Turn | None) -> None:
+        if turn is not None and cancelled is not None:
+            task = cancelled
+            turn.started.add_done_callback(lambda _: task.cancel())
+        await put(turn)
+
+    monkeypatch.setattr(write_queue._queue, "put", put_and_cancel_on_handoff)
+    cancelled = asyncio.create_task(_write_in_turn(write_queue, engine))
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    monkeypatch.undo()
+
+    await asyncio.wait_for(_write_in_turn(write_queue, engine), timeout=5)
+    await write_queue.stop()
+    assert write_queue.stats().failed_transactions == 1
+
+
+async def test_stuck_turn_times_out(di_container: aioinject.Container) -> None:
+    async with di_container.context() as ctx:
+        engine = await ctx.resolve(AsyncEngine)
+    write_queue = WriteQueue(
+        engine=engine,
+        enabled=True,
+        max_size=10,
+        max_batch_size=1,
+        turn_timeout_sec=0.1,
+    )
+    await write_queue.start()
+
+    stuck = asyncio.create_task(_write_in_turn(write_queue, engine, hold_sec=1))
+    await asyncio.wait_for(_write_in_turn(write_queue, engine), timeout=5)
+    with pytest.raises(Exception):  # noqa: B017, PT011
+        await stuck
+    await write_queue.stop()
+
+
+async def _find_author(engine: AsyncEngine, author_id: AuthorId) -> AuthorModel | None:
+    async with AsyncSession(bind=engine) as session:
+        return await session.get(AuthorModel, author_id)
+
+
+async def test_failed_command_in_group_rolls_back_only_itself(
+    di_container: aioinject.Container,
+) -> None:
+    async with di_container.context() as ctx:
+        engine = await ctx.resolve(AsyncEngine)
+    write_queue = WriteQueue(
+        engine=engine,
+        enabled=True,
+        max_size=10,
+        max_batch_size=10,
+        turn_timeout_sec=30,
+    )
+    await write_queue.start()
+    flushed, fail = asyncio.Event(), asyncio.Event()
+
+    async def write_author(author_id: AuthorId, *, failing: bool) -> None:
+        async with AsyncSession(bind=engine) as session, write_queue.begin(session):
+            session.add(AuthorModel(id=author_id, name="Grouped", is_real_person=True))
+            await session.flush()
+            if failing:
+                flushed.set()
+                await fail.wait()
+                raise _RollbackError
+
+    # Обе команды попадают в одну группу. Первая освобождает свою точку
+    # сохранения раньше, чем вторая упадет, но до коммита группы ее изменения
+    # не должны быть видны другим соединениям
+    author_id, failed_author_id = AuthorId(uuid4()), AuthorId(uuid4())
+    committed = asyncio.create_task(write_author(author_id, failing=False))
+    failed = asyncio.create_task(write_author(failed_author_id, failing=True))
+    await asyncio.wait_for(flushed.wait(), timeout=5)
+    assert await _find_author(engine, author_id) is None
+    fail.set()
+    with pytest.raises(_RollbackError):
+        await failed
+    await committed
+    await write_queue.stop()
+
+    assert await _find_author(engine, author_id) is not None
+    assert await _find_author(engine, failed_author_id) is None
+    stats = write_queue.stats()
+    assert stats.batches == 1
+    assert stats.failed_transactions == 1